@@ -0,0 +1,105 @@
+import os
+import sys
+from typing import List, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+sys.path.append(os.getcwd())
+
+from benchmark.timing import measure_gpu
+from joulegl.opengl_helper.base.shader_parser import ShaderParser
+from joulegl.opengl_helper.compute.shader import ComputeShader, ComputeShaderSetting
+from joulegl.opengl_helper.compute.shader_handler import ComputeShaderHandler
+from joulegl.opengl_helper.texture import Texture
+from joulegl.processing.image import ImageProcessor, pyramid_sizes
+from joulegl.utility.glcontext import GLContext
+
+BENCHMARK_SHADER_PATH: str = os.path.join(os.path.dirname(__file__), "shader")
+
+
+def create_texture(width: int, height: int, data: np.ndarray | None = None) -> Texture:
+    texture = Texture(width, height)
+    texture.setup(data, 0)
+    return texture
+
+
+def run(sizes: List[int] | None = None, radius: int = 4, repetitions: int = 5) -> None:
+    if sizes is None:
+        sizes = [256, 1024, 2048]
+    processor = ImageProcessor()
+    naive_handler = ComputeShaderHandler(BENCHMARK_SHADER_PATH)
+    blur_parser = ShaderParser()
+    blur_parser.set_static({"radius": radius})
+    naive_blur: ComputeShader = naive_handler.create(
+        ComputeShaderSetting("blur_naive", ["blur_naive.comp"]), blur_parser
+    )
+    naive_downsample: ComputeShader = naive_handler.create(
+        ComputeShaderSetting("downsample_naive", ["downsample_naive.comp"])
+    )
+    rng = np.random.default_rng(0)
+    for size in sizes:
+        source = create_texture(
+            size, size, rng.random(size * size * 4, dtype=np.float32)
+        )
+        intermediate = create_texture(size, size)
+        target = create_texture(size, size)
+        levels: List[Texture] = [
+            create_texture(width, height) for width, height in pyramid_sizes(size, size)
+        ]
+
+        def naive_blur_pass() -> None:
+            # one workgroup per pixel, every tap is an image load
+            naive_blur.use()
+            naive_blur.set_uniform_data([("sigma", radius / 2.0, "float")])
+            for axis, pass_source, pass_target in [
+                (0, source, intermediate),
+                (1, intermediate, target),
+            ]:
+                pass_source.bind_as_image("read", 0)
+                pass_target.bind_as_image("write", 1)
+                naive_blur.set_uniform_data([("axis", axis, "int")])
+                naive_blur.set_uniforms()
+                glDispatchCompute(size, size, 1)
+                glMemoryBarrier(GL_SHADER_IMAGE_ACCESS_BARRIER_BIT)
+
+        def naive_pyramid() -> None:
+            naive_downsample.use()
+            level_source: Texture = source
+            for level in levels:
+                level_source.bind_as_image("read", 0)
+                level.bind_as_image("write", 1)
+                glDispatchCompute(level.width, level.height, 1)
+                glMemoryBarrier(GL_SHADER_IMAGE_ACCESS_BARRIER_BIT)
+                level_source = level
+
+        results: List[Tuple[str, float, float]] = [
+            (
+                "blur",
+                measure_gpu(lambda: processor.blur(source, radius=radius), repetitions),
+                measure_gpu(naive_blur_pass, repetitions),
+            ),
+            (
+                "pyramid",
+                measure_gpu(lambda: processor.pyramid(source), repetitions),
+                measure_gpu(naive_pyramid, repetitions),
+            ),
+        ]
+
+        print(f"{size}x{size} pixels")
+        for name, tiled_time, naive_time in results:
+            print(
+                f"{name:>10}: tiled {tiled_time * 1000.0:10.3f} ms, "
+                f"naive {naive_time * 1000.0:10.3f} ms "
+                f"({naive_time / tiled_time:6.2f}x)"
+            )
+
+        for texture in [source, intermediate, target] + levels:
+            texture.delete()
+    naive_handler.delete()
+    processor.delete()
+
+
+if __name__ == "__main__":
+    with GLContext():
+        run()
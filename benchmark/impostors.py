@@ -0,0 +1,166 @@
+import os
+import sys
+from typing import Callable, List, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+sys.path.append(os.getcwd())
+
+from benchmark.timing import measure_gpu
+from joulegl.opengl_helper.base.config import ShaderConfig
+from joulegl.opengl_helper.buffer import BufferObject, BufferType
+from joulegl.opengl_helper.frame_buffer import FrameBufferObject
+from joulegl.opengl_helper.render.shader import RenderShaderSetting
+from joulegl.opengl_helper.render.shader_handler import RenderShaderHandler
+from joulegl.opengl_helper.render.utility import (
+    OglPrimitives,
+    OGLRenderFunction,
+    clear_screen,
+    generate_render_function,
+)
+from joulegl.opengl_helper.vertex_data_handler import VertexDataHandler
+from joulegl.rendering.impostor import CUBE_STRIP, create_impostor_mesh
+from joulegl.rendering.renderer import Renderer
+from joulegl.rendering.spheres import SphereRenderer
+from joulegl.utility.camera import Camera
+from joulegl.utility.glcontext import GLContext
+
+BALL_SHADER_PATH: str = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "demo",
+    "balls",
+    "shader",
+)
+
+
+class ImpostorRenderer(Renderer):
+    def __init__(self, balls: BufferObject, ball_count: int) -> None:
+        super().__init__(shader_handler=RenderShaderHandler(BALL_SHADER_PATH))
+        self.set_shader(
+            [
+                RenderShaderSetting(
+                    "geometry",
+                    [
+                        "ball_impostor.vert",
+                        "sphere.frag",
+                        "point_to_ball_impostor.geom",
+                    ],
+                ),
+                RenderShaderSetting(
+                    "instanced", ["ball_impostor_instanced.vert", "sphere.frag"]
+                ),
+            ]
+        )
+        self.mesh: BufferObject = create_impostor_mesh()
+        self.geometry_data_handler: VertexDataHandler = VertexDataHandler([(balls, 0)])
+        self.instanced_data_handler: VertexDataHandler = VertexDataHandler(
+            [(self.mesh, 0), (balls, 1)], [(0, 0), (1, 1)]
+        )
+
+        def generate_element_count_func(count: int) -> Callable:
+            def element_count_func() -> int:
+                return count
+
+            return element_count_func
+
+        self.execute_funcs["geometry"] = generate_render_function(
+            OGLRenderFunction.ARRAYS, OglPrimitives.POINTS, depth_test=True
+        )
+        self.execute_funcs["instanced"] = generate_render_function(
+            OGLRenderFunction.ARRAYS_INSTANCED,
+            OglPrimitives.TRIANGLE_STRIP,
+            depth_test=True,
+            instance_vertices=len(CUBE_STRIP),
+        )
+        for set_name in ["geometry", "instanced"]:
+            self.element_count_funcs[set_name] = generate_element_count_func(ball_count)
+        self.create_sets(self.geometry_data_handler, "geometry")
+        self.create_sets(self.instanced_data_handler, "instanced")
+
+    def render(
+        self, set_name: str, cam: Camera, config: ShaderConfig | None = None
+    ) -> None:
+        self.sets[set_name].set_uniform_data(
+            [("projection", cam.projection, "mat4"), ("view", cam.view, "mat4")]
+        )
+        self.sets[set_name].use(True)
+
+    def delete(self) -> None:
+        self.geometry_data_handler.delete()
+        self.instanced_data_handler.delete()
+        self.mesh.delete()
+
+
+def run(
+    counts: List[int] | None = None,
+    distances: List[Tuple[str, float]] | None = None,
+    size: Tuple[int, int] = (1920, 1080),
+    repetitions: int = 5,
+) -> None:
+    if counts is None:
+        counts = [2**14, 2**17, 2**20]
+    if distances is None:
+        # close up the fragment work dominates, far away the per ball vertex work
+        distances = [("near", 4.0), ("far", 60.0)]
+    frame_buffer = FrameBufferObject(*size)
+    camera = Camera(*size, base=np.array([5.0, 5.0, 5.0], dtype=np.float32))
+    camera.camera_front = np.array([0.0, 0.0, 1.0], dtype=np.float32)
+    rng = np.random.default_rng(0)
+    for count in counts:
+        balls = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+        balls.load(
+            np.concatenate(
+                [
+                    rng.uniform(0.0, 10.0, (count, 3)),
+                    np.full((count, 1), 0.05),
+                ],
+                axis=1,
+            )
+            .astype(np.float32)
+            .flatten()
+        )
+        impostor_renderer = ImpostorRenderer(balls, count)
+        sphere_renderer = SphereRenderer(balls, count)
+        # the cube paths shade with the demo shaders, sprite and quad are built in
+        paths: List[Tuple[str, Renderer, str]] = [
+            ("geometry", impostor_renderer, "geometry"),
+            ("instanced", impostor_renderer, "instanced"),
+            ("sprite", sphere_renderer, "sphere_sprite"),
+            ("quad", sphere_renderer, "sphere_quad"),
+        ]
+        print(f"{count} balls")
+        for name, distance in distances:
+            camera.camera_pos = np.array([5.0, 5.0, -distance], dtype=np.float32)
+            camera.generate_view_matrix()
+
+            def generate_draw(renderer: Renderer, set_name: str) -> Callable[[], None]:
+                def draw() -> None:
+                    clear_screen([0.0, 0.0, 0.0, 1.0])
+                    renderer.render(set_name, camera)
+
+                return draw
+
+            frame_buffer.bind()
+            glViewport(0, 0, *size)
+            times: List[float] = [
+                measure_gpu(generate_draw(renderer, set_name), repetitions)
+                for _, renderer, set_name in paths
+            ]
+            print(
+                f"{name:>10}: "
+                + ", ".join(
+                    f"{path[0]} {path_time * 1000.0:10.3f} ms "
+                    f"({times[0] / path_time:6.2f}x)"
+                    for path, path_time in zip(paths, times)
+                )
+            )
+        impostor_renderer.delete()
+        sphere_renderer.delete()
+        balls.delete()
+    frame_buffer.delete()
+
+
+if __name__ == "__main__":
+    with GLContext():
+        run()
@@ -0,0 +1,60 @@
+import os
+import sys
+from typing import List
+
+import numpy as np
+from OpenGL.GL import *
+
+sys.path.append(os.getcwd())
+
+from benchmark.timing import measure_cpu, measure_gpu
+from joulegl.processing.particles import ParticleSystem
+from joulegl.utility.glcontext import GLContext
+
+FRAME_TIME: float = 1.0 / 60.0
+
+
+def run(
+    capacities: List[int] | None = None, life: float = 0.25, repetitions: int = 10
+) -> None:
+    if capacities is None:
+        capacities = [2**20, 2**22, 10_000_000, 2**24]
+    for capacity in capacities:
+        particles = ParticleSystem(capacity, forces=["force_gravity", "force_drag"])
+        particles.set_uniform("particle_life", life, "float")
+        particles.set_uniform("life_variance", 0.5, "float")
+        # warm up to the steady state, every frame recycles the particles dying in it
+        particles.emit(capacity)
+        particles.emission_rate = capacity / life
+        for _ in range(int(life * 1.5 / FRAME_TIME)):
+            particles.step(FRAME_TIME)
+
+        positions: np.ndarray = particles.positions.read().reshape(-1, 4).copy()
+        velocities: np.ndarray = particles.velocities.read().reshape(-1, 4).copy()
+        gravity: np.ndarray = np.array([0.0, -9.81, 0.0], dtype=np.float32)
+
+        def numpy_step() -> None:
+            # host reference of the update pass, without emission and free list
+            alive: np.ndarray = positions[:, 3] > 0.0
+            velocities[alive, :3] += (gravity - 0.1 * velocities[alive, :3]) * (
+                FRAME_TIME
+            )
+            positions[alive, :3] += velocities[alive, :3] * FRAME_TIME
+            positions[alive, 3] -= FRAME_TIME
+
+        gpu_time: float = measure_gpu(lambda: particles.step(FRAME_TIME), repetitions)
+        cpu_time: float = measure_cpu(numpy_step, max(1, repetitions // 5))
+        alive_count: int = particles.alive_count()
+
+        print(f"{capacity} particles, {alive_count} alive")
+        print(
+            f"{'step':>10}: gpu {gpu_time * 1000.0:10.3f} ms "
+            f"({capacity / gpu_time / 1e6:8.1f} M particles/s), "
+            f"numpy {cpu_time * 1000.0:10.3f} ms ({cpu_time / gpu_time:6.2f}x)"
+        )
+        particles.delete()
+
+
+if __name__ == "__main__":
+    with GLContext():
+        run()
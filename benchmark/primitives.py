@@ -0,0 +1,99 @@
+import os
+import sys
+from typing import List, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+sys.path.append(os.getcwd())
+
+from benchmark.timing import measure_cpu, measure_gpu
+from joulegl.opengl_helper.buffer import BufferObject, BufferType
+from joulegl.processing.primitives import ComputePrimitives
+from joulegl.utility.glcontext import GLContext
+
+
+def create_buffer(data: np.ndarray) -> BufferObject:
+    buffer = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(data)
+    return buffer
+
+
+def run(counts: List[int] | None = None, repetitions: int = 5) -> None:
+    if counts is None:
+        counts = [2**16, 2**20, 2**22]
+    primitives = ComputePrimitives()
+    rng = np.random.default_rng(0)
+    for count in counts:
+        values: np.ndarray = rng.integers(0, 16, count, dtype=np.uint32)
+        points: np.ndarray = rng.random((count, 4), dtype=np.float32)
+        keys: np.ndarray = rng.integers(0, 2**32, count, dtype=np.uint64).astype(
+            np.uint32
+        )
+        indices: np.ndarray = np.arange(count, dtype=np.uint32)
+
+        value_buffer = create_buffer(values)
+        scan_buffer = create_buffer(np.zeros(count, dtype=np.uint32))
+        point_buffer = create_buffer(points.flatten())
+        compact_buffer = create_buffer(np.zeros(count * 4, dtype=np.float32))
+        key_buffer = create_buffer(keys)
+        index_buffer = create_buffer(indices)
+
+        def gpu_sort() -> None:
+            # sorting in place, so every repetition starts from the unsorted keys
+            key_buffer.write(keys)
+            index_buffer.write(indices)
+            primitives.sort(key_buffer, index_buffer, count)
+
+        results: List[Tuple[str, float, float]] = [
+            (
+                "scan",
+                measure_gpu(
+                    lambda: primitives.scan(value_buffer, scan_buffer, count),
+                    repetitions,
+                ),
+                measure_cpu(lambda: np.cumsum(values), repetitions),
+            ),
+            (
+                "compact",
+                measure_gpu(
+                    lambda: primitives.compact(
+                        point_buffer, compact_buffer, count, "value.w > 0.5"
+                    ),
+                    repetitions,
+                ),
+                measure_cpu(lambda: points[points[:, 3] > 0.5], repetitions),
+            ),
+            (
+                "sort",
+                measure_gpu(gpu_sort, repetitions),
+                measure_cpu(
+                    lambda: np.argsort(keys, kind="stable"),
+                    repetitions,
+                ),
+            ),
+        ]
+
+        print(f"{count} elements")
+        for name, gpu_time, cpu_time in results:
+            print(
+                f"{name:>10}: gpu {gpu_time * 1000.0:10.3f} ms, "
+                f"numpy {cpu_time * 1000.0:10.3f} ms "
+                f"({cpu_time / gpu_time:6.2f}x)"
+            )
+
+        for buffer in [
+            value_buffer,
+            scan_buffer,
+            point_buffer,
+            compact_buffer,
+            key_buffer,
+            index_buffer,
+        ]:
+            buffer.delete()
+    primitives.delete()
+
+
+if __name__ == "__main__":
+    with GLContext():
+        run()
@@ -0,0 +1,115 @@
+import os
+import sys
+import tempfile
+from typing import Dict, List
+
+sys.path.append(os.getcwd())
+
+from benchmark.timing import measure_cpu
+from joulegl.opengl_helper.base.shader_parser import ShaderParser, clear_shader_cache
+
+
+def generate_shader(path: str, functions: int, group_size: int) -> None:
+    lines: List[str] = ["#version 430\n"]
+    lines.append(
+        "//$$const vec3 $$palette_name$$ = vec3($$palette_r$$, $$palette_g$$, $$palette_b$$);\n"
+    )
+    for i in range(functions):
+        lines.extend(
+            [
+                f"float function_{i}(float value)\n",
+                "{\n",
+                f"    //$float scale = $scale_{i % 32}$;\n",
+                "    float result = value * scale + $offset$;\n",
+                "    //$$result += $$palette_r$$ * $$palette_id$$;\n",
+                "    return result;\n",
+                "}\n",
+            ]
+        )
+    lines.append("void main() {}\n")
+    with open(path, "w") as shader_file:
+        shader_file.writelines(lines)
+
+
+def naive_parse(parser: ShaderParser, path: str) -> str:
+    # reference of the former line by line parser: one replace per variable per line
+    processed_src: str = ""
+    with open(path, "r") as src:
+        for line in src:
+            processed_line: str = line
+            for static, value in parser.static_var_map.items():
+                processed_line = processed_line.replace(static, value)
+            if "$$" in processed_line:
+                current_group: str | None = None
+                for dynamic, (group, _) in parser.dynamic_var_map.items():
+                    if dynamic in processed_line:
+                        current_group = group
+                if current_group is not None:
+                    new_lines: str = ""
+                    for i in range(parser.dynamic_id_var_map[current_group]):
+                        current_line: str = processed_line
+                        for dynamic, (group, values) in parser.dynamic_var_map.items():
+                            if current_group == group:
+                                current_line = current_line.replace(dynamic, values[i])
+                        new_lines = new_lines + current_line
+                    processed_line = new_lines
+            processed_src = processed_src + processed_line.replace("//$$", "").replace(
+                "$$", ""
+            ).replace("//$", "")
+    return processed_src
+
+
+def create_parser(group_size: int) -> ShaderParser:
+    parser = ShaderParser()
+    static_vars: Dict[str, float] = {f"scale_{i}": 1.0 + i for i in range(32)}
+    static_vars["offset"] = 0.5
+    parser.set_static(static_vars)
+    parser.set_dynamic(
+        {
+            "palette": {
+                "id": [str(i) for i in range(group_size)],
+                "name": [f"color_{i}" for i in range(group_size)],
+                "r": [str(i / group_size) for i in range(group_size)],
+                "g": ["0.5"] * group_size,
+                "b": ["0.25"] * group_size,
+            }
+        }
+    )
+    return parser
+
+
+def run(functions: int = 5000, group_size: int = 16, repetitions: int = 5) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "generated.comp")
+        generate_shader(path, functions, group_size)
+        lines: int = 7 * functions + 3
+
+        parser: ShaderParser = create_parser(group_size)
+        assert naive_parse(parser, path) == parser.parse(path)
+
+        def cold_parse() -> str:
+            clear_shader_cache()
+            return create_parser(group_size).parse(path)
+
+        def memoized_parse() -> str:
+            return create_parser(group_size).parse(path)
+
+        naive_time: float = measure_cpu(lambda: naive_parse(parser, path), repetitions)
+        cold_time: float = measure_cpu(cold_parse, repetitions)
+        memoized_time: float = measure_cpu(memoized_parse, repetitions)
+
+        print(f"shader with {lines} lines, dynamic group size {group_size}")
+        for name, elapsed in [
+            ("naive", naive_time),
+            ("compiled", cold_time),
+            ("memoized", memoized_time),
+        ]:
+            print(
+                f"{name:>10}: {elapsed * 1000.0:10.3f} ms "
+                f"({lines / elapsed / 1e6:8.2f} M lines/s, "
+                f"{naive_time / elapsed:8.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    run()
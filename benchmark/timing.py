@@ -0,0 +1,22 @@
+import time
+from typing import Any, Callable
+
+from OpenGL.GL import *
+
+
+def measure_gpu(func: Callable[[], Any], repetitions: int) -> float:
+    # one warm up call, the gpu is drained before and after the timed calls
+    func()
+    glFinish()
+    start_time: float = time.perf_counter()
+    for _ in range(repetitions):
+        func()
+    glFinish()
+    return (time.perf_counter() - start_time) / repetitions
+
+
+def measure_cpu(func: Callable[[], Any], repetitions: int) -> float:
+    start_time: float = time.perf_counter()
+    for _ in range(repetitions):
+        func()
+    return (time.perf_counter() - start_time) / repetitions
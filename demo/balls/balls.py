@@ -1,9 +1,10 @@
 import os
 import sys
-from typing import Callable, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 import glfw
 import numpy as np
+from OpenGL.GL import *
 
 sys.path.append(os.getcwd())
 
@@ -11,8 +12,14 @@ sys.path.append(os.getcwd())
 from joulegl.opengl_helper.base.config import ShaderConfig
 from joulegl.opengl_helper.base.data_set import BaseShaderSet
 from joulegl.opengl_helper.base.shader_parser import ShaderParser
-from joulegl.opengl_helper.buffer import BufferType, SwappingBufferObject
+from joulegl.opengl_helper.buffer import (
+    AppendBuffer,
+    BufferObject,
+    BufferType,
+    SwappingBufferObject,
+)
 from joulegl.opengl_helper.compute.shader import ComputeShader, ComputeShaderSetting
+from joulegl.opengl_helper.compute.utility import generate_compute_function
 from joulegl.opengl_helper.render.shader import RenderShaderSetting
 from joulegl.opengl_helper.render.utility import (
     OglBlendingEquations,
@@ -21,48 +28,58 @@ from joulegl.opengl_helper.render.utility import (
     OGLRenderFunction,
     generate_render_function,
 )
+from joulegl.opengl_helper.transform_feedback.shader import (
+    TransformFeedbackShaderSetting,
+)
+from joulegl.opengl_helper.transform_feedback.utility import (
+    generate_feedback_function,
+)
 from joulegl.opengl_helper.vertex_data_handler import VertexDataHandler
-from joulegl.processing.processor import ComputeProcessor
+from joulegl.processing.generators import ComputeGenerators
+from joulegl.processing.primitives import ComputePrimitives
+from joulegl.processing.processor import (
+    ComputePass,
+    ComputeProcessor,
+    TransformFeedbackProcessor,
+)
+from joulegl.rendering.culling import FrustumCuller
+from joulegl.rendering.impostor import CUBE_STRIP, create_impostor_mesh
 from joulegl.rendering.renderer import Renderer
 from joulegl.utility.app import App
 from joulegl.utility.camera import Camera, CameraPose
 from joulegl.utility.performance import track_time
 
 
-class BallData:
-    def __init__(self, pos: np.ndarray, size: float) -> None:
-        self.pos: np.ndarray = pos
-        self.size = size
-        self.data = [self.pos[0], self.pos[1], self.pos[2], self.size]
-
-
 class BallDataHandler:
     def __init__(self) -> None:
-        self.ball_data: List[BallData] = []
+        self.ball_count: int = 0
         self.balls_changed: bool = False
-        self.data: List[float] = []
+        self.initial_buffer: BufferObject | None = None
         self.buffer: SwappingBufferObject = SwappingBufferObject(
             buffer_type=BufferType.SHADER_STORAGE_BUFFER
         )
 
     def get_buffer_points(self) -> int:
-        return len(self.ball_data)
+        return self.ball_count
 
     def parse_to_buffer(self) -> None:
-        self.data = [float(value) for ball in self.ball_data for value in ball.data]
-        self.buffer.load(np.array(self.data, dtype=np.float32))
+        self.buffer.copy_from(self.initial_buffer, self.ball_count * 4 * 4)
 
-    def apply(self, balls: List[BallData]) -> None:
+    def apply(self, balls: BufferObject, ball_count: int) -> None:
         self.balls_changed = True
-        self.ball_data = balls
+        self.initial_buffer = balls
+        self.ball_count = ball_count
         self.parse_to_buffer()
 
     def swap(self) -> None:
         self.buffer.swap()
 
 
+LOD_SETS: List[str] = ["sphere", "sprite", "point"]
+
+
 class BallRenderer(Renderer):
-    def __init__(self, bdh: BallDataHandler) -> None:
+    def __init__(self, bdh: BallDataHandler, culling: bool = True) -> None:
         shader_parser: ShaderParser = ShaderParser()
         super().__init__(shader_parser=shader_parser)
 
@@ -80,6 +97,13 @@ class BallRenderer(Renderer):
                     ],
                     ["screen_width", "screen_height"],
                 ),
+                RenderShaderSetting(
+                    "sphere_instanced",
+                    ["ball_impostor_instanced.vert", "sphere.frag"],
+                    ["screen_width", "screen_height"],
+                ),
+                RenderShaderSetting("sprite", ["ball_sprite.vert", "ball_sprite.frag"]),
+                RenderShaderSetting("point", ["ball_point.vert", "ball_point.frag"]),
                 RenderShaderSetting(
                     "triangle",
                     [
@@ -92,7 +116,30 @@ class BallRenderer(Renderer):
         )
         self.set_shader(shader_settings)
 
+        # triangles join consecutive balls, so they are drawn from the unculled buffer
         self.data_handler: VertexDataHandler = VertexDataHandler([(self.bdh.buffer, 0)])
+        # balls covering at least 4 pixels get the impostor, down to 0.75 a sprite,
+        # impostors are instances of a single point or of the shared cube strip,
+        # gl 3.x devices can't cull and draw every ball as impostor instead
+        self.culling: bool = culling
+        self.instanced: bool = False
+        self.lod: FrustumCuller | None = None
+        self.mesh: BufferObject | None = None
+        self.lod_data_handler: VertexDataHandler | None = None
+        self.impostor_data_handler: VertexDataHandler | None = None
+        self.instanced_data_handler: VertexDataHandler | None = None
+        if self.culling:
+            self.lod = FrustumCuller(
+                "cull_radius * element.w", [1, 0, 0], tier_sizes=[4.0, 0.75]
+            )
+            self.lod_data_handler = VertexDataHandler([(self.lod.visible_elements, 0)])
+            self.impostor_data_handler = VertexDataHandler(
+                [(self.lod.visible_elements, 0)], [(0, 1)]
+            )
+            self.mesh = create_impostor_mesh()
+            self.instanced_data_handler = VertexDataHandler(
+                [(self.mesh, 0), (self.lod.visible_elements, 1)], [(0, 0), (1, 1)]
+            )
 
         def generate_element_count_func(bdh: BallDataHandler) -> Callable:
             def element_count_func() -> int:
@@ -100,9 +147,41 @@ class BallRenderer(Renderer):
 
             return element_count_func
 
-        self.execute_funcs["sphere"] = generate_render_function(
-            OGLRenderFunction.ARRAYS, OglPrimitives.POINTS, depth_test=True
-        )
+        if self.culling:
+            self.execute_funcs["sphere"] = generate_render_function(
+                OGLRenderFunction.ARRAYS_INDIRECT,
+                OglPrimitives.POINTS,
+                depth_test=True,
+                indirect_buffer=self.lod.command,
+                command_index=0,
+            )
+            self.execute_funcs["sphere_instanced"] = generate_render_function(
+                OGLRenderFunction.ARRAYS_INDIRECT,
+                OglPrimitives.TRIANGLE_STRIP,
+                depth_test=True,
+                indirect_buffer=self.lod.command,
+                command_index=0,
+            )
+            self.execute_funcs["sprite"] = generate_render_function(
+                OGLRenderFunction.ARRAYS_INDIRECT,
+                OglPrimitives.POINTS,
+                depth_test=True,
+                indirect_buffer=self.lod.command,
+                command_index=1,
+                program_point_size=True,
+            )
+            self.execute_funcs["point"] = generate_render_function(
+                OGLRenderFunction.ARRAYS_INDIRECT,
+                OglPrimitives.POINTS,
+                point_size=1.0,
+                depth_test=True,
+                indirect_buffer=self.lod.command,
+                command_index=2,
+            )
+        else:
+            self.execute_funcs["sphere"] = generate_render_function(
+                OGLRenderFunction.ARRAYS, OglPrimitives.POINTS, depth_test=True
+            )
         self.execute_funcs["triangle"] = generate_render_function(
             OGLRenderFunction.ARRAYS,
             OglPrimitives.TRIANGLES,
@@ -114,24 +193,74 @@ class BallRenderer(Renderer):
                 OglBlendingEquations.FUNC_ADD,
             ],
         )
-        self.element_count_funcs["sphere"] = generate_element_count_func(self.bdh)
-        self.element_count_funcs["triangle"] = generate_element_count_func(self.bdh)
-
-        self.create_sets(self.data_handler, "sphere")
+        for set_name in LOD_SETS + ["sphere_instanced", "triangle"]:
+            self.element_count_funcs[set_name] = generate_element_count_func(self.bdh)
+
+        if self.culling:
+            self.create_sets(self.impostor_data_handler, "sphere")
+            self.create_sets(self.instanced_data_handler, "sphere_instanced")
+            for set_name in LOD_SETS[1:]:
+                self.create_sets(self.lod_data_handler, set_name)
+        else:
+            self.create_sets(self.data_handler, "sphere")
         self.create_sets(self.data_handler, "triangle")
 
     def render(
         self, set_name: str, cam: Camera, config: ShaderConfig | None = None
     ) -> None:
-        current_set: BaseShaderSet = self.sets[set_name]
-        current_set.set_uniform_data(
-            [("projection", cam.projection, "mat4"), ("view", cam.view, "mat4")]
-        )
-        current_set.set_uniform_labeled_data(config)
-        current_set.use(True)
+        # "lod" classifies every ball into the impostor, sprite or point tier
+        # the instanced path replaces the impostor geometry shader with the cube strip
+        if set_name == "lod" and not self.culling:
+            set_names: List[str] = ["sphere"]
+        elif set_name == "lod":
+            self.lod.set_instance_vertices(len(CUBE_STRIP) if self.instanced else 1)
+            self.lod.cull(self.bdh.buffer, self.bdh.get_buffer_points(), cam)
+            set_names = (
+                ["sphere_instanced"] + LOD_SETS[1:] if self.instanced else LOD_SETS
+            )
+        else:
+            set_names = [set_name]
+        for name in set_names:
+            current_set: BaseShaderSet = self.sets[name]
+            current_set.set_uniform_data(
+                [
+                    ("projection", cam.projection, "mat4"),
+                    ("view", cam.view, "mat4"),
+                    ("screen_height", cam.screen_height, "float"),
+                ]
+            )
+            current_set.set_uniform_labeled_data(config)
+            current_set.use(True)
 
     def delete(self) -> None:
         self.data_handler.delete()
+        if self.culling:
+            self.lod_data_handler.delete()
+            self.impostor_data_handler.delete()
+            self.instanced_data_handler.delete()
+            self.mesh.delete()
+            self.lod.delete()
+
+
+def rand(co_x: np.ndarray, co_y: np.ndarray) -> np.ndarray:
+    value: np.ndarray = (
+        np.sin(np.mod(co_x * 12.9898 + co_y * 78.233, 3.14)) * 43758.5453
+    )
+    return value - np.floor(value)
+
+
+def ball_noise_kernel(
+    inputs: List[np.ndarray], outputs: List[np.ndarray], uniforms: Dict[str, Any]
+) -> None:
+    # numpy version of ball_noise.comp for hosts without compute or as reference
+    node: np.ndarray = inputs[0]
+    noise_strength: float = uniforms.get("noise_strength", 0.1)
+    for axis, (first, second) in enumerate([(0, 1), (1, 2), (2, 0)]):
+        outputs[0][:, axis] = (
+            node[:, axis]
+            + (rand(node[:, first], node[:, second]) - 0.5) * 2.0 * noise_strength
+        )
+    outputs[0][:, 3] = node[:, 3]
 
 
 class BallProcessor(ComputeProcessor):
@@ -141,6 +270,21 @@ class BallProcessor(ComputeProcessor):
 
         self.bdh = bdh
 
+        def generate_autotune_setup(bdh: BallDataHandler) -> Callable:
+            def autotune_setup(_: ComputeShader) -> None:
+                bdh.buffer.bind(0)
+
+            return autotune_setup
+
+        # tuned once per device, later runs read the local size from the cache
+        self.shader_handler.get_autotuner().tune(
+            os.path.join(self.shader_handler.shader_dir, "ball_noise.comp"),
+            generate_autotune_setup(self.bdh),
+            self.bdh.get_buffer_points(),
+            shader_parser,
+        )
+        self.bdh.parse_to_buffer()
+
         shader_settings: List[ComputeShaderSetting] = []
         shader_settings.extend([ComputeShaderSetting("noise", ["ball_noise.comp"], [])])
         self.set_shader(shader_settings)
@@ -153,16 +297,25 @@ class BallProcessor(ComputeProcessor):
 
             return element_count_func
 
-        def generate_compute_func(compute_shader: ComputeShader) -> Callable:
-            def compute_func(element_count: int, _=None) -> None:
-                compute_shader.compute(element_count, barrier=True)
-
-            return compute_func
-
-        self.execute_funcs["noise"] = generate_compute_func(self.shaders["noise"])
+        self.execute_funcs["noise"] = generate_compute_function(
+            self.shaders["noise"], barrier=False
+        )
         self.element_count_funcs["noise"] = generate_element_count_func(self.bdh)
 
         self.create_sets(self.data_handler, "noise")
+        self.create_cpu_set(
+            "noise_cpu",
+            ball_noise_kernel,
+            [self.bdh.buffer],
+            [self.bdh.buffer],
+            "noise",
+        )
+
+        self.add_buffer("balls", self.bdh.buffer)
+        self.add_pass(ComputePass("noise", ["balls"], ["balls"], ["balls"]))
+
+    def use_cpu(self, enabled: bool) -> None:
+        self.passes[0].set_name = "noise_cpu" if enabled else "noise"
 
     def process(self, set_name: str, config: ShaderConfig | None = None) -> None:
         current_set: BaseShaderSet = self.sets[set_name]
@@ -171,64 +324,153 @@ class BallProcessor(ComputeProcessor):
         current_set.set_uniform_labeled_data(config)
         current_set.use()
 
+    def delete(self) -> None:
+        self.data_handler.delete()
+        self.delete_pipeline()
+
+
+class BallFeedbackProcessor(TransformFeedbackProcessor):
+    def __init__(self, bdh: BallDataHandler) -> None:
+        shader_parser: ShaderParser = ShaderParser()
+        super().__init__(shader_parser=shader_parser)
+
+        self.bdh = bdh
+
+        shader_settings: List[TransformFeedbackShaderSetting] = []
+        shader_settings.extend(
+            [
+                TransformFeedbackShaderSetting(
+                    "noise", ["ball_noise.vert"], ["noised_position"], []
+                )
+            ]
+        )
+        self.set_shader(shader_settings)
+
+        self.data_handler: VertexDataHandler = VertexDataHandler([(self.bdh.buffer, 0)])
+
+        def generate_element_count_func(bdh: BallDataHandler) -> Callable:
+            def element_count_func() -> int:
+                return bdh.get_buffer_points()
+
+            return element_count_func
+
+        self.execute_funcs["noise"] = generate_feedback_function(
+            OglPrimitives.POINTS, [self.bdh.buffer], self.add_query("noise")
+        )
+        self.element_count_funcs["noise"] = generate_element_count_func(self.bdh)
+
+        self.create_sets(self.data_handler, "noise")
+
+    def process(self, set_name: str, config: ShaderConfig | None = None) -> None:
+        current_set: BaseShaderSet = self.sets[set_name]
+        current_set.set_uniform_labeled_data(config)
+        current_set.use(True)
         self.bdh.swap()
 
     def delete(self) -> None:
         self.data_handler.delete()
+        self.delete_queries()
+
+
+def compute_supported() -> bool:
+    return (glGetIntegerv(GL_MAJOR_VERSION), glGetIntegerv(GL_MINOR_VERSION)) >= (4, 3)
+
 
+def generate_balls_in_a_sphere(
+    area: Tuple[int, int, int], ball_size: float, compute: bool = True
+) -> Tuple[BufferObject, int]:
+    size: Tuple[int, int, int] = (area[0] * 10, area[1] * 10, area[2] * 10)
+    center: Tuple[float, float, float] = (area[0] * 0.5, area[1] * 0.5, area[2] * 0.5)
+    if compute:
+        generators: ComputeGenerators = ComputeGenerators()
+        balls: AppendBuffer = AppendBuffer(size[0] * size[1] * size[2])
+        ball_count: int = generators.sphere_lattice(
+            balls, size, center, area[0] * 0.5, ball_size, 0.1
+        )
+        generators.delete()
+        return balls, ball_count
 
-def generate_random_balls_in_a_sphere(
-    area: Tuple[int, int, int], ball_size: float
-) -> List[BallData]:
-    balls: List[BallData] = []
-    for x in range(area[0] * 10):
-        x = x / 10.0
-        sqr_off_x = abs(x - area[0] * 0.5) * abs(x - area[0] * 0.5)
-        for y in range(area[1] * 10):
-            y = y / 10.0
-            sqr_off_y = abs(y - area[1] * 0.5) * abs(y - area[1] * 0.5)
-            for z in range(area[2] * 10):
-                z = z / 10.0
-                if (
-                    sqr_off_x
-                    + sqr_off_y
-                    + abs(z - area[2] * 0.5) * abs(z - area[2] * 0.5)
-                    <= area[0] * area[0] * 0.25
-                ):
-                    balls.append(
-                        BallData(
-                            np.array([x, y, z], dtype=np.float32),
-                            ball_size,
-                        )
-                    )
-    return balls
+    # gl 3.x devices build the same lattice on the host
+    positions: np.ndarray = (
+        np.stack(
+            np.meshgrid(*[np.arange(axis) for axis in size], indexing="ij"), axis=-1
+        )
+        .reshape(-1, 3)
+        .astype(np.float32)
+        * 0.1
+    )
+    positions = positions[
+        np.sum((positions - np.array(center, dtype=np.float32)) ** 2, axis=1)
+        <= area[0] * area[0] * 0.25
+    ]
+    host_balls: BufferObject = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+    host_balls.load(
+        np.concatenate(
+            [positions, np.full((len(positions), 1), ball_size, dtype=np.float32)],
+            axis=1,
+        ).flatten()
+    )
+    return host_balls, len(positions)
 
 
 class BallApp(App):
     def __init__(self) -> None:
         super().__init__("Ball Demo")
 
+        # gl 3.x devices build the balls on the host, skip culling and run the noise
+        # as a vertex-only transform feedback pass
+        self.compute: bool = compute_supported()
         self.bdh: BallDataHandler = BallDataHandler()
-        self.bdh.apply(generate_random_balls_in_a_sphere((10, 10, 10), 0.1))
-        self.br: BallRenderer = BallRenderer(self.bdh)
-        self.bp: BallProcessor = BallProcessor(self.bdh)
+        self.bdh.apply(*generate_balls_in_a_sphere((10, 10, 10), 0.1, self.compute))
+        self.br: BallRenderer = BallRenderer(self.bdh, self.compute)
+        self.bfp: BallFeedbackProcessor = BallFeedbackProcessor(self.bdh)
+        self.bp: BallProcessor | None = (
+            BallProcessor(self.bdh) if self.compute else None
+        )
+        self.use_feedback: bool = self.bp is None
+        self.use_cpu: bool = False
         self.br_config: ShaderConfig = ShaderConfig()
-        self.set_cam(np.array([5.0, 5.0, 5.0], dtype=np.float32), 60.0, CameraPose.LEFT)
+        self.frame_bounds(*self.ball_bounds(), CameraPose.LEFT, 1.5)
         self.active_renderer = "triangle"
 
+    def ball_bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self.compute:
+            primitives: ComputePrimitives = ComputePrimitives()
+            bounds: Tuple[np.ndarray, np.ndarray] = primitives.reduce(
+                self.bdh.buffer, self.bdh.get_buffer_points()
+            ).bounds
+            primitives.delete()
+            return bounds
+
+        # gl 3.x devices read the balls back to bound them on the host
+        positions: np.ndarray = self.bdh.buffer.read().reshape(-1, 4)[
+            : self.bdh.get_buffer_points(), :3
+        ]
+        return positions.min(axis=0), positions.max(axis=0)
+
     @track_time(app_name="ball_demo")
     def render(self) -> None:
-        self.bp.process("noise")
+        if self.use_feedback:
+            self.bfp.process("noise")
+        else:
+            self.bp.run_pipeline()
         self.br.render(self.active_renderer, self.window.cam, self.br_config)
         if self.frame_count % (self.fps * 60) == 0:
             self.bdh.parse_to_buffer()
 
     def key_input(self, key, scancode, action, mods) -> bool | None:
         if key == glfw.KEY_SPACE and action == glfw.RELEASE:
-            if self.active_renderer == "sphere":
+            if self.active_renderer == "lod":
                 self.active_renderer = "triangle"
             else:
-                self.active_renderer = "sphere"
+                self.active_renderer = "lod"
+        if key == glfw.KEY_G and action == glfw.RELEASE:
+            self.br.instanced = not self.br.instanced
+        if key == glfw.KEY_F and action == glfw.RELEASE and self.bp is not None:
+            self.use_feedback = not self.use_feedback
+        if key == glfw.KEY_N and action == glfw.RELEASE and self.bp is not None:
+            self.use_cpu = not self.use_cpu
+            self.bp.use_cpu(self.use_cpu)
         if key == glfw.KEY_C and action == glfw.RELEASE:
             self.bdh.parse_to_buffer()
         if key == glfw.KEY_ESCAPE and action == glfw.PRESS:
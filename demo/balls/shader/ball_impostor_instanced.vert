@@ -0,0 +1,24 @@
+#version 440
+
+layout(location = 0) in vec4 corner;
+layout(location = 1) in vec4 position;
+
+flat out vec3 gs_sphere_position;
+flat out float gs_sphere_radius;
+flat out vec4 gs_color;
+out vec3 gs_cube_hit_position;
+
+uniform mat4 projection;
+uniform mat4 view;
+uniform float object_radius = 1.0;
+
+void main()
+{
+    // the shared cube is placed per instance, replacing point_to_ball_impostor.geom
+    gs_sphere_position = (view * vec4(position.xyz, 1.0)).xyz;
+    gs_sphere_radius = object_radius * position.w;
+    gs_color = vec4(0.0, 0.0, 0.0, 1.0);
+
+    gs_cube_hit_position = gs_sphere_position + gs_sphere_radius * corner.xyz;
+    gl_Position = projection * vec4(gs_cube_hit_position, 1.0);
+}
@@ -0,0 +1,18 @@
+#version 330
+
+layout(location = 0) in vec4 position;
+
+out vec4 noised_position;
+
+uniform float noise_strength = 0.1;
+
+#include "random.glsl"
+
+void main() {
+    vec4 node = position;
+    highp float noise_x = (rand(node.xy) - 0.5) * 2.0 * noise_strength;
+    highp float noise_y = (rand(node.yz) - 0.5) * 2.0 * noise_strength;
+    highp float noise_z = (rand(node.zx) - 0.5) * 2.0 * noise_strength;
+
+    noised_position = vec4(node.x + noise_x, node.y + noise_y, node.z + noise_z, node.w);
+}
@@ -0,0 +1,10 @@
+#version 440
+
+out vec4 frag_color;
+
+#include "lighting.glsl"
+
+void main()
+{
+    frag_color = vec4(atom_color_ambient, 1.0);
+}
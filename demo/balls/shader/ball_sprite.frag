@@ -0,0 +1,18 @@
+#version 440
+
+out vec4 frag_color;
+
+#include "lighting.glsl"
+
+void main()
+{
+    // camera facing disc shaded like the impostor spheres
+    vec2 coord = gl_PointCoord * 2.0 - 1.0;
+    float radius_squared = dot(coord, coord);
+    if (radius_squared > 1.0) discard;
+    vec3 normal = vec3(coord.x, -coord.y, sqrt(1.0 - radius_squared));
+    vec3 ray_direction = vec3(0.0, 0.0, -1.0);
+
+    frag_color = vec4(atom_color_ambient +
+    clamp(atom_color_specular * pow(max(dot(reflect(light_direction_cam, normal), ray_direction), 0.0), 4.0), 0.0, 1.0), 1.0);
+}
@@ -0,0 +1,16 @@
+#version 440
+
+layout(location = 0) in vec4 position;
+
+uniform mat4 view;
+uniform mat4 projection;
+uniform float screen_height;
+uniform float object_radius = 1.0;
+
+void main()
+{
+    vec4 view_position = view * vec4(position.xyz, 1.0);
+    gl_Position = projection * view_position;
+    float radius = object_radius * position.w;
+    gl_PointSize = max(1.0, radius * projection[1][1] * screen_height / max(-view_position.z, 0.0001));
+}
@@ -3,14 +3,19 @@ import sys
 from enum import IntEnum
 from typing import Callable, Dict, List, Tuple
 
+import glfw
 import numpy as np
 
 sys.path.append(os.getcwd())
 
-from joulegl.opengl_helper.base.config import ShaderConfig
+from joulegl.opengl_helper.base.config import ShaderConfig, ShaderTableConfig
 from joulegl.opengl_helper.base.data_set import BaseShaderSet
 from joulegl.opengl_helper.base.shader_parser import ShaderParser
-from joulegl.opengl_helper.buffer import BufferObject
+from joulegl.opengl_helper.buffer import (
+    AppendBuffer,
+    BufferObject,
+    TableBufferObject,
+)
 from joulegl.opengl_helper.render.shader import RenderShaderSetting
 from joulegl.opengl_helper.render.utility import (
     OglPrimitives,
@@ -18,6 +23,10 @@ from joulegl.opengl_helper.render.utility import (
     generate_render_function,
 )
 from joulegl.opengl_helper.vertex_data_handler import VertexDataHandler
+from joulegl.processing.generators import ComputeGenerators
+from joulegl.processing.primitives import ComputePrimitives
+from joulegl.rendering.culling import FrustumCuller
+from joulegl.rendering.impostor import CUBE_STRIP, create_impostor_mesh
 from joulegl.rendering.renderer import Renderer
 from joulegl.utility.app import App
 from joulegl.utility.camera import Camera, CameraPose
@@ -32,62 +41,50 @@ class BlockTypes(IntEnum):
     GRASS = 4
 
 
-class BlockData:
-    def __init__(self, pos: np.ndarray, block_type: BlockTypes) -> None:
-        self.pos: np.ndarray = pos
-        self.block_type = block_type
-        self.data = [self.pos[0], self.pos[1], self.pos[2], self.block_type.value]
-
-
 class BlockDataHandler:
     def __init__(self) -> None:
-        self.block_data: List[BlockData] = []
+        self.block_count: int = 0
         self.block_palette_map: Dict[int, BlockTypes] = dict()
         self.blocks_changed: bool = False
         self.size: Tuple[int, int, int] = (0, 0, 0)
-        self.data: List[float] = []
-        self.buffer: bool = True
         self.buffer: BufferObject = BufferObject()
 
     def get_buffer_points(self) -> int:
-        return len(self.block_data)
+        return self.block_count
 
-    def parse_to_buffer(self) -> None:
-        self.data = [float(value) for block in self.block_data for value in block.data]
-        self.buffer = BufferObject()
-        self.buffer.load(np.array(self.data, dtype=np.float32))
-
-    def apply(self, size: Tuple[int, int, int], field: List[BlockData]) -> None:
+    def apply(
+        self, size: Tuple[int, int, int], blocks: BufferObject, block_count: int
+    ) -> None:
         self.blocks_changed = True
         self.size = (size[0], size[1], size[2])
-        self.block_data = field
-        self.parse_to_buffer()
+        self.buffer.delete()
+        self.buffer = blocks
+        self.block_count = block_count
+
+
+class BlockPalette(ShaderTableConfig):
+    def __init__(self) -> None:
+        super().__init__("palette", "block")
+        self.set_columns([("color", "vec3")])
+        self.set_rows(
+            [
+                ("default", BlockTypes.AIR.value, {"color": [1.0, 1.0, 1.0]}),
+                ("dirt", BlockTypes.DIRT.value, {"color": [0.457, 0.324, 0.22]}),
+                ("sand", BlockTypes.SAND.value, {"color": [0.895, 0.867, 0.656]}),
+                ("stone", BlockTypes.STONE.value, {"color": [0.6, 0.6, 0.6]}),
+                ("grass", BlockTypes.GRASS.value, {"color": [0.44, 0.633, 0.277]}),
+            ]
+        )
 
 
 class BlockRenderer(Renderer):
-    def __init__(self, bdh: BlockDataHandler) -> None:
+    def __init__(self, bdh: BlockDataHandler, palette: ShaderTableConfig) -> None:
         shader_parser: ShaderParser = ShaderParser()
-        shader_parser.set_static({"block_type_count": 5})
-        shader_parser.set_dynamic(
-            {
-                "block_type": {
-                    "id": ["0", "1", "2", "3", "4"],
-                    "name": [
-                        "block_default",
-                        "block_dirt",
-                        "block_sand",
-                        "block_stone",
-                        "block_grass",
-                    ],
-                    "r": ["1.0", "0.457", "0.895", "0.6", "0.44"],
-                    "g": ["1.0", "0.324", "0.867", "0.6", "0.633"],
-                    "b": ["1.0", "0.22", "0.656", "0.6", "0.277"],
-                }
-            }
-        )
         super().__init__(shader_parser=shader_parser)
 
         self.bdh = bdh
+        self.palette_buffer: TableBufferObject = TableBufferObject(palette)
+        self.palette_buffer.update()
 
         shader_settings: List[RenderShaderSetting] = []
         shader_settings.extend(
@@ -100,12 +97,33 @@ class BlockRenderer(Renderer):
                         "point_to_block_impostor.geom",
                     ],
                     ["screen_width", "screen_height"],
-                )
+                ),
+                RenderShaderSetting(
+                    "block_instanced",
+                    ["block_impostor_instanced.vert", "dual_light.frag"],
+                    ["screen_width", "screen_height"],
+                ),
             ]
         )
         self.set_shader(shader_settings)
 
-        self.data_handler: VertexDataHandler = VertexDataHandler([(self.bdh.buffer, 0)])
+        # unit blocks are culled by the sphere around their corners, every visible
+        # block is an instance of a single point or of the shared cube strip
+        self.instanced: bool = False
+        self.culler: FrustumCuller = FrustumCuller(instance_vertices=1)
+        self.data_handler: VertexDataHandler = VertexDataHandler(
+            [(self.culler.visible_elements, 0), (self.palette_buffer, 1)],
+            [(0, 1), (1, 0)],
+        )
+        self.mesh: BufferObject = create_impostor_mesh()
+        self.instanced_data_handler: VertexDataHandler = VertexDataHandler(
+            [
+                (self.mesh, 0),
+                (self.culler.visible_elements, 1),
+                (self.palette_buffer, 1),
+            ],
+            [(0, 0), (1, 1), (2, 0)],
+        )
 
         def generate_element_count_func(bdh: BlockDataHandler) -> Callable:
             def element_count_func() -> int:
@@ -114,14 +132,38 @@ class BlockRenderer(Renderer):
             return element_count_func
 
         self.execute_funcs["block"] = generate_render_function(
-            OGLRenderFunction.ARRAYS, OglPrimitives.POINTS, depth_test=True
+            OGLRenderFunction.ARRAYS_INDIRECT,
+            OglPrimitives.POINTS,
+            depth_test=True,
+            indirect_buffer=self.culler.command,
         )
-        self.element_count_funcs["block"] = generate_element_count_func(self.bdh)
+        self.execute_funcs["block_instanced"] = generate_render_function(
+            OGLRenderFunction.ARRAYS_INDIRECT,
+            OglPrimitives.TRIANGLE_STRIP,
+            depth_test=True,
+            indirect_buffer=self.culler.command,
+        )
+        for set_name in ["block", "block_instanced"]:
+            self.element_count_funcs[set_name] = generate_element_count_func(self.bdh)
         self.create_sets(self.data_handler, "block")
+        self.create_sets(self.instanced_data_handler, "block_instanced")
 
     def render(
         self, set_name: str, cam: Camera, config: ShaderConfig | None = None
     ) -> None:
+        self.palette_buffer.update()
+        # the instanced path replaces the geometry shader with the 14 vertex strip
+        if self.instanced:
+            self.culler.set_instance_vertices(len(CUBE_STRIP))
+            set_name = set_name + "_instanced"
+        else:
+            self.culler.set_instance_vertices(1)
+        self.culler.cull(
+            self.bdh.buffer,
+            self.bdh.get_buffer_points(),
+            cam,
+            [("cull_radius", 0.866, "float")],
+        )
         current_set: BaseShaderSet = self.sets[set_name]
         current_set.set_uniform_data(
             [("projection", cam.projection, "mat4"), ("view", cam.view, "mat4")]
@@ -131,54 +173,50 @@ class BlockRenderer(Renderer):
 
     def delete(self) -> None:
         self.data_handler.delete()
+        self.instanced_data_handler.delete()
+        self.palette_buffer.delete()
+        self.mesh.delete()
+        self.culler.delete()
 
 
 class BlockApp(App):
     def __init__(self) -> None:
         super().__init__("Block Demo")
-        self.window.cam.update_base(np.array([5.0, 5.0, 5.0], dtype=np.float32))
         size: Tuple[int, int, int] = (10, 10, 10)
-        blocks: List[BlockData] = []
-        for x in range(size[0]):
-            sqr_off_x = abs(x - 5) * abs(x - 5)
-            for y in range(size[1]):
-                sqr_off_y = abs(y - 5) * abs(y - 5)
-                for z in range(size[2]):
-                    if sqr_off_x + sqr_off_y + abs(z - 5) * abs(z - 5) <= 10.0:
-                        if y > 6:
-                            blocks.append(
-                                BlockData(
-                                    np.array([x, y, z], dtype=np.float32),
-                                    BlockTypes.GRASS,
-                                )
-                            )
-                        else:
-                            if y > 4:
-                                blocks.append(
-                                    BlockData(
-                                        np.array([x, y, z], dtype=np.float32),
-                                        BlockTypes.DIRT,
-                                    )
-                                )
-                            else:
-                                blocks.append(
-                                    BlockData(
-                                        np.array([x, y, z], dtype=np.float32),
-                                        BlockTypes.STONE,
-                                    )
-                                )
+        # grass above dirt above stone, generated straight into the block buffer
+        block_type: str = "position.y > 6.0 ? {} : (position.y > 4.0 ? {} : {})".format(
+            float(BlockTypes.GRASS), float(BlockTypes.DIRT), float(BlockTypes.STONE)
+        )
+        self.generators: ComputeGenerators = ComputeGenerators()
+        blocks: AppendBuffer = AppendBuffer(size[0] * size[1] * size[2])
+        block_count: int = self.generators.sphere_lattice(
+            blocks, size, (5.0, 5.0, 5.0), 3.2, block_type
+        )
 
         self.bdh: BlockDataHandler = BlockDataHandler()
-        self.bdh.apply(size, blocks)
-        self.br: BlockRenderer = BlockRenderer(self.bdh)
+        self.bdh.apply(size, blocks, block_count)
+        self.palette: BlockPalette = BlockPalette()
+        self.br: BlockRenderer = BlockRenderer(self.bdh, self.palette)
         self.br_config: ShaderConfig = ShaderConfig()
 
-        self.set_cam(np.array([5.0, 5.0, 5.0], dtype=np.float32), 10.0, CameraPose.LEFT)
+        self.primitives: ComputePrimitives = ComputePrimitives()
+        self.frame_bounds(
+            *self.primitives.reduce(
+                self.bdh.buffer, self.bdh.get_buffer_points()
+            ).bounds
+        )
 
     @track_time(app_name="Block Demo")
     def render(self) -> None:
         self.br.render("block", self.window.cam, self.br_config)
 
+    def key_input(self, key, scancode, action, mods) -> bool | None:
+        if key == glfw.KEY_G and action == glfw.RELEASE:
+            self.br.instanced = not self.br.instanced
+        if key == glfw.KEY_ESCAPE and action == glfw.PRESS:
+            glfw.set_window_should_close(self.window.window_handle, True)
+        return False
+
 
 if __name__ == "__main__":
     app = BlockApp()
@@ -6,7 +6,15 @@ out float vs_density;
 out float vs_discard;
 out vec3 vs_color;
 
-//$$const vec3 $$block_type_name$$ = vec3($$block_type_r$$, $$block_type_g$$, $$block_type_b$$);
+struct BlockType
+{
+    vec3 color;
+};
+
+layout(std430, binding = 1) restrict readonly buffer block_palette
+{
+    BlockType block_types[];
+};
 
 void main()
 {
@@ -16,14 +24,11 @@ void main()
         vs_discard = 0.0;
     }
 
-    //$vec3 colors[$block_type_count$];
-    //$$colors[$$block_type_id$$] = $$block_type_name$$;
-
-    //$if (position.w > $block_type_count$ - 1.0) {
-        vs_color = colors[0];
-    //$} else {
-        vs_color = colors[int(position.w)];
-    //$}
+    int block_type = int(position.w);
+    if (block_type < 0 || block_type >= block_types.length()) {
+        block_type = 0;
+    }
+    vs_color = block_types[block_type].color;
 
     gl_Position = vec4(position.xyz, 1.0);
 }
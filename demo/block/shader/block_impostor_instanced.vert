@@ -0,0 +1,39 @@
+#version 440
+
+layout(location = 0) in vec4 corner;
+layout(location = 1) in vec4 position;
+
+flat out vec3 gs_color;
+flat out vec3 gs_center_position;
+out vec3 gs_frag_position;
+
+struct BlockType
+{
+    vec3 color;
+};
+
+layout(std430, binding = 1) restrict readonly buffer block_palette
+{
+    BlockType block_types[];
+};
+
+uniform mat4 projection;
+uniform mat4 view;
+
+void main()
+{
+    int block_type = int(position.w);
+    if (block_type < 0 || block_type >= block_types.length()) {
+        block_type = 0;
+    }
+    gs_color = block_types[block_type].color;
+    gs_center_position = position.xyz;
+    gs_frag_position = position.xyz + 0.4 * corner.xyz;
+
+    // air collapses all vertices of its cube outside the clip volume
+    if (position.w == 0.0) {
+        gl_Position = vec4(2.0, 2.0, 2.0, 1.0);
+    } else {
+        gl_Position = projection * view * vec4(position.xyz + 0.49999 * corner.xyz, 1.0);
+    }
+}
@@ -16,8 +16,7 @@ uniform mat4 view;
 
 const vec3 light_direction_cam_1 = normalize(vec3(1.0, 0.5, 0.75));
 const vec3 light_direction_cam_2 = normalize(vec3(-1.0, 0.5, -0.75));
-const vec3 atom_color_ambient  = vec3(0.2, 0.2, 0.2);
-const vec3 atom_color_specular = vec3(0.1, 0.1, 0.1);
+#include "lighting.glsl"
 
 void main()
 {
@@ -1,6 +1,9 @@
+import math
 from enum import Enum
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
+
 from ...utility.config import BaseConfig
 
 
@@ -16,6 +19,7 @@ class ShaderConfig(BaseConfig):
         self.shader_name: Dict[str, str] = dict()
         self.shader_uniform_name_map: Dict[str, List[str]] = dict()
         self.uniform_type: Dict[str, str] = dict()
+        self.version: int = 0
 
     def set_items(self, shader_items: List[Tuple[str, List[str], str, Any]]) -> None:
         for key, shader_names, uniform_type, value in shader_items:
@@ -32,3 +36,85 @@ class ShaderConfig(BaseConfig):
             )
             self.uniform_type[key] = uniform_type
             self.setdefault(key, value)
+        self.version += 1
+
+
+TABLE_COLUMN_TYPES: Dict[str, Tuple[str, int, int, int]] = {
+    "float": ("<f4", 1, 4, 4),
+    "int": ("<i4", 1, 4, 4),
+    "uint": ("<u4", 1, 4, 4),
+    "vec2": ("<f4", 2, 8, 8),
+    "vec3": ("<f4", 3, 12, 16),
+    "vec4": ("<f4", 4, 16, 16),
+    "ivec4": ("<i4", 4, 16, 16),
+}
+
+
+class ShaderTableConfig(BaseConfig):
+    def __init__(self, type_name: str | None = None, name: str | None = None) -> None:
+        if type_name is None:
+            type_name = "table"
+        if name is None:
+            super().__init__(type_name)
+        else:
+            super().__init__(type_name, name)
+
+        self.columns: List[Tuple[str, str]] = []
+        self.row_ids: Dict[str, int] = dict()
+        self.version: int = 0
+
+    def set_columns(self, columns: List[Tuple[str, str]]) -> None:
+        for _, column_type in columns:
+            if column_type not in TABLE_COLUMN_TYPES:
+                raise Exception("Table column type '%s' not supported." % column_type)
+        self.columns = columns
+        self.version += 1
+
+    def set_rows(self, rows: List[Tuple[str, int, Dict[str, Any]]]) -> None:
+        for row_name, row_id, values in rows:
+            self.row_ids[row_name] = row_id
+            self.setdefault(row_name, values)
+        self.version += 1
+
+    def set_row(self, row_name: str, values: Dict[str, Any]) -> None:
+        self[row_name] = {**self[row_name], **values}
+        self.version += 1
+
+    @property
+    def row_count(self) -> int:
+        return max(self.row_ids.values()) + 1 if len(self.row_ids) > 0 else 0
+
+    @property
+    def dtype(self) -> np.dtype:
+        # std430 layout of a struct with one member per column
+        names: List[str] = []
+        formats: List[Tuple[str, int] | str] = []
+        offsets: List[int] = []
+        offset: int = 0
+        struct_alignment: int = 4
+        for column, column_type in self.columns:
+            scalar, components, size, alignment = TABLE_COLUMN_TYPES[column_type]
+            offset = math.ceil(offset / alignment) * alignment
+            names.append(column)
+            formats.append(scalar if components == 1 else (scalar, components))
+            offsets.append(offset)
+            offset += size
+            struct_alignment = max(struct_alignment, alignment)
+        return np.dtype(
+            {
+                "names": names,
+                "formats": formats,
+                "offsets": offsets,
+                "itemsize": math.ceil(offset / struct_alignment) * struct_alignment,
+            }
+        )
+
+    def fill_row(self, data: np.ndarray, row_name: str) -> None:
+        for column, _ in self.columns:
+            data[self.row_ids[row_name]][column] = self[row_name][column]
+
+    def to_array(self) -> np.ndarray:
+        data: np.ndarray = np.zeros(self.row_count, dtype=self.dtype)
+        for row_name in self.row_ids.keys():
+            self.fill_row(data, row_name)
+        return data
@@ -1,4 +1,5 @@
 import abc
+from itertools import accumulate
 from typing import Any, Callable, List, Tuple
 
 from ..vertex_data_handler import OverflowingVertexDataHandler, VertexDataHandler
@@ -54,9 +55,11 @@ class OverflowingSet(BaseShaderSet):
         data_handler: OverflowingVertexDataHandler,
         use_func: Callable,
         element_count_func: Callable,
+        chunk_batch: int = 1,
     ) -> None:
         super().__init__(shader, use_func, element_count_func)
         self.data_handler: OverflowingVertexDataHandler = data_handler
+        self.chunk_batch: int = chunk_batch
 
     def use_sub(self, buffer_index: int = 0, render: bool = False) -> None:
         self.shader.use()
@@ -65,17 +68,32 @@ class OverflowingSet(BaseShaderSet):
 
     def use(self, render: bool = False) -> None:
         self.shader.use()
-        for i in range(
-            len(
-                self.data_handler.targeted_overflowing_buffer_objects[0][
-                    0
-                ].overflowing_handles
-            )
-        ):
+        chunk_count: int = len(
+            self.data_handler.targeted_overflowing_buffer_objects[0][
+                0
+            ].overflowing_handles
+        )
+        if self.chunk_batch > 1:
+            self.use_batches(chunk_count, render)
+            return
+        for i in range(chunk_count):
             self.data_handler.set_buffer(i)
             self.data_handler.set(render)
             self.use_func(self.element_count_func(i), i)
 
+    def use_batches(self, chunk_count: int, render: bool = False) -> None:
+        # a batch of chunks is bound to consecutive storage bindings and submitted
+        # with one multi draw, shaders pick the chunk by the draw id. Each batch is
+        # one submission, so all chunks take a single call only if chunk_batch
+        # covers them, bounded by GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS
+        counts: List[int] = [self.element_count_func(i) for i in range(chunk_count)]
+        firsts: List[int] = [0] + list(accumulate(counts))[:-1]
+        for start in range(0, chunk_count, self.chunk_batch):
+            end: int = min(start + self.chunk_batch, chunk_count)
+            self.data_handler.set_buffer(start)
+            self.data_handler.set_range(end - start, render)
+            self.use_func(counts[start:end], firsts[start:end], start)
+
 
 DATA_TO_SET_MAP = {
     VertexDataHandler: DefaultSet,
@@ -1,4 +1,5 @@
 import abc
+import weakref
 from typing import Any, Callable, Dict, List, Tuple
 
 from OpenGL.GL import *
@@ -41,6 +42,9 @@ def uniform_setter_function(uniform_setter: str) -> Callable:
     raise Exception("Uniform setter function for '%s' not defined." % uniform_setter)
 
 
+BindingPlan = Tuple[Tuple[str, int, Callable], ...]
+
+
 class ShaderSetting:
     def __init__(self, id_name: str, uniform_labels: List[str] | None = None) -> None:
         self.id_name: str = id_name
@@ -58,26 +62,67 @@ class BaseShader:
         self.uniform_cache: Dict[str, Tuple[int, Any, Callable]] = dict()
         self.uniform_labels: List[str] = []
         self.uniform_ignore_labels: List[str] = []
+        self.label_version: int = 0
+        self.binding_plans: Dict[int, Tuple[weakref.ref, int, int, BindingPlan]] = (
+            dict()
+        )
 
     def set_uniform_label(self, data: List[str]) -> None:
         for setting in data:
             self.uniform_labels.append(setting)
+        self.label_version += 1
+
+    def build_binding_plan(self, config: ShaderConfig) -> BindingPlan:
+        uniform_data = []
+        if self.name in config.shader_uniform_name_map:
+            uniform_names = config.shader_uniform_name_map[self.name]
+            for uniform_name in uniform_names:
+                if uniform_name in self.uniform_labels:
+                    uniform_data.append(
+                        (
+                            uniform_name,
+                            config[uniform_name],
+                            config.uniform_type[uniform_name],
+                        )
+                    )
+        self.set_uniform_data(uniform_data)
+        plan: BindingPlan = tuple(
+            (
+                uniform_name,
+                self.uniform_cache[uniform_name][0],
+                self.uniform_cache[uniform_name][2],
+            )
+            for uniform_name, _, _ in uniform_data
+            if uniform_name in self.uniform_cache
+        )
+        self.binding_plans[id(config)] = (
+            weakref.ref(config),
+            config.version,
+            self.label_version,
+            plan,
+        )
+        return plan
 
     def set_uniform_labeled_data(self, config: ShaderConfig | None) -> None:
-        if config is not None:
-            uniform_data = []
-            if self.name in config.shader_uniform_name_map:
-                uniform_names = config.shader_uniform_name_map[self.name]
-                for uniform_name in uniform_names:
-                    if uniform_name in self.uniform_labels:
-                        uniform_data.append(
-                            (
-                                uniform_name,
-                                config[uniform_name],
-                                config.uniform_type[uniform_name],
-                            )
-                        )
-            self.set_uniform_data(uniform_data)
+        if config is None:
+            return
+        entry = self.binding_plans.get(id(config))
+        if (
+            entry is None
+            or entry[0]() is not config
+            or entry[1] != config.version
+            or entry[2] != self.label_version
+        ):
+            # building the plan already uploads the current values
+            self.build_binding_plan(config)
+            return
+        uniform_cache = self.uniform_cache
+        for uniform_name, uniform_location, setter in entry[3]:
+            uniform_cache[uniform_name] = (
+                uniform_location,
+                config[uniform_name],
+                setter,
+            )
 
     def set_uniform_data(self, data: List[Tuple[str, Any, str]]) -> None:
         program_is_set: bool = False
@@ -109,6 +154,11 @@ class BaseShader:
     def set_textures(self, textures: List[Tuple[Texture, str, int]]) -> None:
         self.textures: List[Tuple[Texture, str, int]] = textures
 
+    def delete(self) -> None:
+        if self.shader_handle != 0:
+            glDeleteProgram(self.shader_handle)
+            self.shader_handle = 0
+
     @abc.abstractmethod
     def use(self) -> None:
         raise NotImplementedError
@@ -1,17 +1,25 @@
 import abc
 import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Tuple
 
 from ...utility.definitions import SHADER_PATH
 from ..base.shader import BaseShader, ShaderSetting
-from ..base.shader_parser import ShaderParser
+from ..base.shader_parser import Fingerprint, ShaderParser
+
+VariantKey = Tuple[str, Fingerprint | None]
 
 
 class BaseShaderHandler:
-    def __init__(self, shader_dir: str = SHADER_PATH) -> None:
+    def __init__(
+        self, shader_dir: str = SHADER_PATH, max_variants: int | None = None
+    ) -> None:
         __metaclass__ = abc.ABCMeta
         self.shader_list: Dict[str, BaseShader] = dict()
+        self.shader_variants: OrderedDict[VariantKey, BaseShader] = OrderedDict()
+        self.shader_owners: Dict[VariantKey, int] = dict()
+        self.max_variants: int | None = max_variants
         self.shader_dir: str = shader_dir
         if not os.path.exists(self.shader_dir):
             self.shader_dir = os.path.join(Path(shader_dir).parent.absolute(), "shader")
@@ -24,5 +32,73 @@ class BaseShaderHandler:
     ) -> BaseShader:
         raise NotImplementedError
 
-    def get(self, shader_name: str) -> BaseShader:
-        return self.shader_list[shader_name]
+    def variant_key(
+        self, shader_setting: ShaderSetting | str, parser: ShaderParser | None = None
+    ) -> VariantKey:
+        id_name: str = (
+            shader_setting
+            if isinstance(shader_setting, str)
+            else shader_setting.id_name
+        )
+        return id_name, None if parser is None else parser.fingerprint
+
+    def lookup(self, key: VariantKey) -> BaseShader | None:
+        if key not in self.shader_variants:
+            return None
+        self.shader_variants.move_to_end(key)
+        self.shader_list[key[0]] = self.shader_variants[key]
+        return self.shader_variants[key]
+
+    def register(self, key: VariantKey, shader: BaseShader) -> BaseShader:
+        self.shader_variants[key] = shader
+        self.shader_variants.move_to_end(key)
+        self.shader_list[key[0]] = shader
+        self.trim(key)
+        return shader
+
+    def acquire(
+        self, shader_setting: ShaderSetting, parser: ShaderParser | None = None
+    ) -> BaseShader:
+        # owned variants are held by processors and never evicted until released
+        key: VariantKey = self.variant_key(shader_setting, parser)
+        self.shader_owners[key] = self.shader_owners.get(key, 0) + 1
+        return self.create(shader_setting, parser)
+
+    def release(self, key: VariantKey) -> None:
+        if key not in self.shader_owners:
+            return
+        self.shader_owners[key] -= 1
+        if self.shader_owners[key] == 0:
+            del self.shader_owners[key]
+            self.trim()
+
+    def trim(self, keep: VariantKey | None = None) -> None:
+        if self.max_variants is None:
+            return
+        # least recently used first, the cache may exceed the limit while owned
+        unowned: List[VariantKey] = [
+            key
+            for key in self.shader_variants
+            if key not in self.shader_owners and key != keep
+        ]
+        for key in unowned[: len(self.shader_variants) - self.max_variants]:
+            self.evict(key)
+
+    def evict(self, key: VariantKey) -> None:
+        shader: BaseShader = self.shader_variants.pop(key)
+        self.shader_owners.pop(key, None)
+        if self.shader_list.get(key[0]) is shader:
+            del self.shader_list[key[0]]
+        shader.delete()
+
+    def get(self, shader_name: str, parser: ShaderParser | None = None) -> BaseShader:
+        if parser is None:
+            return self.shader_list[shader_name]
+        shader: BaseShader | None = self.lookup(self.variant_key(shader_name, parser))
+        if shader is None:
+            raise KeyError(shader_name)
+        return shader
+
+    def delete(self) -> None:
+        for key in list(self.shader_variants.keys()):
+            self.evict(key)
@@ -1,27 +1,161 @@
-from typing import Any, Dict, List, Tuple
+import os
+import re
+from typing import Any, Callable, Dict, List, Pattern, Set, Tuple
+
+from ...utility.definitions import LIBRARY_SHADER_PATH
 
 VAR_GROUP_CONFLICT: str = (
     "Can't replace multiple dynamic variables in danymic shader src. Last group: {}, conflicting group: {}"
 )
+INCLUDE_NOT_FOUND: str = "Shader include '{}' requested by '{}' not found."
+
+INCLUDE_PATTERN: Pattern = re.compile(
+    r'^[ \t]*#include[ \t]+"([^"]+)"[^\n]*\n?', re.MULTILINE
+)
+
+# the normalized variable maps themselves, so distinct variants can never collide
+Fingerprint = Tuple[
+    Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str, Tuple[str, ...]], ...]
+]
+ModuleKey = Tuple[str, int]
+ProgramKey = Tuple[str, Fingerprint | None, Tuple[str, ...]]
+
+_src_cache: Dict[ModuleKey, str] = dict()
+_parse_cache: Dict[Tuple[str, int, Fingerprint | None], str] = dict()
+_program_cache: Dict[ProgramKey, Tuple[Tuple[ModuleKey, ...], str]] = dict()
+_module_graph: Dict[str, Set[str]] = dict()
+
+
+def _file_key(path: str) -> ModuleKey:
+    abs_path: str = os.path.abspath(path)
+    return abs_path, os.stat(abs_path).st_mtime_ns
+
+
+def _is_current(module_key: ModuleKey) -> bool:
+    try:
+        return _file_key(module_key[0]) == module_key
+    except FileNotFoundError:
+        return False
+
+
+def _read_src(path: str) -> Tuple[ModuleKey, str]:
+    key = _file_key(path)
+    if key not in _src_cache:
+        _forget(key[0])
+        with open(path, "r") as src:
+            _src_cache[key] = src.read()
+    return key, _src_cache[key]
+
+
+def _forget(abs_path: str) -> None:
+    for key in [key for key in _src_cache if key[0] == abs_path]:
+        del _src_cache[key]
+    for key in [key for key in _parse_cache if key[0] == abs_path]:
+        del _parse_cache[key]
+
+
+def _strip_markers(src: str) -> str:
+    return src.replace("//$$", "").replace("$$", "").replace("//$", "")
+
+
+def resolve_include(name: str, including_path: str, include_dirs: List[str]) -> str:
+    for directory in [os.path.dirname(including_path)] + include_dirs:
+        include_path: str = os.path.abspath(os.path.join(directory, name))
+        if os.path.isfile(include_path):
+            return include_path
+    raise Exception(INCLUDE_NOT_FOUND.format(name, including_path))
+
+
+def _include_module(
+    path: str,
+    process: Callable[[str], str] | None,
+    fingerprint: Fingerprint | None,
+    include_dirs: List[str],
+    modules: List[ModuleKey],
+) -> str:
+    (abs_path, mtime), src = _read_src(path)
+    modules.append((abs_path, mtime))
+    if process is not None:
+        # modules are preprocessed on their own, so an unchanged module is never reprocessed
+        module_key = (abs_path, mtime, fingerprint)
+        if module_key not in _parse_cache:
+            _parse_cache[module_key] = process(src)
+        src = _parse_cache[module_key]
+    if "#include" not in src:
+        return src
+
+    def include(match: re.Match) -> str:
+        include_path: str = resolve_include(match.group(1), abs_path, include_dirs)
+        if any(module[0] == include_path for module in modules):
+            return ""
+        module_src: str = _include_module(
+            include_path, process, fingerprint, include_dirs, modules
+        )
+        return module_src if module_src.endswith("\n") else module_src + "\n"
 
+    return INCLUDE_PATTERN.sub(include, src)
 
-def get_shader_src(path: str) -> str:
-    processed_src: str = ""
-    with open(path, "r") as src:
-        for line in src:
-            processed_src = processed_src + line
-    return processed_src
+
+def _assemble(
+    path: str,
+    process: Callable[[str], str] | None,
+    fingerprint: Fingerprint | None,
+    include_dirs: List[str],
+) -> str:
+    key: ProgramKey = (os.path.abspath(path), fingerprint, tuple(include_dirs))
+    if key in _program_cache:
+        modules, src = _program_cache[key]
+        if all(_is_current(module) for module in modules):
+            return src
+
+    modules: List[ModuleKey] = []
+    src: str = _include_module(path, process, fingerprint, include_dirs, modules)
+    _program_cache[key] = (tuple(modules), src)
+    _module_graph[key[0]] = {module[0] for module in modules}
+    return src
+
+
+def get_dependents(module_path: str) -> List[str]:
+    abs_path: str = os.path.abspath(module_path)
+    return sorted(
+        program for program, modules in _module_graph.items() if abs_path in modules
+    )
+
+
+def clear_shader_cache() -> None:
+    _src_cache.clear()
+    _parse_cache.clear()
+    _program_cache.clear()
+    _module_graph.clear()
+
+
+def get_shader_src(path: str, include_dirs: List[str] | None = None) -> str:
+    return _assemble(
+        path,
+        None,
+        None,
+        ([] if include_dirs is None else include_dirs) + [LIBRARY_SHADER_PATH],
+    )
 
 
 class ShaderParser:
-    def __init__(self) -> None:
+    def __init__(self, include_dirs: List[str] | None = None) -> None:
+        self.include_dirs: List[str] = (
+            [] if include_dirs is None else include_dirs
+        ) + [LIBRARY_SHADER_PATH]
         self.static_var_map: Dict[str, str] = dict()
         self.dynamic_id_var_map: Dict[str, int] = dict()
         self.dynamic_var_map: Dict[str, Tuple[str, List[str]]] = dict()
+        self._static_pattern: Pattern | None = None
+        self._dynamic_pattern: Pattern | None = None
+        self._dynamic_line_pattern: Pattern | None = None
+        self._compiled: bool = False
+        self._fingerprint: Fingerprint | None = None
 
     def set_static(self, static_vars: Dict[str, Any]) -> None:
         for key, value in static_vars.items():
             self.static_var_map["${}$".format(key)] = str(value)
+        self._invalidate()
 
     def set_dynamic(self, dynamic_vars: Dict[str, Dict[str, List[str]]]) -> None:
         for group, sub_groups in dynamic_vars.items():
@@ -39,36 +173,109 @@ class ShaderParser:
                     group,
                     values,
                 )
+        self._invalidate()
+
+    def copy(self) -> "ShaderParser":
+        parser: ShaderParser = ShaderParser()
+        parser.include_dirs = list(self.include_dirs)
+        parser.static_var_map = dict(self.static_var_map)
+        parser.dynamic_id_var_map = dict(self.dynamic_id_var_map)
+        parser.dynamic_var_map = dict(self.dynamic_var_map)
+        return parser
+
+    def _invalidate(self) -> None:
+        self._static_pattern = None
+        self._dynamic_pattern = None
+        self._dynamic_line_pattern = None
+        self._compiled = False
+        self._fingerprint = None
+
+    @property
+    def fingerprint(self) -> Fingerprint:
+        if self._fingerprint is None:
+            self._fingerprint = (
+                tuple(sorted(self.static_var_map.items())),
+                tuple(
+                    sorted(
+                        (dynamic, group, tuple(values))
+                        for dynamic, (group, values) in self.dynamic_var_map.items()
+                    )
+                ),
+            )
+        return self._fingerprint
+
+    def _compile(self) -> None:
+        if self._compiled:
+            return
+        # longest markers first, so a marker never shadows a longer one sharing its prefix
+        if self.static_var_map:
+            self._static_pattern = re.compile(
+                "|".join(
+                    re.escape(static)
+                    for static in sorted(self.static_var_map, key=len, reverse=True)
+                )
+            )
+        if self.dynamic_var_map:
+            markers: str = "|".join(
+                re.escape(dynamic)
+                for dynamic in sorted(self.dynamic_var_map, key=len, reverse=True)
+            )
+            self._dynamic_pattern = re.compile("({})".format(markers))
+            self._dynamic_line_pattern = re.compile(
+                "^[^\n]*(?:{})[^\n]*\n?".format(markers), re.MULTILINE
+            )
+        self._compiled = True
+
+    def _replace_static(self, src: str) -> str:
+        if self._static_pattern is None:
+            return src
+        return self._static_pattern.sub(
+            lambda match: self.static_var_map[match.group(0)], src
+        )
+
+    def _expand_dynamic(self, line: str) -> str:
+        if self._dynamic_pattern is None or "$$" not in line:
+            return line
+
+        pieces: List[str] = self._dynamic_pattern.split(line)
+        markers: List[str] = pieces[1::2]
+        current_group: str | None = None
+        for dynamic in markers:
+            group: str = self.dynamic_var_map[dynamic][0]
+            if current_group is not None and current_group != group:
+                raise Exception(VAR_GROUP_CONFLICT.format(current_group, group))
+            current_group = group
+        if current_group is None:
+            return line
+
+        template: str = "{}".join(
+            literal.replace("{", "{{").replace("}", "}}") for literal in pieces[0::2]
+        )
+        return "".join(
+            template.format(*values)
+            for values in zip(
+                *(self.dynamic_var_map[dynamic][1] for dynamic in markers)
+            )
+        )
 
     def process_line(self, line: str) -> str:
-        processed_line: str = line
-
-        for static, value in self.static_var_map.items():
-            processed_line: str = processed_line.replace(static, value)
-
-        if "$$" in processed_line:
-            current_group: str | None = None
-            for dynamic, (group, _) in self.dynamic_var_map.items():
-                if dynamic in processed_line:
-                    if current_group is not None and current_group != group:
-                        raise Exception(VAR_GROUP_CONFLICT.format(current_group, group))
-                    current_group = group
-            if current_group is not None:
-                new_lines: str = ""
-                current_line: str = processed_line
-                for i in range(self.dynamic_id_var_map[current_group]):
-                    for dynamic, (group, values) in self.dynamic_var_map.items():
-                        if current_group == group:
-                            current_line = current_line.replace(dynamic, values[i])
-                    new_lines = new_lines + current_line
-                    current_line = processed_line
-                processed_line = new_lines
-
-        return processed_line.replace("//$$", "").replace("$$", "").replace("//$", "")
+        self._compile()
+        return _strip_markers(self._expand_dynamic(self._replace_static(line)))
+
+    def process(self, src: str) -> str:
+        self._compile()
+        processed_src: str = self._replace_static(src)
+        if self._dynamic_line_pattern is not None and "$$" in processed_src:
+            expanded_lines: Dict[str, str] = dict()
+
+            def expand(match: re.Match) -> str:
+                line: str = match.group(0)
+                if line not in expanded_lines:
+                    expanded_lines[line] = self._expand_dynamic(line)
+                return expanded_lines[line]
+
+            processed_src = self._dynamic_line_pattern.sub(expand, processed_src)
+        return _strip_markers(processed_src)
 
     def parse(self, path: str) -> str:
-        processed_src: str = ""
-        with open(path, "r") as src:
-            for line in src:
-                processed_src = processed_src + self.process_line(line)
-        return processed_src
+        return _assemble(path, self.process, self.fingerprint, self.include_dirs)
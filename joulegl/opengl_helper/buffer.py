@@ -1,16 +1,56 @@
 import logging
 import math
 from enum import Enum
-from typing import Callable, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 import numpy as np
 from OpenGL.GL import *
 
+from .base.config import ShaderTableConfig
+
 
 class BufferType(Enum):
     ARRAY_BUFFER: int = 0
     SHADER_STORAGE_BUFFER: int = 1
     INDEX_BUFFER: int = 2
+    DISPATCH_INDIRECT_BUFFER: int = 3
+    DRAW_INDIRECT_BUFFER: int = 4
+    ATOMIC_COUNTER_BUFFER: int = 5
+
+
+BUFFER_TARGET_MAP = {
+    BufferType.ARRAY_BUFFER: GL_ARRAY_BUFFER,
+    BufferType.SHADER_STORAGE_BUFFER: GL_SHADER_STORAGE_BUFFER,
+    BufferType.INDEX_BUFFER: GL_ELEMENT_ARRAY_BUFFER,
+    BufferType.DISPATCH_INDIRECT_BUFFER: GL_DISPATCH_INDIRECT_BUFFER,
+    BufferType.DRAW_INDIRECT_BUFFER: GL_DRAW_INDIRECT_BUFFER,
+    BufferType.ATOMIC_COUNTER_BUFFER: GL_ATOMIC_COUNTER_BUFFER,
+}
+
+DISPATCH_INDIRECT_COMMAND = np.dtype(
+    [
+        ("num_groups_x", np.uint32),
+        ("num_groups_y", np.uint32),
+        ("num_groups_z", np.uint32),
+    ]
+)
+DRAW_ARRAYS_INDIRECT_COMMAND = np.dtype(
+    [
+        ("count", np.uint32),
+        ("instance_count", np.uint32),
+        ("first", np.uint32),
+        ("base_instance", np.uint32),
+    ]
+)
+DRAW_ELEMENTS_INDIRECT_COMMAND = np.dtype(
+    [
+        ("count", np.uint32),
+        ("instance_count", np.uint32),
+        ("first_index", np.uint32),
+        ("base_vertex", np.int32),
+        ("base_instance", np.uint32),
+    ]
+)
 
 
 class BufferObject:
@@ -47,21 +87,27 @@ class BufferObject:
 
             glBindBuffer(GL_SHADER_STORAGE_BUFFER, self.handle)
             glBufferData(GL_SHADER_STORAGE_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
-        elif self.buffer_type == BufferType.ARRAY_BUFFER:
-            glBindBuffer(GL_ARRAY_BUFFER, self.handle)
-            glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
         else:
-            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.handle)
-            glBufferData(GL_ELEMENT_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+            target = BUFFER_TARGET_MAP[self.buffer_type]
+            glBindBuffer(target, self.handle)
+            glBufferData(target, data.nbytes, data, GL_STATIC_DRAW)
         self.loaded = True
 
-    def read(self) -> np.ndarray:
-        target = GL_SHADER_STORAGE_BUFFER
-        if self.buffer_type == BufferType.ARRAY_BUFFER:
-            target = GL_ARRAY_BUFFER
-        elif self.buffer_type == BufferType.INDEX_BUFFER:
-            target = GL_ELEMENT_ARRAY_BUFFER
+    def load_empty(self, dtype, size: int) -> None:
+        self.load(np.zeros(size, dtype=dtype))
+
+    def write(self, data: np.ndarray, offset: int = 0) -> None:
+        if offset + data.nbytes > self.size:
+            raise Exception(
+                "Data to write exceeds buffer (%d bytes at offset %d, size %d bytes)."
+                % (data.nbytes, offset, self.size)
+            )
+        target = BUFFER_TARGET_MAP[self.buffer_type]
+        glBindBuffer(target, self.handle)
+        glBufferSubData(target, offset, data.nbytes, data)
 
+    def read(self) -> np.ndarray:
+        target = BUFFER_TARGET_MAP[self.buffer_type]
         glBindBuffer(target, self.handle)
         return np.frombuffer(
             glGetBufferSubData(target, 0, self.size),
@@ -100,9 +146,25 @@ class BufferObject:
                 )
                 if divisor > 0:
                     glVertexAttribDivisor(location + i, divisor)
+        elif self.buffer_type == BufferType.ATOMIC_COUNTER_BUFFER:
+            glBindBufferBase(GL_ATOMIC_COUNTER_BUFFER, location, self.handle)
         else:
             glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.handle)
 
+    def bind_capture(self, index: int) -> None:
+        glBindBufferBase(GL_TRANSFORM_FEEDBACK_BUFFER, index, self.handle)
+
+    def copy_from(self, source: "BufferObject", size: int | None = None) -> None:
+        # copies stay on the gpu, the buffer is resized to the copied range
+        size = source.size if size is None else size
+        if not self.loaded or self.size != size:
+            self.load_empty(source.data.dtype, size // source.data.itemsize)
+        if glMemoryBarrier:
+            glMemoryBarrier(GL_BUFFER_UPDATE_BARRIER_BIT)
+        glBindBuffer(GL_COPY_READ_BUFFER, source.handle)
+        glBindBuffer(GL_COPY_WRITE_BUFFER, self.handle)
+        glCopyBufferSubData(GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER, 0, 0, size)
+
     def clear(self) -> None:
         glBindBufferBase(GL_SHADER_STORAGE_BUFFER, 0, self.handle)
         glClearBufferData(GL_SHADER_STORAGE_BUFFER, GL_RGBA32F, GL_RGBA, GL_FLOAT, None)
@@ -173,6 +235,16 @@ class SwappingBufferObject(BufferObject):
             super().bind(location + 1, False, divisor)
             self.swap()
 
+    def bind_capture(self, index: int) -> None:
+        # captured vertices are written to the buffer the current one is read from
+        glBindBufferBase(GL_TRANSFORM_FEEDBACK_BUFFER, index, self.swap_handle)
+
+    def copy_from(self, source: BufferObject, size: int | None = None) -> None:
+        super().copy_from(source, size)
+        self.swap()
+        super().copy_from(source, size)
+        self.swap()
+
     def delete(self) -> None:
         glDeleteBuffers(1, [self.handle])
         glDeleteBuffers(1, [self.swap_handle])
@@ -231,10 +303,6 @@ class OverflowingBufferObject(BufferObject):
         self.data = data
         self.loaded = True
 
-    def load_empty(self, dtype, size: int) -> None:
-        empty = np.zeros(size, dtype=dtype)
-        self.load(empty)
-
     def read(self) -> np.ndarray:
         data = np.array([], dtype=self.data.dtype)
         for i, handle in enumerate(self.overflowing_handles):
@@ -251,6 +319,18 @@ class OverflowingBufferObject(BufferObject):
         self.size = self.overflowing_sizes[buffer_id]
         self.bind(location, rendering, divisor)
 
+    def bind_chunks(self, buffer_id: int, count: int, location: int) -> None:
+        handles: List[int] = [
+            self.overflowing_handles[(buffer_id + i) % len(self.overflowing_handles)]
+            for i in range(count)
+        ]
+        glBindBuffersBase(
+            GL_SHADER_STORAGE_BUFFER,
+            location,
+            count,
+            np.array(handles, dtype=np.uint32),
+        )
+
     def bind_consecutive(self, location: int) -> None:
         for i, handle in enumerate(self.overflowing_handles):
             self.handle = handle
@@ -266,3 +346,211 @@ class OverflowingBufferObject(BufferObject):
 
     def get_objects(self, buffer_id: int = 0) -> int:
         return int(self.overflowing_sizes[buffer_id] / (self.object_size * 4))
+
+
+class TableBufferObject(BufferObject):
+    def __init__(self, table: ShaderTableConfig) -> None:
+        super().__init__(BufferType.SHADER_STORAGE_BUFFER)
+        self.table: ShaderTableConfig = table
+        self.table_version: int = -1
+
+    def update(self) -> None:
+        if self.table_version == self.table.version:
+            return
+        data: np.ndarray = self.table.to_array()
+        if self.loaded and data.nbytes == self.size:
+            self.data = data
+            self.write(data)
+        else:
+            self.load(data)
+        self.table_version = self.table.version
+
+    def set_row(self, row_name: str, values: Dict[str, Any]) -> None:
+        self.update()
+        self.table.set_row(row_name, values)
+        self.table.fill_row(self.data, row_name)
+        row_id: int = self.table.row_ids[row_name]
+        self.write(self.data[row_id : row_id + 1], row_id * self.data.dtype.itemsize)
+        self.table_version = self.table.version
+
+    def bind(self, location: int, rendering: bool = False, divisor: int = 0) -> None:
+        # tables are indexed by shaders in every stage, never used as vertex attributes
+        glBindBufferBase(GL_SHADER_STORAGE_BUFFER, location, self.handle)
+
+
+class IndirectBufferObject(BufferObject):
+    def __init__(
+        self,
+        buffer_type: BufferType = BufferType.DRAW_INDIRECT_BUFFER,
+        indexed: bool = False,
+    ) -> None:
+        if buffer_type not in [
+            BufferType.DISPATCH_INDIRECT_BUFFER,
+            BufferType.DRAW_INDIRECT_BUFFER,
+        ]:
+            raise Exception("Indirect buffer can't be of type '%s'." % buffer_type.name)
+        super().__init__(buffer_type)
+        self.indexed: bool = indexed
+
+    @property
+    def command_dtype(self) -> np.dtype:
+        if self.buffer_type == BufferType.DISPATCH_INDIRECT_BUFFER:
+            return DISPATCH_INDIRECT_COMMAND
+        if self.indexed:
+            return DRAW_ELEMENTS_INDIRECT_COMMAND
+        return DRAW_ARRAYS_INDIRECT_COMMAND
+
+    def command_offset(self, command_index: int) -> int:
+        return command_index * self.command_dtype.itemsize
+
+    def load_commands(self, commands: List[Tuple[int, ...]]) -> None:
+        self.load(np.array(commands, dtype=self.command_dtype))
+
+    def set_commands(self, commands: List[Tuple[int, ...]]) -> None:
+        data: np.ndarray = np.array(commands, dtype=self.command_dtype)
+        if self.loaded and data.nbytes == self.size:
+            self.data = data
+            self.write(data)
+        else:
+            self.load(data)
+
+    def update_commands(
+        self, commands: List[Tuple[int, ...]], command_index: int = 0
+    ) -> None:
+        # only for commands owned by the host, gpu written commands are not tracked,
+        # the commands fill their own slots from the index and are written on change
+        data: np.ndarray = np.array(commands, dtype=self.command_dtype)
+        end: int = command_index + len(data)
+        if not self.loaded or len(self.data) < end:
+            grown: np.ndarray = np.zeros(end, dtype=self.command_dtype)
+            if self.loaded:
+                grown[: len(self.data)] = self.data
+            grown[command_index:end] = data
+            self.load(grown)
+            return
+        if self.data[command_index:end].tobytes() == data.tobytes():
+            return
+        self.data[command_index:end] = data
+        self.write(data, self.command_offset(command_index))
+
+    def set_command(self, command_index: int, command: Tuple[int, ...]) -> None:
+        self.write(
+            np.array([command], dtype=self.command_dtype),
+            self.command_offset(command_index),
+        )
+
+    def bind_indirect(self) -> None:
+        glBindBuffer(BUFFER_TARGET_MAP[self.buffer_type], self.handle)
+
+    def bind(self, location: int, rendering: bool = False, divisor: int = 0) -> None:
+        # commands are written by compute passes through the storage binding
+        glBindBufferBase(GL_SHADER_STORAGE_BUFFER, location, self.handle)
+        self.bind_indirect()
+
+
+class AtomicCounterBufferObject(BufferObject):
+    def __init__(self, counter_count: int = 1) -> None:
+        super().__init__(BufferType.ATOMIC_COUNTER_BUFFER)
+        self.counter_count: int = counter_count
+        self.reset()
+
+    def reset(self, value: int = 0) -> None:
+        if not self.loaded:
+            self.load(np.full(self.counter_count, value, dtype=np.uint32))
+        else:
+            self.write(np.full(self.counter_count, value, dtype=np.uint32))
+
+    def values(self) -> np.ndarray:
+        return self.read()
+
+
+class AppendBuffer(BufferObject):
+    def __init__(
+        self,
+        capacity: int,
+        dtype: Any = np.float32,
+        counter_binding: int = 0,
+        object_size: int = 4,
+        render_data_offset: List[int] = [0],
+        render_data_size: List[int] = [4],
+    ) -> None:
+        super().__init__(
+            BufferType.SHADER_STORAGE_BUFFER,
+            object_size,
+            render_data_offset,
+            render_data_size,
+        )
+        self.capacity: int = capacity
+        self.counter_binding: int = counter_binding
+        self.load_empty(dtype, capacity * object_size)
+
+        # the counter is the vertex count of a draw command, so the appended elements
+        # can be drawn or dispatched without reading the count back
+        self.counter: IndirectBufferObject = IndirectBufferObject()
+        self.counter.load_commands([(0, 1, 0, 0)])
+        self.staging_handle: int = glGenBuffers(1)
+        glBindBuffer(GL_COPY_WRITE_BUFFER, self.staging_handle)
+        glBufferData(GL_COPY_WRITE_BUFFER, 4, None, GL_STREAM_READ)
+        self.count_fence: Any | None = None
+
+    def reset(self) -> None:
+        if glMemoryBarrier:
+            glMemoryBarrier(GL_BUFFER_UPDATE_BARRIER_BIT)
+        self.counter.write(np.zeros(1, dtype=np.uint32))
+
+    def count(self) -> int:
+        if glMemoryBarrier:
+            glMemoryBarrier(GL_BUFFER_UPDATE_BARRIER_BIT)
+        return int(self.counter.read()[0]["count"])
+
+    def request_count(self) -> None:
+        if glMemoryBarrier:
+            glMemoryBarrier(GL_BUFFER_UPDATE_BARRIER_BIT)
+        glBindBuffer(GL_COPY_READ_BUFFER, self.counter.handle)
+        glBindBuffer(GL_COPY_WRITE_BUFFER, self.staging_handle)
+        glCopyBufferSubData(GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER, 0, 0, 4)
+        if self.count_fence is not None:
+            glDeleteSync(self.count_fence)
+        self.count_fence = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+
+    def poll_count(self) -> int | None:
+        if self.count_fence is None:
+            return None
+        if glClientWaitSync(self.count_fence, 0, 0) not in [
+            GL_ALREADY_SIGNALED,
+            GL_CONDITION_SATISFIED,
+        ]:
+            return None
+        glDeleteSync(self.count_fence)
+        self.count_fence = None
+        glBindBuffer(GL_COPY_WRITE_BUFFER, self.staging_handle)
+        return int(
+            np.frombuffer(
+                glGetBufferSubData(GL_COPY_WRITE_BUFFER, 0, 4), dtype=np.uint32
+            )[0]
+        )
+
+    def read(self) -> np.ndarray:
+        data: np.ndarray = super().read()
+        return data[: self.count() * self.object_size]
+
+    def bind_indirect(self) -> None:
+        self.counter.bind_indirect()
+
+    def command_offset(self, command_index: int) -> int:
+        return self.counter.command_offset(command_index)
+
+    def bind(self, location: int, rendering: bool = False, divisor: int = 0) -> None:
+        super().bind(location, rendering, divisor)
+        if not rendering:
+            glBindBufferBase(
+                GL_ATOMIC_COUNTER_BUFFER, self.counter_binding, self.counter.handle
+            )
+
+    def delete(self) -> None:
+        if self.count_fence is not None:
+            glDeleteSync(self.count_fence)
+            self.count_fence = None
+        glDeleteBuffers(1, [self.staging_handle])
+        self.counter.delete()
+        super().delete()
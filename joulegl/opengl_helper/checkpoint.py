@@ -0,0 +1,302 @@
+import ctypes
+import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import numpy as np
+from OpenGL.GL import *
+from OpenGL.raw.GL.VERSION.GL_1_0 import glGetTexImage as glGetTexImageRaw
+
+from .buffer import BufferObject, OverflowingBufferObject
+from .texture import Texture
+
+CHECKPOINT_MAGIC: bytes = b"JGLCKPT1"
+CHECKPOINT_VERSION: int = 1
+CHECKPOINT_ALIGNMENT: int = 4096
+
+
+def align(offset: int, alignment: int = CHECKPOINT_ALIGNMENT) -> int:
+    return (offset + alignment - 1) // alignment * alignment
+
+
+class CheckpointSection:
+    def __init__(self, name: str, kind: str, nbytes: int, info: Dict[str, Any]) -> None:
+        self.name: str = name
+        self.kind: str = kind
+        self.nbytes: int = nbytes
+        self.info: Dict[str, Any] = info
+        self.offset: int = 0
+        self.staging_handle: int = 0
+
+    def header(self) -> Dict[str, Any]:
+        return dict(
+            name=self.name,
+            kind=self.kind,
+            offset=self.offset,
+            nbytes=self.nbytes,
+            **self.info,
+        )
+
+
+class CheckpointWriter:
+    def __init__(self, path: str, metadata: Dict[str, Any] | None = None) -> None:
+        self.path: str = path
+        self.metadata: Dict[str, Any] = dict() if metadata is None else metadata
+        self.sections: List[CheckpointSection] = []
+        self.sources: List[BufferObject | Texture] = []
+        self.fence: Any | None = None
+        self.executor: ThreadPoolExecutor | None = None
+        self.write_future: Future | None = None
+        self.done: bool = False
+
+    def add_buffer(self, name: str, buffer: BufferObject) -> None:
+        if isinstance(buffer, OverflowingBufferObject):
+            raise Exception("Can't checkpoint overflowing buffer '%s'." % name)
+        if not buffer.loaded:
+            raise Exception("Can't checkpoint buffer '%s' without data." % name)
+        self.sections.append(
+            CheckpointSection(
+                name,
+                "buffer",
+                buffer.size,
+                dict(dtype=buffer.data.dtype.str, object_size=buffer.object_size),
+            )
+        )
+        self.sources.append(buffer)
+
+    def add_texture(self, name: str, texture: Texture) -> None:
+        self.sections.append(
+            CheckpointSection(
+                name,
+                "texture",
+                texture.width * texture.height * texture.depth * 16,
+                dict(
+                    dtype=np.dtype(np.float32).str,
+                    width=texture.width,
+                    height=texture.height,
+                    depth=texture.depth,
+                ),
+            )
+        )
+        self.sources.append(texture)
+
+    def header(self) -> bytes:
+        return json.dumps(
+            dict(
+                version=CHECKPOINT_VERSION,
+                metadata=self.metadata,
+                sections=[section.header() for section in self.sections],
+            )
+        ).encode("utf-8")
+
+    def layout(self) -> bytes:
+        # the header size depends on the offsets, so grow until the first section fits
+        data_offset: int = CHECKPOINT_ALIGNMENT
+        while True:
+            offset: int = data_offset
+            for section in self.sections:
+                section.offset = offset
+                offset = align(offset + section.nbytes)
+            header: bytes = self.header()
+            if len(CHECKPOINT_MAGIC) + 8 + len(header) <= data_offset:
+                return header
+            data_offset = align(len(CHECKPOINT_MAGIC) + 8 + len(header))
+
+    def start(self) -> None:
+        # gpu side copies into staging buffers, the sources can be modified right after
+        for section, source in zip(self.sections, self.sources):
+            section.staging_handle = glGenBuffers(1)
+            if isinstance(source, Texture):
+                glBindBuffer(GL_PIXEL_PACK_BUFFER, section.staging_handle)
+                glBufferData(GL_PIXEL_PACK_BUFFER, section.nbytes, None, GL_STREAM_READ)
+                source.bind_as_texture()
+                glGetTexImageRaw(
+                    source.target, 0, GL_RGBA, GL_FLOAT, ctypes.c_void_p(0)
+                )
+                glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+            else:
+                glBindBuffer(GL_COPY_WRITE_BUFFER, section.staging_handle)
+                glBufferData(GL_COPY_WRITE_BUFFER, section.nbytes, None, GL_STREAM_READ)
+                if section.nbytes > 0:
+                    glBindBuffer(GL_COPY_READ_BUFFER, source.handle)
+                    glCopyBufferSubData(
+                        GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER, 0, 0, section.nbytes
+                    )
+        self.sources = []
+        self.fence = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+
+    def map_sections(self) -> List[memoryview]:
+        views: List[memoryview] = []
+        for section in self.sections:
+            if section.nbytes == 0:
+                views.append(memoryview(b""))
+                continue
+            glBindBuffer(GL_COPY_READ_BUFFER, section.staging_handle)
+            pointer: int = glMapBufferRange(
+                GL_COPY_READ_BUFFER, 0, section.nbytes, GL_MAP_READ_BIT
+            )
+            views.append(
+                memoryview(
+                    (ctypes.c_ubyte * section.nbytes).from_address(pointer)
+                ).cast("B")
+            )
+        return views
+
+    def write(self, header: bytes, views: List[memoryview]) -> None:
+        with open(self.path, "wb") as checkpoint_file:
+            checkpoint_file.write(CHECKPOINT_MAGIC)
+            checkpoint_file.write(np.uint64(len(header)).tobytes())
+            checkpoint_file.write(header)
+            for section, view in zip(self.sections, views):
+                checkpoint_file.seek(section.offset)
+                checkpoint_file.write(view)
+            checkpoint_file.truncate(
+                max(
+                    [CHECKPOINT_ALIGNMENT]
+                    + [
+                        align(section.offset + section.nbytes)
+                        for section in self.sections
+                    ]
+                )
+            )
+
+    def poll(self) -> bool:
+        if self.done:
+            return True
+        if self.fence is None:
+            raise Exception("Checkpoint '%s' was not started." % self.path)
+        if self.write_future is None:
+            if glClientWaitSync(self.fence, 0, 0) not in [
+                GL_ALREADY_SIGNALED,
+                GL_CONDITION_SATISFIED,
+            ]:
+                return False
+            # the mapped staging memory is written by a worker thread while rendering goes on
+            self.executor = ThreadPoolExecutor(1)
+            self.write_future = self.executor.submit(
+                self.write, self.layout(), self.map_sections()
+            )
+        if not self.write_future.done():
+            return False
+        self.finish()
+        return True
+
+    def wait(self) -> None:
+        if self.done:
+            return
+        if self.write_future is None:
+            glClientWaitSync(self.fence, GL_SYNC_FLUSH_COMMANDS_BIT, GL_TIMEOUT_IGNORED)
+            self.poll()
+        self.write_future.result()
+        self.poll()
+
+    def finish(self) -> None:
+        self.executor.shutdown()
+        self.executor = None
+        for section in self.sections:
+            if section.nbytes > 0:
+                glBindBuffer(GL_COPY_READ_BUFFER, section.staging_handle)
+                glUnmapBuffer(GL_COPY_READ_BUFFER)
+            glDeleteBuffers(1, [section.staging_handle])
+        glDeleteSync(self.fence)
+        self.fence = None
+        self.done = True
+        self.write_future.result()
+
+
+def save_checkpoint(
+    path: str,
+    buffers: Dict[str, BufferObject] | None = None,
+    textures: Dict[str, Texture] | None = None,
+    metadata: Dict[str, Any] | None = None,
+    wait: bool = False,
+) -> CheckpointWriter:
+    writer: CheckpointWriter = CheckpointWriter(path, metadata)
+    for name, buffer in ({} if buffers is None else buffers).items():
+        writer.add_buffer(name, buffer)
+    for name, texture in ({} if textures is None else textures).items():
+        writer.add_texture(name, texture)
+    writer.start()
+    if wait:
+        writer.wait()
+    return writer
+
+
+class Checkpoint:
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        with open(path, "rb") as checkpoint_file:
+            if checkpoint_file.read(len(CHECKPOINT_MAGIC)) != CHECKPOINT_MAGIC:
+                raise Exception("File '%s' is not a checkpoint." % path)
+            header_size: int = int(np.frombuffer(checkpoint_file.read(8), np.uint64)[0])
+            header: Dict[str, Any] = json.loads(checkpoint_file.read(header_size))
+        if header["version"] != CHECKPOINT_VERSION:
+            raise Exception(
+                "Checkpoint version %d of '%s' not supported."
+                % (header["version"], path)
+            )
+        self.metadata: Dict[str, Any] = header["metadata"]
+        self.sections: Dict[str, Dict[str, Any]] = {
+            section["name"]: section for section in header["sections"]
+        }
+        self.data: np.memmap | None = (
+            np.memmap(path, dtype=np.uint8, mode="r")
+            if os.path.getsize(path) > 0
+            else None
+        )
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.sections.keys())
+
+    def section(self, name: str, kind: str) -> Dict[str, Any]:
+        if name not in self.sections:
+            raise Exception("Checkpoint '%s' has no section '%s'." % (self.path, name))
+        section: Dict[str, Any] = self.sections[name]
+        if section["kind"] != kind:
+            raise Exception(
+                "Checkpoint section '%s' is a %s, not a %s."
+                % (name, section["kind"], kind)
+            )
+        return section
+
+    def array(self, name: str) -> np.ndarray:
+        # a view into the mapped file, pages are only read once they are touched
+        section: Dict[str, Any] = self.sections[name]
+        return self.data[
+            section["offset"] : section["offset"] + section["nbytes"]
+        ].view(np.dtype(section["dtype"]))
+
+    def restore_buffer(self, name: str, buffer: BufferObject) -> BufferObject:
+        self.section(name, "buffer")
+        buffer.load(self.array(name))
+        return buffer
+
+    def restore_texture(self, name: str, texture: Texture | None = None) -> Texture:
+        section: Dict[str, Any] = self.section(name, "texture")
+        if texture is None:
+            texture = Texture(section["width"], section["height"], section["depth"])
+        elif (texture.width, texture.height, texture.depth) != (
+            section["width"],
+            section["height"],
+            section["depth"],
+        ):
+            raise Exception(
+                "Texture size doesn't match checkpoint section '%s'." % name
+            )
+        texture.setup(self.array(name), 0)
+        return texture
+
+    def restore(
+        self,
+        buffers: Dict[str, BufferObject] | None = None,
+        textures: Dict[str, Texture] | None = None,
+    ) -> None:
+        for name, buffer in ({} if buffers is None else buffers).items():
+            self.restore_buffer(name, buffer)
+        for name, texture in ({} if textures is None else textures).items():
+            self.restore_texture(name, texture)
+
+    def close(self) -> None:
+        self.data = None
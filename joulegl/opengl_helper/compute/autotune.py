@@ -0,0 +1,118 @@
+import hashlib
+import time
+from typing import Callable, List, Tuple
+
+from OpenGL.GL import *
+
+from ...utility.config import BaseConfig
+from ..base.shader_parser import ShaderParser, get_shader_src
+from .shader import ComputeShader
+
+LOCAL_SIZE_MARKER: str = "$local_size_x$"
+DEFAULT_LOCAL_SIZE: int = 64
+LOCAL_SIZE_CANDIDATES: List[int] = [32, 64, 128, 256, 512, 1024]
+
+
+class LocalSizeCache(BaseConfig):
+    def __init__(self, name: str | None = None) -> None:
+        super().__init__("autotune", name)
+
+
+def device_name() -> str:
+    return "%s / %s" % (
+        glGetString(GL_VENDOR).decode(),
+        glGetString(GL_RENDERER).decode(),
+    )
+
+
+def tuning_src(shader_path: str, parser: ShaderParser | None = None) -> str:
+    # includes resolve in the parser's include dirs, as they do when it parses
+    return get_shader_src(shader_path, None if parser is None else parser.include_dirs)
+
+
+def is_tunable(shader_path: str, parser: ShaderParser | None = None) -> bool:
+    return LOCAL_SIZE_MARKER in tuning_src(shader_path, parser)
+
+
+def autotune_key(shader_path: str, parser: ShaderParser | None = None) -> str:
+    # hashlib instead of hash(), the key has to stay stable between runs
+    shader_hash = hashlib.sha1(tuning_src(shader_path, parser).encode())
+    if parser is not None:
+        static_vars = sorted(
+            (static, value)
+            for static, value in parser.static_var_map.items()
+            if static != LOCAL_SIZE_MARKER
+        )
+        dynamic_vars = sorted(
+            (dynamic, group, values)
+            for dynamic, (group, values) in parser.dynamic_var_map.items()
+        )
+        if len(static_vars) > 0 or len(dynamic_vars) > 0:
+            shader_hash.update(repr((static_vars, dynamic_vars)).encode())
+    return "%s:%s" % (device_name(), shader_hash.hexdigest())
+
+
+def local_size_parser(parser: ShaderParser | None, local_size: int) -> ShaderParser:
+    sized_parser: ShaderParser = ShaderParser() if parser is None else parser.copy()
+    sized_parser.set_static({"local_size_x": local_size})
+    return sized_parser
+
+
+class ComputeAutotuner:
+    def __init__(
+        self,
+        cache: LocalSizeCache | None = None,
+        candidates: List[int] | None = None,
+        repetitions: int = 5,
+    ) -> None:
+        self.cache: LocalSizeCache = LocalSizeCache() if cache is None else cache
+        self.candidates: List[int] = (
+            LOCAL_SIZE_CANDIDATES if candidates is None else candidates
+        )
+        self.repetitions: int = repetitions
+        self.timings: List[Tuple[int, float]] = []
+        self.revision: int = 0
+
+    def local_size(self, shader_path: str, parser: ShaderParser | None = None) -> int:
+        return self.cache.get(autotune_key(shader_path, parser), DEFAULT_LOCAL_SIZE)
+
+    def tune(
+        self,
+        shader_path: str,
+        setup: Callable[[ComputeShader], None],
+        element_count: int,
+        parser: ShaderParser | None = None,
+        force: bool = False,
+    ) -> int:
+        key: str = autotune_key(shader_path, parser)
+        if key in self.cache and not force:
+            return self.cache[key]
+
+        max_invocations: int = glGetIntegerv(GL_MAX_COMPUTE_WORK_GROUP_INVOCATIONS)
+        self.timings = []
+        for local_size in self.candidates:
+            if local_size > max_invocations:
+                continue
+            shader: ComputeShader = ComputeShader(
+                "autotune", local_size_parser(parser, local_size).parse(shader_path)
+            )
+            shader.use()
+            setup(shader)
+            shader.compute(element_count, barrier=True)
+            glFinish()
+            start_time: float = time.perf_counter()
+            for _ in range(self.repetitions):
+                shader.compute(element_count, barrier=True)
+            glFinish()
+            self.timings.append(
+                (local_size, (time.perf_counter() - start_time) / self.repetitions)
+            )
+            shader.delete()
+
+        if len(self.timings) == 0:
+            raise Exception("No local size candidate fits the device limits.")
+        best_local_size: int = min(self.timings, key=lambda timing: timing[1])[0]
+        self.cache[key] = best_local_size
+        self.cache.store()
+        self.revision += 1
+        return best_local_size
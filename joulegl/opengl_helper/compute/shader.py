@@ -4,9 +4,12 @@ from typing import Any, Dict, List, Tuple
 from OpenGL.GL import *
 from OpenGL.GL.shaders import compileProgram, compileShader
 
+from ..buffer import IndirectBufferObject
 from ..render.shader import BaseShader, ShaderSetting
 from ..texture import Texture
 
+INT_MAX: int = 2147483647
+
 
 class ComputeShaderSetting(ShaderSetting):
     def __init__(
@@ -32,27 +35,124 @@ class ComputeShader(BaseShader):
         self.max_workgroup_size: int = glGetIntegeri_v(
             GL_MAX_COMPUTE_WORK_GROUP_COUNT, 0
         )[0]
+        self.max_workgroup_count: Tuple[int, int] = (
+            glGetIntegeri_v(GL_MAX_COMPUTE_WORK_GROUP_COUNT, 1)[0],
+            glGetIntegeri_v(GL_MAX_COMPUTE_WORK_GROUP_COUNT, 2)[0],
+        )
+        local_size = (GLint * 3)()
+        glGetProgramiv(self.shader_handle, GL_COMPUTE_WORK_GROUP_SIZE, local_size)
+        self.local_size: Tuple[int, int, int] = (
+            local_size[0],
+            local_size[1],
+            local_size[2],
+        )
+        self.offset_location: int = glGetUniformLocation(
+            self.shader_handle, "work_group_offset"
+        )
+
+    @property
+    def invocations_per_group(self) -> int:
+        return self.local_size[0] * self.local_size[1] * self.local_size[2]
+
+    def dispatch_size(self, width: int) -> Tuple[int, int, int]:
+        group_count: int = math.ceil(width / self.invocations_per_group)
+        x: int = min(group_count, self.max_workgroup_size)
+        y: int = math.ceil(group_count / x) if x > 0 else 0
+        z: int = 1
+        if y > self.max_workgroup_count[0]:
+            z = math.ceil(y / self.max_workgroup_count[0])
+            y = self.max_workgroup_count[0]
+            if z > self.max_workgroup_count[1]:
+                raise Exception(
+                    "Can't dispatch %d elements in a single compute call." % width
+                )
+        return x, y, z
+
+    def set_uniforms(self) -> None:
+        for (
+            uniform_location,
+            uniform_data,
+            uniform_setter,
+        ) in self.uniform_cache.values():
+            uniform_setter(uniform_location, uniform_data)
 
     def compute(self, width: int, barrier: bool = False) -> None:
-        for i in range(math.ceil(width / self.max_workgroup_size)):
-            self.set_uniform_data(
-                [("work_group_offset", i * self.max_workgroup_size, "int")]
+        if width <= 0:
+            return
+        self.set_uniform_data([("element_count", width, "int")])
+        if self.offset_location != -1:
+            self.compute_chunked(width)
+        else:
+            self.set_uniforms()
+            glDispatchCompute(*self.dispatch_size(width))
+        if barrier:
+            self.barrier()
+
+    def image_dispatch_size(
+        self, width: int, height: int = 1, depth: int = 1
+    ) -> Tuple[int, int, int]:
+        # edge tiles are dispatched partially filled, kernels discard with in_image()
+        size: Tuple[int, int, int] = (
+            math.ceil(width / self.local_size[0]),
+            math.ceil(height / self.local_size[1]),
+            math.ceil(depth / self.local_size[2]),
+        )
+        if (
+            size[0] > self.max_workgroup_size
+            or size[1] > self.max_workgroup_count[0]
+            or size[2] > self.max_workgroup_count[1]
+        ):
+            raise Exception(
+                "Can't dispatch image of size %dx%dx%d in a single compute call."
+                % (width, height, depth)
             )
+        return size
+
+    def compute_image(
+        self, width: int, height: int = 1, depth: int = 1, barrier: bool = False
+    ) -> None:
+        if width <= 0 or height <= 0 or depth <= 0:
+            return
+        self.set_uniform_data([("image_size", [width, height, depth], "ivec3")])
+        self.set_uniforms()
+        glDispatchCompute(*self.image_dispatch_size(width, height, depth))
+        if barrier:
+            self.barrier()
 
-            for (
-                uniform_location,
-                uniform_data,
-                uniform_setter,
-            ) in self.uniform_cache.values():
-                uniform_setter(uniform_location, uniform_data)
-
-            if i == math.ceil(width / self.max_workgroup_size) - 1:
-                glDispatchCompute(width % self.max_workgroup_size, 1, 1)
-            else:
-                glDispatchCompute(self.max_workgroup_size, 1, 1)
+    def compute_texture(self, texture: Texture, barrier: bool = False) -> None:
+        self.compute_image(texture.width, texture.height, texture.depth, barrier)
+
+    def compute_indirect(
+        self,
+        indirect_buffer: IndirectBufferObject,
+        command_index: int = 0,
+        element_count: int | None = None,
+        barrier: bool = False,
+    ) -> None:
+        # without a known count the kernel has to bound its work itself
+        self.set_uniform_data(
+            [
+                (
+                    "element_count",
+                    INT_MAX if element_count is None else element_count,
+                    "int",
+                )
+            ]
+        )
+        self.set_uniforms()
+        indirect_buffer.bind_indirect()
+        glDispatchComputeIndirect(indirect_buffer.command_offset(command_index))
         if barrier:
             self.barrier()
 
+    def compute_chunked(self, width: int) -> None:
+        # shaders offsetting gl_WorkGroupID.x by work_group_offset, dispatched in 1D chunks
+        group_count: int = math.ceil(width / self.invocations_per_group)
+        self.set_uniforms()
+        for offset in range(0, group_count, self.max_workgroup_size):
+            glUniform1i(self.offset_location, offset)
+            glDispatchCompute(min(self.max_workgroup_size, group_count - offset), 1, 1)
+
     @staticmethod
     def barrier() -> None:
         glMemoryBarrier(GL_ALL_BARRIER_BITS)
@@ -1,24 +1,88 @@
 import os
+from typing import Dict, Tuple
 
+from ...utility.definitions import SHADER_PATH
 from ..base.shader import ShaderSetting
-from ..base.shader_parser import ShaderParser, get_shader_src
+from ..base.shader_handler import BaseShaderHandler, VariantKey
+from ..base.shader_parser import Fingerprint, ShaderParser, get_shader_src
+from ..compute.autotune import (
+    LOCAL_SIZE_MARKER,
+    ComputeAutotuner,
+    is_tunable,
+    local_size_parser,
+)
 from ..compute.shader import ComputeShader, ComputeShaderSetting
-from ..render.shader_handler import BaseShaderHandler
 
 
 class ComputeShaderHandler(BaseShaderHandler):
+    def __init__(
+        self,
+        shader_dir: str = SHADER_PATH,
+        max_variants: int | None = None,
+        autotuner: ComputeAutotuner | None = None,
+    ) -> None:
+        super().__init__(shader_dir, max_variants)
+        self.autotuner: ComputeAutotuner | None = autotuner
+        self.tuned_parsers: Dict[
+            Tuple[str, Fingerprint | None], ShaderParser | None
+        ] = dict()
+        self.tuned_revision: int = 0
+
+    def get_autotuner(self) -> ComputeAutotuner:
+        if self.autotuner is None:
+            self.autotuner = ComputeAutotuner()
+        return self.autotuner
+
+    def tuned_parser(
+        self, shader_path: str, parser: ShaderParser | None = None
+    ) -> ShaderParser | None:
+        if parser is not None and LOCAL_SIZE_MARKER in parser.static_var_map:
+            return parser
+        # memoized per variant, the source scan and autotune key would otherwise
+        # run on every lookup
+        if (
+            self.autotuner is not None
+            and self.autotuner.revision != self.tuned_revision
+        ):
+            self.tuned_parsers = dict()
+            self.tuned_revision = self.autotuner.revision
+        key: Tuple[str, Fingerprint | None] = (
+            shader_path,
+            None if parser is None else parser.fingerprint,
+        )
+        if key not in self.tuned_parsers:
+            self.tuned_parsers[key] = (
+                local_size_parser(
+                    parser, self.get_autotuner().local_size(shader_path, parser)
+                )
+                if is_tunable(shader_path, parser)
+                else None
+            )
+        tuned_parser: ShaderParser | None = self.tuned_parsers[key]
+        return parser if tuned_parser is None else tuned_parser
+
+    def variant_key(
+        self, shader_setting: ShaderSetting | str, parser: ShaderParser | None = None
+    ) -> VariantKey:
+        # tunable programs are registered and owned under their tuned parser
+        if isinstance(shader_setting, ComputeShaderSetting):
+            parser = self.tuned_parser(
+                os.path.join(self.shader_dir, shader_setting.src), parser
+            )
+        return super().variant_key(shader_setting, parser)
+
     def create(
         self, shader_setting: ShaderSetting, parser: ShaderParser | None = None
     ) -> ComputeShader:
         if not isinstance(shader_setting, ComputeShaderSetting):
             raise ValueError("ComputeShaderSetting required for ComputeShaderHandler")
-        if shader_setting.id_name in self.shader_list.keys():
-            return self.shader_list[shader_setting.id_name]
         shader_path: str = os.path.join(self.shader_dir, shader_setting.src)
+        parser = self.tuned_parser(shader_path, parser)
+        key = super().variant_key(shader_setting, parser)
+        shader: ComputeShader | None = self.lookup(key)
+        if shader is not None:
+            return shader
         shader_src = (
             get_shader_src(shader_path) if parser is None else parser.parse(shader_path)
         )
-        self.shader_list[shader_setting.id_name] = ComputeShader(
-            shader_setting.id_name, shader_src
-        )
-        return self.shader_list[shader_setting.id_name]
+        return self.register(key, ComputeShader(shader_setting.id_name, shader_src))
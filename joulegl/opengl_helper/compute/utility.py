@@ -0,0 +1,26 @@
+from typing import Callable
+
+from ..buffer import IndirectBufferObject
+from .shader import ComputeShader
+
+
+def generate_compute_function(
+    compute_shader: ComputeShader,
+    barrier: bool = True,
+    indirect_buffer: IndirectBufferObject | None = None,
+    command_index: int = 0,
+) -> Callable:
+    compute_shader: ComputeShader = compute_shader
+    barrier: bool = barrier
+    indirect_buffer: IndirectBufferObject | None = indirect_buffer
+    command_index: int = command_index
+
+    def compute_func(element_count: int, _=None) -> None:
+        if indirect_buffer is None:
+            compute_shader.compute(element_count, barrier=barrier)
+        else:
+            compute_shader.compute_indirect(
+                indirect_buffer, command_index, barrier=barrier
+            )
+
+    return compute_func
@@ -13,8 +13,10 @@ class RenderShaderHandler(BaseShaderHandler):
     ) -> RenderShader:
         if not isinstance(shader_setting, RenderShaderSetting):
             raise ValueError("RenderShaderSetting required for RenderShaderHandler")
-        if shader_setting.id_name in self.shader_list.keys():
-            return self.shader_list[shader_setting.id_name]
+        key = self.variant_key(shader_setting, parser)
+        shader: RenderShader | None = self.lookup(key)
+        if shader is not None:
+            return shader
         vertex_path: str = os.path.join(self.shader_dir, shader_setting.vertex)
         vertex_src: str = (
             get_shader_src(vertex_path) if parser is None else parser.parse(vertex_path)
@@ -33,11 +35,13 @@ class RenderShaderHandler(BaseShaderHandler):
                 if parser is None
                 else parser.parse(geometry_path)
             )
-        self.shader_list[shader_setting.id_name] = RenderShader(
-            shader_setting.id_name,
-            vertex_src,
-            fragment_src,
-            geometry_src,
-            shader_setting.uniform_labels,
+        return self.register(
+            key,
+            RenderShader(
+                shader_setting.id_name,
+                vertex_src,
+                fragment_src,
+                geometry_src,
+                shader_setting.uniform_labels,
+            ),
         )
-        return self.shader_list[shader_setting.id_name]
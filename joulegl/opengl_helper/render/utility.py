@@ -3,6 +3,8 @@ from typing import Any, Callable, List, Tuple, Union
 
 from OpenGL.GL import *
 
+from ..buffer import IndirectBufferObject
+
 
 def clear_screen(clear_color: List[float]) -> None:
     glClearColor(clear_color[0], clear_color[1], clear_color[2], clear_color[3])
@@ -13,6 +15,9 @@ class OGLRenderFunction(Enum):
     ARRAYS = 1
     ARRAYS_INSTANCED = 2
     ELEMENTS = 3
+    ARRAYS_INDIRECT = 4
+    ELEMENTS_INDIRECT = 5
+    MULTI_ARRAYS_INDIRECT = 6
 
 
 class OglPrimitives(Enum):
@@ -112,6 +117,9 @@ def generate_render_function(
     ) = None,
     depth_test: bool = False,
     instance_vertices: int = 1,
+    indirect_buffer: IndirectBufferObject | None = None,
+    command_index: int = 0,
+    program_point_size: bool = False,
 ) -> Callable:
     ogl_func: OGLRenderFunction = ogl_func
     primitive: OglPrimitives = primitive
@@ -120,8 +128,22 @@ def generate_render_function(
     add_blending: bool = add_blending
     depth_test: bool = depth_test
     instance_vertices: int = instance_vertices
-
-    def render_func(element_count: int, _=None) -> None:
+    if (
+        ogl_func
+        in [
+            OGLRenderFunction.ARRAYS_INDIRECT,
+            OGLRenderFunction.ELEMENTS_INDIRECT,
+            OGLRenderFunction.MULTI_ARRAYS_INDIRECT,
+        ]
+        and indirect_buffer is None
+    ):
+        raise Exception("Indirect render function requires an indirect buffer.")
+
+    def render_func(
+        element_count: int | List[int],
+        chunk_firsts: List[int] | int | None = None,
+        chunk_start: int = 0,
+    ) -> None:
         if add_blending is not None:
             glEnable(GL_BLEND)
             glBlendFunc(
@@ -139,6 +161,11 @@ def generate_render_function(
         else:
             glDisable(GL_DEPTH_TEST)
 
+        if program_point_size:
+            glEnable(GL_PROGRAM_POINT_SIZE)
+        else:
+            glDisable(GL_PROGRAM_POINT_SIZE)
+
         if point_size is not None:
             glPointSize(point_size)
 
@@ -155,6 +182,38 @@ def generate_render_function(
             glDrawElements(
                 OGL_PRIMITVE_MAP[primitive], element_count, GL_UNSIGNED_INT, None
             )
+        elif ogl_func is OGLRenderFunction.ARRAYS_INDIRECT:
+            indirect_buffer.bind_indirect()
+            glDrawArraysIndirect(
+                OGL_PRIMITVE_MAP[primitive],
+                ctypes.c_void_p(indirect_buffer.command_offset(command_index)),
+            )
+        elif ogl_func is OGLRenderFunction.ELEMENTS_INDIRECT:
+            indirect_buffer.bind_indirect()
+            glDrawElementsIndirect(
+                OGL_PRIMITVE_MAP[primitive],
+                GL_UNSIGNED_INT,
+                ctypes.c_void_p(indirect_buffer.command_offset(command_index)),
+            )
+        elif ogl_func is OGLRenderFunction.MULTI_ARRAYS_INDIRECT:
+            # one command slot per chunk, the base instance carries the chunk's first
+            # element, so every batch draws its own slots and unchanged ones stay
+            indirect_buffer.update_commands(
+                [
+                    (count, 1, 0, first)
+                    for count, first in zip(element_count, chunk_firsts)
+                ],
+                command_index + chunk_start,
+            )
+            indirect_buffer.bind_indirect()
+            glMultiDrawArraysIndirect(
+                OGL_PRIMITVE_MAP[primitive],
+                ctypes.c_void_p(
+                    indirect_buffer.command_offset(command_index + chunk_start)
+                ),
+                len(element_count),
+                0,
+            )
 
         glMemoryBarrier(GL_ALL_BARRIER_BITS)
 
@@ -5,10 +5,12 @@ from ..utility.singleton import Singleton
 
 
 class Texture:
-    def __init__(self, width: int, height: int) -> None:
+    def __init__(self, width: int, height: int, depth: int = 1) -> None:
         self.texture_handler: TextureHandler = TextureHandler()
         self.width: int = width
         self.height: int = height
+        self.depth: int = depth
+        self.target: int = GL_TEXTURE_3D if depth > 1 else GL_TEXTURE_2D
         self.active_index: int | None = None
         self.ogl_handle: int = glGenTextures(1)
         self.texture_position: int = -1
@@ -16,21 +18,36 @@ class Texture:
 
     def setup(self, data: np.ndarray, position: int | None = None) -> None:
         self.bind_as_texture(position)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexImage2D(
-            GL_TEXTURE_2D,
-            0,
-            GL_RGBA32F,
-            self.width,
-            self.height,
-            0,
-            GL_RGBA,
-            GL_FLOAT,
-            data,
-        )
+        glTexParameteri(self.target, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(self.target, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        glTexParameteri(self.target, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(self.target, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        if self.target == GL_TEXTURE_3D:
+            glTexParameteri(self.target, GL_TEXTURE_WRAP_R, GL_CLAMP_TO_EDGE)
+            glTexImage3D(
+                GL_TEXTURE_3D,
+                0,
+                GL_RGBA32F,
+                self.width,
+                self.height,
+                self.depth,
+                0,
+                GL_RGBA,
+                GL_FLOAT,
+                data,
+            )
+        else:
+            glTexImage2D(
+                GL_TEXTURE_2D,
+                0,
+                GL_RGBA32F,
+                self.width,
+                self.height,
+                0,
+                GL_RGBA,
+                GL_FLOAT,
+                data,
+            )
 
     def bind_as_texture(self, position: int | None = None) -> None:
         if position is None:
@@ -39,7 +56,7 @@ class Texture:
         else:
             self.texture_position = position
         self.texture_handler.activate(self.texture_position)
-        glBindTexture(GL_TEXTURE_2D, self.ogl_handle)
+        glBindTexture(self.target, self.ogl_handle)
 
     def bind_as_image(self, flag: str, position: int | None = None) -> None:
         if position is None:
@@ -52,13 +69,20 @@ class Texture:
             if flag == "write"
             else GL_READ_ONLY if flag == "read" else GL_READ_WRITE
         )
+        # 3d textures are bound layered, so the whole volume is accessible as image3D
         glBindImageTexture(
-            self.image_position, self.ogl_handle, 0, GL_FALSE, 0, ogl_flag, GL_RGBA32F
+            self.image_position,
+            self.ogl_handle,
+            0,
+            self.target == GL_TEXTURE_3D,
+            0,
+            ogl_flag,
+            GL_RGBA32F,
         )
 
     def read(self) -> np.ndarray:
         self.bind_as_texture()
-        data = glGetTexImage(GL_TEXTURE_2D, 0, GL_RGBA, GL_FLOAT)
+        data = glGetTexImage(self.target, 0, GL_RGBA, GL_FLOAT)
         return data
 
     def delete(self) -> None:
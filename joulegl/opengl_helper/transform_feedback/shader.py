@@ -0,0 +1,93 @@
+import ctypes
+from typing import List
+
+from OpenGL.GL import *
+from OpenGL.GL.shaders import compileShader
+
+from ..base.shader import BaseShader, ShaderSetting
+
+# geometry stages emit strips, feedback captures them as independent primitives
+GEOMETRY_FEEDBACK_MAP = {
+    GL_POINTS: GL_POINTS,
+    GL_LINE_STRIP: GL_LINES,
+    GL_TRIANGLE_STRIP: GL_TRIANGLES,
+}
+
+
+class TransformFeedbackShaderSetting(ShaderSetting):
+    def __init__(
+        self,
+        id_name: str,
+        shader_paths: List[str],
+        varyings: List[str],
+        uniform_labels: List[str] | None = None,
+        interleaved: bool = True,
+    ) -> None:
+        super().__init__(id_name, uniform_labels)
+        if len(shader_paths) < 1 or len(shader_paths) > 2:
+            raise Exception(
+                "Can't handle number of shaders for a program (either 1 or 2 with geometry shader)."
+            )
+        if len(varyings) == 0:
+            raise Exception("Transform feedback program requires captured varyings.")
+        self.vertex: str = shader_paths[0]
+        self.geometry: str | None = None if len(shader_paths) < 2 else shader_paths[1]
+        self.varyings: List[str] = varyings
+        self.interleaved: bool = interleaved
+
+
+class TransformFeedbackShader(BaseShader):
+    def __init__(
+        self,
+        name: str,
+        vertex_src: str,
+        varyings: List[str],
+        geometry_src: str | None = None,
+        uniform_labels: List[str] = [],
+        interleaved: bool = True,
+    ) -> None:
+        BaseShader.__init__(self, name)
+        shaders: List[int] = [compileShader(vertex_src, GL_VERTEX_SHADER)]
+        if geometry_src is not None:
+            shaders.append(compileShader(geometry_src, GL_GEOMETRY_SHADER))
+
+        # varyings have to be declared before linking, so the program is linked by hand
+        self.shader_handle = glCreateProgram()
+        for shader in shaders:
+            glAttachShader(self.shader_handle, shader)
+        varying_names = (ctypes.c_char_p * len(varyings))(
+            *[varying.encode() for varying in varyings]
+        )
+        glTransformFeedbackVaryings(
+            self.shader_handle,
+            len(varyings),
+            ctypes.cast(varying_names, ctypes.POINTER(ctypes.POINTER(GLchar))),
+            GL_INTERLEAVED_ATTRIBS if interleaved else GL_SEPARATE_ATTRIBS,
+        )
+        glLinkProgram(self.shader_handle)
+        for shader in shaders:
+            glDeleteShader(shader)
+        if glGetProgramiv(self.shader_handle, GL_LINK_STATUS) != GL_TRUE:
+            raise Exception(
+                "Transform feedback program '%s' failed to link: %s"
+                % (name, glGetProgramInfoLog(self.shader_handle))
+            )
+        self.varyings: List[str] = varyings
+        self.feedback_mode: int | None = None
+        if geometry_src is not None:
+            self.feedback_mode = GEOMETRY_FEEDBACK_MAP[
+                int(glGetProgramiv(self.shader_handle, GL_GEOMETRY_OUTPUT_TYPE))
+            ]
+        self.set_uniform_label(uniform_labels)
+
+    def use(self) -> None:
+        for texture, _, texture_position in self.textures:
+            texture.bind_as_texture(texture_position)
+        glUseProgram(self.shader_handle)
+
+        for (
+            uniform_location,
+            uniform_data,
+            uniform_setter,
+        ) in self.uniform_cache.values():
+            uniform_setter(uniform_location, uniform_data)
@@ -0,0 +1,43 @@
+import os
+
+from ..base.shader import ShaderSetting
+from ..base.shader_handler import BaseShaderHandler
+from ..base.shader_parser import ShaderParser, get_shader_src
+from .shader import TransformFeedbackShader, TransformFeedbackShaderSetting
+
+
+class TransformFeedbackShaderHandler(BaseShaderHandler):
+    def create(
+        self, shader_setting: ShaderSetting, parser: ShaderParser | None = None
+    ) -> TransformFeedbackShader:
+        if not isinstance(shader_setting, TransformFeedbackShaderSetting):
+            raise ValueError(
+                "TransformFeedbackShaderSetting required for TransformFeedbackShaderHandler"
+            )
+        key = self.variant_key(shader_setting, parser)
+        shader: TransformFeedbackShader | None = self.lookup(key)
+        if shader is not None:
+            return shader
+        vertex_path: str = os.path.join(self.shader_dir, shader_setting.vertex)
+        vertex_src: str = (
+            get_shader_src(vertex_path) if parser is None else parser.parse(vertex_path)
+        )
+        geometry_src: str | None = None
+        if shader_setting.geometry is not None:
+            geometry_path: str = os.path.join(self.shader_dir, shader_setting.geometry)
+            geometry_src = (
+                get_shader_src(geometry_path)
+                if parser is None
+                else parser.parse(geometry_path)
+            )
+        return self.register(
+            key,
+            TransformFeedbackShader(
+                shader_setting.id_name,
+                vertex_src,
+                shader_setting.varyings,
+                geometry_src,
+                shader_setting.uniform_labels,
+                shader_setting.interleaved,
+            ),
+        )
@@ -0,0 +1,85 @@
+from typing import Callable, List
+
+from OpenGL.GL import *
+
+from ..buffer import BufferObject
+from ..render.utility import OGL_PRIMITVE_MAP, OglPrimitives
+from .shader import TransformFeedbackShader
+
+# strips and loops are captured as the independent primitives they assemble into
+FEEDBACK_PRIMITIVE_MAP = {
+    OglPrimitives.POINTS: GL_POINTS,
+    OglPrimitives.LINE_STRIP: GL_LINES,
+    OglPrimitives.LINE_LOOP: GL_LINES,
+    OglPrimitives.LINES: GL_LINES,
+    OglPrimitives.TRIANGLE_STRIP: GL_TRIANGLES,
+    OglPrimitives.TRIANGLE_FAN: GL_TRIANGLES,
+    OglPrimitives.TRIANGLES: GL_TRIANGLES,
+}
+
+
+class PrimitiveCountQuery:
+    def __init__(self, ring_size: int = 3) -> None:
+        # results arrive frames later, a query object is only reused once it is read
+        self.queries: List[int] = [int(query) for query in glGenQueries(ring_size)]
+        self.pending: List[int] = []
+        self.query: int = self.queries[0]
+        self.count: int = 0
+
+    def begin(self) -> None:
+        self.update()
+        if len(self.pending) == len(self.queries):
+            # every query is in flight, only the oldest one is waited for
+            self.count = glGetQueryObjectuiv(self.pending.pop(0), GL_QUERY_RESULT)
+        self.query = next(query for query in self.queries if query not in self.pending)
+        glBeginQuery(GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN, self.query)
+
+    def end(self) -> None:
+        glEndQuery(GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN)
+        self.pending.append(self.query)
+
+    def update(self, wait: bool = False) -> int:
+        # queries finish in order, without waiting the newest finished count is kept
+        while len(self.pending) > 0 and (
+            wait or glGetQueryObjectiv(self.pending[0], GL_QUERY_RESULT_AVAILABLE)
+        ):
+            self.count = glGetQueryObjectuiv(self.pending.pop(0), GL_QUERY_RESULT)
+        return self.count
+
+    def delete(self) -> None:
+        glDeleteQueries(len(self.queries), self.queries)
+
+
+def generate_feedback_function(
+    primitive: OglPrimitives,
+    capture_buffers: List[BufferObject],
+    query: PrimitiveCountQuery | None = None,
+    shader: TransformFeedbackShader | None = None,
+) -> Callable:
+    # with a geometry stage its output layout decides the captured primitives
+    feedback_mode: int | None = None if shader is None else shader.feedback_mode
+    if feedback_mode is None:
+        if primitive not in FEEDBACK_PRIMITIVE_MAP:
+            raise Exception(
+                "Transform feedback can't capture primitive '%s'." % primitive.name
+            )
+        feedback_mode = FEEDBACK_PRIMITIVE_MAP[primitive]
+    primitive: OglPrimitives = primitive
+    feedback_mode: int = feedback_mode
+    capture_buffers: List[BufferObject] = capture_buffers
+    query: PrimitiveCountQuery | None = query
+
+    def feedback_func(element_count: int, _=None) -> None:
+        for index, buffer in enumerate(capture_buffers):
+            buffer.bind_capture(index)
+        glEnable(GL_RASTERIZER_DISCARD)
+        if query is not None:
+            query.begin()
+        glBeginTransformFeedback(feedback_mode)
+        glDrawArrays(OGL_PRIMITVE_MAP[primitive], 0, element_count)
+        glEndTransformFeedback()
+        if query is not None:
+            query.end()
+        glDisable(GL_RASTERIZER_DISCARD)
+
+    return feedback_func
@@ -35,7 +35,9 @@ class VertexDataHandler(BaseDataHandler):
         self.buffer_divisor: List[Tuple[int, int]] = buffer_divisor
 
     def set(self, rendering: bool = False) -> None:
-        glMemoryBarrier(GL_VERTEX_ATTRIB_ARRAY_BARRIER_BIT)
+        # gl 3.x contexts have no incoherent shader writes and no memory barriers
+        if glMemoryBarrier:
+            glMemoryBarrier(GL_VERTEX_ATTRIB_ARRAY_BARRIER_BIT)
         glBindVertexArray(self.handle)
         for i, (buffer, location) in enumerate(self.targeted_buffer_objects):
             if not buffer.loaded:
@@ -82,26 +84,14 @@ class OverflowingVertexDataHandler(VertexDataHandler):
         for buffer, location in self.targeted_overflowing_buffer_objects:
             buffer.bind_single(self.current_buffer_id, location, rendering)
 
-    def set_range(self, count: int) -> None:
-        glMemoryBarrier(GL_VERTEX_ATTRIB_ARRAY_BARRIER_BIT)
-        glBindVertexArray(self.handle)
-        for buffer, location in self.targeted_buffer_objects:
-            if not buffer.loaded:
-                raise AssertionError("Buffer was not initalized with data!")
-            buffer.bind(location)
+    def set_range(self, count: int, rendering: bool = False) -> None:
+        VertexDataHandler.set(self, rendering)
         for buffer, location in self.targeted_overflowing_buffer_objects:
             if not buffer.loaded:
                 raise AssertionError("Buffer was not initalized with data!")
-            for i in range(count):
-                buffer.bind_single(
-                    (self.current_buffer_id + i) % len(buffer.overflowing_handles),
-                    location + i,
-                )
-
-    def set_consecutive(self) -> None:
-        glMemoryBarrier(GL_VERTEX_ATTRIB_ARRAY_BARRIER_BIT)
-        glBindVertexArray(self.handle)
-        for buffer, location in self.targeted_buffer_objects:
-            buffer.bind(location)
+            buffer.bind_chunks(self.current_buffer_id, count, location)
+
+    def set_consecutive(self, rendering: bool = False) -> None:
+        VertexDataHandler.set(self, rendering)
         for buffer, location in self.targeted_overflowing_buffer_objects:
             buffer.bind_consecutive(location)
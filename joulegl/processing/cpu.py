@@ -0,0 +1,210 @@
+import math
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from ..opengl_helper.base.config import ShaderConfig
+from ..opengl_helper.base.data_set import BaseShaderSet
+from ..opengl_helper.buffer import BufferObject, SwappingBufferObject
+
+CPUKernel = Callable[[List[np.ndarray], List[np.ndarray], Dict[str, Any]], None]
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+DEFAULT_CHUNK_SIZE: int = 65536
+
+
+def _run_shared_chunk(
+    kernel: CPUKernel,
+    input_specs: List[ArraySpec],
+    output_specs: List[ArraySpec],
+    uniforms: Dict[str, Any],
+    start: int,
+    end: int,
+) -> None:
+    # worker processes attach to the shared blocks and work on views of their chunk
+    blocks: List[shared_memory.SharedMemory] = []
+    arrays: List[List[np.ndarray]] = [[], []]
+    for specs, chunk_arrays in [(input_specs, arrays[0]), (output_specs, arrays[1])]:
+        for name, shape, dtype in specs:
+            block = shared_memory.SharedMemory(name=name)
+            blocks.append(block)
+            chunk_arrays.append(
+                np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)[start:end]
+            )
+    kernel(arrays[0], arrays[1], uniforms)
+    del arrays
+    for block in blocks:
+        block.close()
+
+
+class ExecutionStats:
+    def __init__(self) -> None:
+        self.elements: int = 0
+        self.seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.elements / self.seconds if self.seconds > 0.0 else 0.0
+
+
+class CPUExecutor:
+    def __init__(
+        self,
+        workers: int | None = None,
+        use_processes: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.workers: int = (os.cpu_count() or 1) if workers is None else workers
+        self.use_processes: bool = use_processes
+        self.chunk_size: int = chunk_size
+        self.pool: Executor | None = None
+        self.stats: ExecutionStats = ExecutionStats()
+
+    def get_pool(self) -> Executor:
+        if self.pool is None:
+            self.pool = (
+                ProcessPoolExecutor(self.workers)
+                if self.use_processes
+                else ThreadPoolExecutor(self.workers)
+            )
+        return self.pool
+
+    def chunks(self, element_count: int) -> List[Tuple[int, int]]:
+        # at least one chunk per worker, so small inputs still spread over the pool
+        chunk_size: int = max(
+            1, min(self.chunk_size, math.ceil(element_count / self.workers))
+        )
+        return [
+            (start, min(start + chunk_size, element_count))
+            for start in range(0, element_count, chunk_size)
+        ]
+
+    def run(
+        self,
+        kernel: CPUKernel,
+        inputs: List[np.ndarray],
+        outputs: List[np.ndarray],
+        uniforms: Dict[str, Any] | None = None,
+        element_count: int | None = None,
+    ) -> None:
+        uniforms = dict() if uniforms is None else uniforms
+        if element_count is None:
+            element_count = min(len(array) for array in inputs + outputs)
+        start_time: float = time.perf_counter()
+        if self.use_processes:
+            self.run_processes(kernel, inputs, outputs, uniforms, element_count)
+        else:
+            futures = [
+                self.get_pool().submit(
+                    kernel,
+                    [array[start:end] for array in inputs],
+                    [array[start:end] for array in outputs],
+                    uniforms,
+                )
+                for start, end in self.chunks(element_count)
+            ]
+            for future in wait(futures).done:
+                future.result()
+        self.stats.elements = element_count
+        self.stats.seconds = time.perf_counter() - start_time
+
+    def run_processes(
+        self,
+        kernel: CPUKernel,
+        inputs: List[np.ndarray],
+        outputs: List[np.ndarray],
+        uniforms: Dict[str, Any],
+        element_count: int,
+    ) -> None:
+        blocks: List[shared_memory.SharedMemory] = []
+        specs: List[List[ArraySpec]] = [[], []]
+        try:
+            for arrays, array_specs in [(inputs, specs[0]), (outputs, specs[1])]:
+                for array in arrays:
+                    block = shared_memory.SharedMemory(
+                        create=True, size=max(array.nbytes, 1)
+                    )
+                    blocks.append(block)
+                    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = (
+                        array
+                    )
+                    array_specs.append((block.name, array.shape, array.dtype.str))
+            futures = [
+                self.get_pool().submit(
+                    _run_shared_chunk, kernel, specs[0], specs[1], uniforms, start, end
+                )
+                for start, end in self.chunks(element_count)
+            ]
+            for future in wait(futures).done:
+                future.result()
+            for array, block in zip(outputs, blocks[len(inputs) :]):
+                array[:] = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def delete(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+
+class CPUSet(BaseShaderSet):
+    def __init__(
+        self,
+        kernel: CPUKernel,
+        executor: CPUExecutor,
+        inputs: List[BufferObject],
+        outputs: List[BufferObject],
+        element_count_func: Callable,
+    ) -> None:
+        super().__init__(None, None, element_count_func)
+        self.kernel: CPUKernel = kernel
+        self.executor: CPUExecutor = executor
+        self.inputs: List[BufferObject] = inputs
+        self.outputs: List[BufferObject] = outputs
+        self.uniforms: Dict[str, Any] = dict()
+        self.stats: ExecutionStats = ExecutionStats()
+
+    def set_uniform_label(self, data: List[str]) -> None:
+        pass
+
+    def set_uniform_data(self, data: List[Tuple[str, Any, str]]) -> None:
+        for uniform_name, uniform_data, _ in data:
+            self.uniforms[uniform_name] = uniform_data
+
+    def set_uniform_labeled_data(self, config: ShaderConfig | None) -> None:
+        if config is not None:
+            for key, value in config.items():
+                self.uniforms[key] = value
+
+    @staticmethod
+    def elements(buffer: BufferObject, data: np.ndarray) -> np.ndarray:
+        return data.reshape(-1, buffer.object_size)
+
+    def use(self, render: bool = False) -> None:
+        inputs: List[np.ndarray] = [
+            self.elements(buffer, buffer.read()) for buffer in self.inputs
+        ]
+        outputs: List[np.ndarray] = [
+            self.elements(buffer, buffer.read().copy()) for buffer in self.outputs
+        ]
+        self.executor.run(
+            self.kernel, inputs, outputs, self.uniforms, self.element_count_func()
+        )
+        self.stats.elements = self.executor.stats.elements
+        self.stats.seconds = self.executor.stats.seconds
+
+        for buffer, data in zip(self.outputs, outputs):
+            # swapping buffers are written like their second compute binding
+            if isinstance(buffer, SwappingBufferObject):
+                buffer.swap()
+                buffer.write(data.flatten())
+                buffer.swap()
+            else:
+                buffer.write(data.flatten())
@@ -0,0 +1,195 @@
+from typing import Any, Dict, List, Tuple
+
+from OpenGL.GL import *
+
+from ..opengl_helper.base.shader_parser import ShaderParser
+from ..opengl_helper.buffer import AppendBuffer
+from ..opengl_helper.compute.shader import ComputeShader, ComputeShaderSetting
+from ..opengl_helper.compute.shader_handler import ComputeShaderHandler
+from ..utility.definitions import LIBRARY_SHADER_PATH
+
+BOX_PREDICATE: str = "true"
+SPHERE_PREDICATE: str = "dot(offset, offset) <= radius * radius"
+NOISE_PREDICATE: str = "value_noise(position * noise_scale, uint(seed)) > threshold"
+
+
+def value_expression(value: float | str) -> str:
+    return value if isinstance(value, str) else repr(float(value))
+
+
+class ComputeGenerators:
+    def __init__(self, shader_handler: ComputeShaderHandler | None = None) -> None:
+        self.owns_handler: bool = shader_handler is None
+        self.shader_handler: ComputeShaderHandler = (
+            ComputeShaderHandler(LIBRARY_SHADER_PATH)
+            if shader_handler is None
+            else shader_handler
+        )
+        self.parsers: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], ShaderParser] = (
+            dict()
+        )
+
+    def shader(self, name: str, static_vars: Dict[str, Any]) -> ComputeShader:
+        key: Tuple[str, Tuple[Tuple[str, Any], ...]] = (
+            name,
+            tuple(sorted(static_vars.items())),
+        )
+        if key not in self.parsers:
+            parser: ShaderParser = ShaderParser()
+            parser.set_static(static_vars)
+            self.parsers[key] = parser
+        return self.shader_handler.create(
+            ComputeShaderSetting(name, [name + ".comp"]), self.parsers[key]
+        )
+
+    @staticmethod
+    def generated(output: AppendBuffer, read_count: bool = True) -> int | None:
+        if glMemoryBarrier:
+            glMemoryBarrier(
+                GL_SHADER_STORAGE_BARRIER_BIT
+                | GL_ATOMIC_COUNTER_BARRIER_BIT
+                | GL_VERTEX_ATTRIB_ARRAY_BARRIER_BIT
+                | GL_COMMAND_BARRIER_BIT
+            )
+        # the count is a blocking readback, indirect consumers use the counter command
+        return output.count() if read_count else None
+
+    def lattice(
+        self,
+        output: AppendBuffer,
+        size: Tuple[int, int, int],
+        predicate: str = BOX_PREDICATE,
+        value: float | str = 0.0,
+        spacing: float = 1.0,
+        origin: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+        uniforms: List[Tuple[str, Any, str]] | None = None,
+        append: bool = False,
+        read_count: bool = True,
+    ) -> int | None:
+        # every grid cell tests the predicate and appends its position, the
+        # predicate and value expressions can use position, offset and the uniforms
+        if not append:
+            output.reset()
+        shader: ComputeShader = self.shader(
+            "generate_lattice",
+            {"predicate": predicate, "value": value_expression(value)},
+        )
+        output.bind(0)
+        shader.use()
+        shader.set_uniform_data(
+            [
+                ("capacity", output.capacity, "int"),
+                ("origin", list(origin), "vec3"),
+                ("spacing", spacing, "float"),
+            ]
+            + ([] if uniforms is None else uniforms)
+        )
+        shader.compute_image(*size)
+        return self.generated(output, read_count)
+
+    def box_lattice(
+        self,
+        output: AppendBuffer,
+        size: Tuple[int, int, int],
+        value: float | str = 0.0,
+        spacing: float = 1.0,
+        origin: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+        append: bool = False,
+        read_count: bool = True,
+    ) -> int | None:
+        return self.lattice(
+            output,
+            size,
+            BOX_PREDICATE,
+            value,
+            spacing,
+            origin,
+            append=append,
+            read_count=read_count,
+        )
+
+    def sphere_lattice(
+        self,
+        output: AppendBuffer,
+        size: Tuple[int, int, int],
+        center: Tuple[float, float, float],
+        radius: float,
+        value: float | str = 0.0,
+        spacing: float = 1.0,
+        origin: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+        append: bool = False,
+        read_count: bool = True,
+    ) -> int | None:
+        return self.lattice(
+            output,
+            size,
+            SPHERE_PREDICATE,
+            value,
+            spacing,
+            origin,
+            [("center", list(center), "vec3"), ("radius", radius, "float")],
+            append,
+            read_count,
+        )
+
+    def voxel_field(
+        self,
+        output: AppendBuffer,
+        size: Tuple[int, int, int],
+        threshold: float = 0.5,
+        noise_scale: float = 0.1,
+        seed: int = 0,
+        value: float | str = 0.0,
+        spacing: float = 1.0,
+        origin: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+        append: bool = False,
+        read_count: bool = True,
+    ) -> int | None:
+        return self.lattice(
+            output,
+            size,
+            NOISE_PREDICATE,
+            value,
+            spacing,
+            origin,
+            [
+                ("threshold", threshold, "float"),
+                ("noise_scale", noise_scale, "float"),
+                ("seed", seed, "int"),
+            ],
+            append,
+            read_count,
+        )
+
+    def random_points(
+        self,
+        output: AppendBuffer,
+        count: int,
+        minimum: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+        maximum: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+        value: float | str = 0.0,
+        seed: int = 0,
+        append: bool = False,
+        read_count: bool = True,
+    ) -> int | None:
+        if not append:
+            output.reset()
+        shader: ComputeShader = self.shader(
+            "generate_points", {"value": value_expression(value)}
+        )
+        output.bind(0)
+        shader.use()
+        shader.set_uniform_data(
+            [
+                ("capacity", output.capacity, "int"),
+                ("minimum", list(minimum), "vec3"),
+                ("maximum", list(maximum), "vec3"),
+                ("seed", seed, "int"),
+            ]
+        )
+        shader.compute(count)
+        return self.generated(output, read_count)
+
+    def delete(self) -> None:
+        if self.owns_handler:
+            self.shader_handler.delete()
@@ -0,0 +1,340 @@
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+from ..opengl_helper.base.shader_parser import ShaderParser
+from ..opengl_helper.buffer import BufferObject, BufferType
+from ..opengl_helper.compute.shader import ComputeShader, ComputeShaderSetting
+from ..opengl_helper.compute.shader_handler import ComputeShaderHandler
+from ..utility.definitions import LIBRARY_SHADER_PATH
+
+MAX_FUSED_INPUTS: int = 7
+
+GLSL_OPERATIONS: Dict[str, str] = {
+    "add": "({} + {})",
+    "sub": "({} - {})",
+    "mul": "({} * {})",
+    "div": "({} / {})",
+    "pow": "pow({}, {})",
+    "minimum": "min({}, {})",
+    "maximum": "max({}, {})",
+    "lt": "float({} < {})",
+    "le": "float({} <= {})",
+    "gt": "float({} > {})",
+    "ge": "float({} >= {})",
+    "eq": "float({} == {})",
+    "ne": "float({} != {})",
+    "neg": "(-{})",
+    "abs": "abs({})",
+    "sqrt": "sqrt({})",
+    "exp": "exp({})",
+    "log": "log({})",
+    "sin": "sin({})",
+    "cos": "cos({})",
+    "floor": "floor({})",
+    "where": "({} != 0.0 ? {} : {})",
+}
+
+
+def upload(data: np.ndarray) -> BufferObject:
+    buffer: BufferObject = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(np.ascontiguousarray(data, dtype=np.float32).flatten())
+    return buffer
+
+
+def input_expression(leaves: List[Any], leaf: Any) -> str:
+    return "in_%d[index]" % next(i for i, other in enumerate(leaves) if other is leaf)
+
+
+class GPUArrayEvaluator:
+    def __init__(self, shader_handler: ComputeShaderHandler | None = None) -> None:
+        # programs belong to the current context, so the evaluator is owned and
+        # deleted like the other compute helpers
+        self.owns_handler: bool = shader_handler is None
+        self.shader_handler: ComputeShaderHandler = (
+            ComputeShaderHandler(LIBRARY_SHADER_PATH)
+            if shader_handler is None
+            else shader_handler
+        )
+        self.parsers: Dict[Tuple[str, int, int], ShaderParser] = dict()
+
+    def parser(self, expression: str, inputs: int, scalars: int) -> ShaderParser:
+        # the expression only references inputs and uniforms by position, so equally
+        # shaped expressions share one program
+        key: Tuple[str, int, int] = (expression, inputs, scalars)
+        if key not in self.parsers:
+            parser: ShaderParser = ShaderParser()
+            parser.set_static({"expression": expression})
+            parser.set_dynamic(
+                {
+                    "input": {
+                        "id": [str(i) for i in range(inputs)],
+                        "binding": [str(i + 1) for i in range(inputs)],
+                    },
+                    "scalar": {"id": [str(i) for i in range(scalars)]},
+                }
+            )
+            self.parsers[key] = parser
+        return self.parsers[key]
+
+    def shader(self, expression: str, inputs: int, scalars: int) -> ComputeShader:
+        return self.shader_handler.create(
+            ComputeShaderSetting("gpu_array", ["gpu_array.comp"]),
+            self.parser(expression, inputs, scalars),
+        )
+
+    def delete(self) -> None:
+        if self.owns_handler:
+            self.shader_handler.delete()
+        self.parsers = dict()
+
+
+class GPUArray:
+    def __init__(
+        self,
+        buffer: BufferObject | None = None,
+        size: int | None = None,
+        operation: str | None = None,
+        operands: List[Any] | None = None,
+        evaluator: GPUArrayEvaluator | None = None,
+    ) -> None:
+        self.buffer: BufferObject | None = buffer
+        self.owned: bool = False
+        self.operation: str | None = operation
+        self.operands: List[Any] = [] if operands is None else operands
+        # expressions inherit the evaluator of their operands
+        self.evaluator: GPUArrayEvaluator | None = evaluator
+        for operand in self.operands:
+            if self.evaluator is None and isinstance(operand, GPUArray):
+                self.evaluator = operand.evaluator
+        if size is None:
+            if buffer is None:
+                raise Exception("GPUArray requires a buffer or a size.")
+            size = int(buffer.size / 4)
+        self.size: int = size
+
+    @staticmethod
+    def from_numpy(
+        data: np.ndarray, evaluator: GPUArrayEvaluator | None = None
+    ) -> "GPUArray":
+        array: GPUArray = GPUArray(upload(data), evaluator=evaluator)
+        array.owned = True
+        return array
+
+    @property
+    def evaluated(self) -> bool:
+        return self.operation is None
+
+    def leaves(self) -> List[Any]:
+        # evaluated arrays and numpy operands, numpy is only uploaded per dispatch
+        if self.evaluated:
+            return [self]
+        leaves: List[Any] = []
+        for operand in self.operands:
+            if isinstance(operand, GPUArray):
+                operand_leaves: List[Any] = operand.leaves()
+            elif isinstance(operand, np.ndarray):
+                operand_leaves = [operand]
+            else:
+                continue
+            for leaf in operand_leaves:
+                if all(leaf is not other for other in leaves):
+                    leaves.append(leaf)
+        return leaves
+
+    def generate(self, leaves: List[Any], scalars: List[float]) -> str:
+        if self.evaluated:
+            return input_expression(leaves, self)
+        arguments: List[str] = []
+        for operand in self.operands:
+            if isinstance(operand, GPUArray):
+                arguments.append(operand.generate(leaves, scalars))
+            elif isinstance(operand, np.ndarray):
+                arguments.append(input_expression(leaves, operand))
+            else:
+                scalars.append(float(operand))
+                arguments.append("u_%d" % (len(scalars) - 1))
+        return GLSL_OPERATIONS[self.operation].format(*arguments)
+
+    def dispatch(
+        self, evaluator: GPUArrayEvaluator, temporaries: List[BufferObject]
+    ) -> BufferObject:
+        root: GPUArray = GPUArray(
+            size=self.size, operation=self.operation, operands=list(self.operands)
+        )
+        # bindings are limited, so too wide expressions dispatch their widest
+        # operands first, without touching the possibly shared operand nodes
+        while len(root.leaves()) > MAX_FUSED_INPUTS:
+            widest: int = max(
+                [
+                    i
+                    for i, operand in enumerate(root.operands)
+                    if isinstance(operand, GPUArray) and not operand.evaluated
+                ],
+                key=lambda i: len(root.operands[i].leaves()),
+            )
+            buffer: BufferObject = root.operands[widest].dispatch(
+                evaluator, temporaries
+            )
+            temporaries.append(buffer)
+            root.operands[widest] = GPUArray(buffer, self.size)
+
+        leaves: List[Any] = root.leaves()
+        scalars: List[float] = []
+        expression: str = root.generate(leaves, scalars)
+        shader: ComputeShader = evaluator.shader(expression, len(leaves), len(scalars))
+        output: BufferObject = BufferObject(
+            buffer_type=BufferType.SHADER_STORAGE_BUFFER
+        )
+        output.load_empty(np.float32, self.size)
+        output.bind(0)
+        for i, leaf in enumerate(leaves):
+            if isinstance(leaf, np.ndarray):
+                temporaries.append(upload(leaf))
+                temporaries[-1].bind(i + 1)
+            else:
+                leaf.buffer.bind(i + 1)
+        shader.use()
+        shader.set_uniform_data(
+            [("u_%d" % i, value, "float") for i, value in enumerate(scalars)]
+        )
+        shader.compute(self.size, barrier=True)
+        return output
+
+    def evaluate(self) -> "GPUArray":
+        if self.evaluated:
+            return self
+        if self.evaluator is None:
+            raise Exception("GPUArray expression has no evaluator.")
+        # uploads and split off sub expressions only live for this evaluation
+        temporaries: List[BufferObject] = []
+        self.buffer = self.dispatch(self.evaluator, temporaries)
+        for buffer in temporaries:
+            buffer.delete()
+
+        self.owned = True
+        self.operation = None
+        self.operands = []
+        return self
+
+    def numpy(self) -> np.ndarray:
+        self.evaluate()
+        glBindBuffer(GL_SHADER_STORAGE_BUFFER, self.buffer.handle)
+        return np.frombuffer(
+            glGetBufferSubData(GL_SHADER_STORAGE_BUFFER, 0, self.size * 4),
+            dtype=np.float32,
+        )
+
+    def delete(self) -> None:
+        if self.owned and self.buffer is not None:
+            self.buffer.delete()
+        self.buffer = None
+
+    def apply(self, operation: str, *operands: Any) -> "GPUArray":
+        for operand in operands:
+            if isinstance(operand, (GPUArray, np.ndarray)):
+                if operand.size != self.size:
+                    raise Exception(
+                        "Mismatching GPUArray sizes: %d and %d."
+                        % (self.size, operand.size)
+                    )
+        return GPUArray(
+            size=self.size, operation=operation, operands=[self] + list(operands)
+        )
+
+    def reflect(self, operation: str, other: Any) -> "GPUArray":
+        if isinstance(other, np.ndarray) and other.size != self.size:
+            raise Exception(
+                "Mismatching GPUArray sizes: %d and %d." % (other.size, self.size)
+            )
+        return GPUArray(size=self.size, operation=operation, operands=[other, self])
+
+    def __add__(self, other: Any) -> "GPUArray":
+        return self.apply("add", other)
+
+    def __radd__(self, other: Any) -> "GPUArray":
+        return self.reflect("add", other)
+
+    def __sub__(self, other: Any) -> "GPUArray":
+        return self.apply("sub", other)
+
+    def __rsub__(self, other: Any) -> "GPUArray":
+        return self.reflect("sub", other)
+
+    def __mul__(self, other: Any) -> "GPUArray":
+        return self.apply("mul", other)
+
+    def __rmul__(self, other: Any) -> "GPUArray":
+        return self.reflect("mul", other)
+
+    def __truediv__(self, other: Any) -> "GPUArray":
+        return self.apply("div", other)
+
+    def __rtruediv__(self, other: Any) -> "GPUArray":
+        return self.reflect("div", other)
+
+    def __pow__(self, other: Any) -> "GPUArray":
+        return self.apply("pow", other)
+
+    def __neg__(self) -> "GPUArray":
+        return self.apply("neg")
+
+    def __abs__(self) -> "GPUArray":
+        return self.apply("abs")
+
+    def __lt__(self, other: Any) -> "GPUArray":
+        return self.apply("lt", other)
+
+    def __le__(self, other: Any) -> "GPUArray":
+        return self.apply("le", other)
+
+    def __gt__(self, other: Any) -> "GPUArray":
+        return self.apply("gt", other)
+
+    def __ge__(self, other: Any) -> "GPUArray":
+        return self.apply("ge", other)
+
+    def __eq__(self, other: Any) -> "GPUArray":
+        return self.apply("eq", other)
+
+    def __ne__(self, other: Any) -> "GPUArray":
+        return self.apply("ne", other)
+
+    __hash__ = None
+
+
+def where(condition: GPUArray, a: Any, b: Any) -> GPUArray:
+    return condition.apply("where", a, b)
+
+
+def minimum(a: GPUArray, b: Any) -> GPUArray:
+    return a.apply("minimum", b)
+
+
+def maximum(a: GPUArray, b: Any) -> GPUArray:
+    return a.apply("maximum", b)
+
+
+def sqrt(a: GPUArray) -> GPUArray:
+    return a.apply("sqrt")
+
+
+def exp(a: GPUArray) -> GPUArray:
+    return a.apply("exp")
+
+
+def log(a: GPUArray) -> GPUArray:
+    return a.apply("log")
+
+
+def sin(a: GPUArray) -> GPUArray:
+    return a.apply("sin")
+
+
+def cos(a: GPUArray) -> GPUArray:
+    return a.apply("cos")
+
+
+def floor(a: GPUArray) -> GPUArray:
+    return a.apply("floor")
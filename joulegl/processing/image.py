@@ -0,0 +1,146 @@
+import math
+from typing import Any, Dict, List, Tuple
+
+from OpenGL.GL import *
+
+from ..opengl_helper.base.shader_parser import ShaderParser
+from ..opengl_helper.compute.shader import ComputeShader, ComputeShaderSetting
+from ..opengl_helper.compute.shader_handler import ComputeShaderHandler
+from ..opengl_helper.texture import Texture
+from ..utility.definitions import LIBRARY_SHADER_PATH
+
+PYRAMID_AVERAGE: int = 0
+PYRAMID_MIN_MAX: int = 1
+PYRAMID_LEVELS_PER_DISPATCH: int = 2
+
+
+def pyramid_sizes(
+    width: int, height: int, levels: int | None = None
+) -> List[Tuple[int, int]]:
+    sizes: List[Tuple[int, int]] = []
+    while (width > 1 or height > 1) and (levels is None or len(sizes) < levels):
+        width, height = math.ceil(width / 2), math.ceil(height / 2)
+        sizes.append((width, height))
+    return sizes
+
+
+class ImageProcessor:
+    def __init__(self, shader_handler: ComputeShaderHandler | None = None) -> None:
+        self.owns_handler: bool = shader_handler is None
+        self.shader_handler: ComputeShaderHandler = (
+            ComputeShaderHandler(LIBRARY_SHADER_PATH)
+            if shader_handler is None
+            else shader_handler
+        )
+        self.scratch_textures: Dict[Tuple[str, int], Texture] = dict()
+        self.parsers: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], ShaderParser] = (
+            dict()
+        )
+
+    def shader(self, name: str, static_vars: Dict[str, Any]) -> ComputeShader:
+        key: Tuple[str, Tuple[Tuple[str, Any], ...]] = (
+            name,
+            tuple(sorted(static_vars.items())),
+        )
+        if key not in self.parsers:
+            parser: ShaderParser = ShaderParser()
+            parser.set_static(static_vars)
+            self.parsers[key] = parser
+        return self.shader_handler.create(
+            ComputeShaderSetting(name, [name + ".comp"]), self.parsers[key]
+        )
+
+    def scratch(self, name: str, level: int, width: int, height: int) -> Texture:
+        key: Tuple[str, int] = (name, level)
+        texture: Texture | None = self.scratch_textures.get(key)
+        if texture is None or texture.width != width or texture.height != height:
+            if texture is not None:
+                texture.delete()
+            texture = Texture(width, height)
+            texture.setup(None, 0)
+            self.scratch_textures[key] = texture
+        return texture
+
+    @staticmethod
+    def image_barrier() -> None:
+        glMemoryBarrier(
+            GL_SHADER_IMAGE_ACCESS_BARRIER_BIT | GL_TEXTURE_FETCH_BARRIER_BIT
+        )
+
+    def blur(
+        self,
+        source: Texture,
+        target: Texture | None = None,
+        radius: int = 4,
+        sigma: float | None = None,
+    ) -> Texture:
+        if target is None:
+            target = self.scratch("blur", 0, source.width, source.height)
+        intermediate: Texture = self.scratch(
+            "blur_pass", 0, source.width, source.height
+        )
+        shader: ComputeShader = self.shader("blur", {"radius": radius})
+        shader.use()
+        shader.set_uniform_data(
+            [("sigma", radius / 2.0 if sigma is None else sigma, "float")]
+        )
+
+        # both passes run along the tile axis, the vertical pass dispatches transposed
+        for pass_source, pass_target, axis, size in [
+            (source, intermediate, 0, (source.width, source.height)),
+            (intermediate, target, 1, (source.height, source.width)),
+        ]:
+            pass_source.bind_as_image("read", 0)
+            pass_target.bind_as_image("write", 1)
+            shader.set_uniform_data([("axis", axis, "int")])
+            shader.compute_image(*size)
+            self.image_barrier()
+        return target
+
+    def pyramid(self, texture: Texture, levels: int | None = None) -> List[Texture]:
+        return self.build_pyramid("pyramid", PYRAMID_AVERAGE, texture, levels)
+
+    def depth_pyramid(
+        self, texture: Texture, levels: int | None = None
+    ) -> List[Texture]:
+        return self.build_pyramid("depth_pyramid", PYRAMID_MIN_MAX, texture, levels)
+
+    def build_pyramid(
+        self, name: str, mode: int, texture: Texture, levels: int | None
+    ) -> List[Texture]:
+        textures: List[Texture] = [
+            self.scratch(name, level, width, height)
+            for level, (width, height) in enumerate(
+                pyramid_sizes(texture.width, texture.height, levels)
+            )
+        ]
+        shader: ComputeShader = self.shader("pyramid", {"mode": mode})
+        shader.use()
+
+        source: Texture = texture
+        for level in range(0, len(textures), PYRAMID_LEVELS_PER_DISPATCH):
+            level_count: int = min(PYRAMID_LEVELS_PER_DISPATCH, len(textures) - level)
+            source.bind_as_image("read", 0)
+            textures[level].bind_as_image("write", 1)
+            textures[level + level_count - 1].bind_as_image("write", 2)
+            shader.set_uniform_data(
+                [
+                    (
+                        "source_is_depth",
+                        int(mode == PYRAMID_MIN_MAX and level == 0),
+                        "int",
+                    ),
+                    ("level_count", level_count, "int"),
+                ]
+            )
+            shader.compute_image(source.width, source.height)
+            self.image_barrier()
+            source = textures[level + level_count - 1]
+        return textures
+
+    def delete(self) -> None:
+        for texture in self.scratch_textures.values():
+            texture.delete()
+        self.scratch_textures = dict()
+        if self.owns_handler:
+            self.shader_handler.delete()
@@ -0,0 +1,170 @@
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+from ..opengl_helper.base.config import ShaderConfig
+from ..opengl_helper.base.data_set import BaseShaderSet
+from ..opengl_helper.base.shader_parser import ShaderParser
+from ..opengl_helper.buffer import BufferObject, BufferType
+from ..opengl_helper.compute.shader import ComputeShaderSetting
+from ..opengl_helper.compute.shader_handler import ComputeShaderHandler
+from ..opengl_helper.compute.utility import generate_compute_function
+from ..opengl_helper.vertex_data_handler import VertexDataHandler
+from ..utility.definitions import LIBRARY_SHADER_PATH
+from .processor import ComputePass, ComputeProcessor
+
+PARTICLE_BUFFERS: List[str] = ["positions", "velocities", "free_list"]
+
+
+def particle_parser(
+    emitter: str,
+    integrator: str,
+    forces: List[str],
+    include_dirs: List[str] | None = None,
+) -> ShaderParser:
+    # every force is an include defining a function of the same name
+    parser: ShaderParser = ShaderParser(include_dirs)
+    parser.set_static(
+        {
+            "emitter_include": '#include "%s.glsl"' % emitter,
+            "integrator_include": '#include "%s.glsl"' % integrator,
+            "force_includes": "\n".join(
+                '#include "%s.glsl"' % force for force in forces
+            ),
+            "force_sum": " + ".join(
+                ["vec3(0.0)"] + ["%s(position, velocity)" % force for force in forces]
+            ),
+        }
+    )
+    return parser
+
+
+class ParticleSystem(ComputeProcessor):
+    def __init__(
+        self,
+        capacity: int,
+        emitter: str = "emit_sphere",
+        integrator: str = "integrate_euler",
+        forces: List[str] | None = None,
+        include_dirs: List[str] | None = None,
+        shader_handler: ComputeShaderHandler | None = None,
+    ) -> None:
+        self.owns_handler: bool = shader_handler is None
+        super().__init__(
+            particle_parser(
+                emitter,
+                integrator,
+                ["force_gravity"] if forces is None else forces,
+                include_dirs,
+            ),
+            (
+                ComputeShaderHandler(LIBRARY_SHADER_PATH)
+                if shader_handler is None
+                else shader_handler
+            ),
+        )
+        self.capacity: int = capacity
+        self.emission_rate: float = 0.0
+        self.emission_remainder: float = 0.0
+        self.pending_emissions: int = 0
+        self.emission_count: int = 0
+        self.dt: float = 0.0
+        self.frame: int = 0
+        self.uniforms: Dict[str, Tuple[Any, str]] = dict()
+
+        self.positions: BufferObject = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+        self.velocities: BufferObject = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+        self.free_list: BufferObject = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+        self.reset()
+
+        self.set_shader(
+            [
+                ComputeShaderSetting("update", ["particles/update.comp"]),
+                ComputeShaderSetting("emit", ["particles/emit.comp"]),
+            ]
+        )
+        self.data_handler: VertexDataHandler = VertexDataHandler(
+            [(self.positions, 0), (self.velocities, 1), (self.free_list, 2)]
+        )
+
+        def generate_element_count_func(
+            particles: ParticleSystem, emission: bool
+        ) -> Callable:
+            def element_count_func() -> int:
+                return particles.emission_count if emission else particles.capacity
+
+            return element_count_func
+
+        for name, emission in [("update", False), ("emit", True)]:
+            self.execute_funcs[name] = generate_compute_function(
+                self.shaders[name], barrier=False
+            )
+            self.element_count_funcs[name] = generate_element_count_func(self, emission)
+            self.create_sets(self.data_handler, name)
+
+        for buffer_name, buffer in zip(
+            PARTICLE_BUFFERS, [self.positions, self.velocities, self.free_list]
+        ):
+            self.add_buffer(buffer_name, buffer)
+        # particles dying in the update hand their slots to this frame's emission
+        self.add_pass(ComputePass("update", PARTICLE_BUFFERS, PARTICLE_BUFFERS))
+        self.add_pass(ComputePass("emit", PARTICLE_BUFFERS, PARTICLE_BUFFERS))
+
+    def reset(self) -> None:
+        self.positions.load_empty(np.float32, self.capacity * 4)
+        self.velocities.load_empty(np.float32, self.capacity * 4)
+        free_list: np.ndarray = np.empty(self.capacity + 1, dtype=np.uint32)
+        free_list[0] = self.capacity
+        free_list[1:] = np.arange(self.capacity - 1, -1, -1, dtype=np.uint32)
+        self.free_list.load(free_list)
+        self.emission_remainder = 0.0
+        self.pending_emissions = 0
+        self.frame = 0
+
+    def set_uniform(self, name: str, value: Any, uniform_type: str) -> None:
+        self.uniforms[name] = (value, uniform_type)
+
+    def emit(self, count: int) -> None:
+        self.pending_emissions += count
+
+    def step(self, dt: float, config: ShaderConfig | None = None) -> None:
+        self.dt = dt
+        self.emission_remainder += self.emission_rate * dt
+        emitted: int = int(self.emission_remainder)
+        self.emission_remainder -= emitted
+        self.emission_count = emitted + self.pending_emissions
+        self.pending_emissions = 0
+        self.run_pipeline(config)
+        self.frame += 1
+
+    def alive_count(self) -> int:
+        glMemoryBarrier(GL_BUFFER_UPDATE_BARRIER_BIT)
+        glBindBuffer(GL_SHADER_STORAGE_BUFFER, self.free_list.handle)
+        free_count: int = int(
+            np.frombuffer(
+                glGetBufferSubData(GL_SHADER_STORAGE_BUFFER, 0, 4), dtype=np.int32
+            )[0]
+        )
+        return self.capacity - free_count
+
+    def process(self, set_name: str, config: ShaderConfig | None = None) -> None:
+        current_set: BaseShaderSet = self.sets[set_name]
+        current_set.set_uniform_data(
+            [("dt", self.dt, "float"), ("frame", self.frame, "int")]
+            + [
+                (name, value, uniform_type)
+                for name, (value, uniform_type) in self.uniforms.items()
+            ]
+        )
+        current_set.set_uniform_labeled_data(config)
+        current_set.use()
+
+    def delete(self) -> None:
+        self.data_handler.delete()
+        self.release_shaders()
+        self.delete_pipeline()
+        for buffer in [self.positions, self.velocities, self.free_list]:
+            buffer.delete()
+        if self.owns_handler:
+            self.shader_handler.delete()
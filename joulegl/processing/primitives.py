@@ -0,0 +1,301 @@
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+from ..opengl_helper.base.shader_parser import ShaderParser
+from ..opengl_helper.buffer import BufferObject, BufferType, OverflowingBufferObject
+from ..opengl_helper.compute.shader import ComputeShader, ComputeShaderSetting
+from ..opengl_helper.compute.shader_handler import ComputeShaderHandler
+from ..utility.definitions import LIBRARY_SHADER_PATH
+
+SCAN_BLOCK_SIZE: int = 512
+SORT_BLOCK_SIZE: int = 256
+REDUCE_BLOCK_SIZE: int = 512
+RADIX_BITS: int = 4
+
+
+class Reduction:
+    def __init__(
+        self, count: int, sum: np.ndarray, minimum: np.ndarray, maximum: np.ndarray
+    ) -> None:
+        self.count: int = count
+        self.sum: np.ndarray = sum
+        self.minimum: np.ndarray = minimum
+        self.maximum: np.ndarray = maximum
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self.sum / max(self.count, 1)
+
+    @property
+    def bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.minimum[:3], self.maximum[:3]
+
+    @property
+    def center(self) -> np.ndarray:
+        return (self.minimum[:3] + self.maximum[:3]) * 0.5
+
+
+class ComputePrimitives:
+    def __init__(self, shader_handler: ComputeShaderHandler | None = None) -> None:
+        self.owns_handler: bool = shader_handler is None
+        self.shader_handler: ComputeShaderHandler = (
+            ComputeShaderHandler(LIBRARY_SHADER_PATH)
+            if shader_handler is None
+            else shader_handler
+        )
+        self.scratch_buffers: Dict[Tuple[str, int], BufferObject] = dict()
+        self.predicate_parsers: Dict[str, ShaderParser] = dict()
+
+    def shader(self, name: str, parser: ShaderParser | None = None) -> ComputeShader:
+        return self.shader_handler.create(
+            ComputeShaderSetting(name, [name + ".comp"]), parser
+        )
+
+    def scratch(
+        self, name: str, level: int, size: int, dtype=np.uint32
+    ) -> BufferObject:
+        key: Tuple[str, int] = (name, level)
+        if key not in self.scratch_buffers:
+            self.scratch_buffers[key] = BufferObject(
+                buffer_type=BufferType.SHADER_STORAGE_BUFFER
+            )
+        self.ensure_size(self.scratch_buffers[key], size, dtype)
+        return self.scratch_buffers[key]
+
+    @staticmethod
+    def ensure_size(buffer: BufferObject, size: int, dtype) -> None:
+        if not buffer.loaded or buffer.size < size * np.dtype(dtype).itemsize:
+            buffer.load_empty(dtype, max(size, 1))
+
+    def run(
+        self,
+        shader: ComputeShader,
+        invocations: int,
+        uniforms: List[Tuple[str, int, str]],
+    ) -> None:
+        shader.use()
+        shader.set_uniform_data(uniforms)
+        shader.compute(invocations, barrier=True)
+
+    def scan(
+        self,
+        input_buffer: BufferObject,
+        output_buffer: BufferObject,
+        count: int,
+        level: int = 0,
+    ) -> None:
+        if count <= 0:
+            return
+        self.ensure_size(output_buffer, count, np.uint32)
+        block_count: int = math.ceil(count / SCAN_BLOCK_SIZE)
+        block_sums: BufferObject = self.scratch("scan_sums", level, block_count)
+
+        input_buffer.bind(0)
+        output_buffer.bind(1)
+        block_sums.bind(2)
+        self.run(
+            self.shader("scan_block"),
+            block_count * SCAN_BLOCK_SIZE // 2,
+            [("value_count", count, "int")],
+        )
+        if block_count > 1:
+            block_offsets: BufferObject = self.scratch(
+                "scan_offsets", level, block_count
+            )
+            self.scan(block_sums, block_offsets, block_count, level + 1)
+            output_buffer.bind(1)
+            block_offsets.bind(2)
+            self.run(
+                self.shader("scan_add"),
+                block_count * SCAN_BLOCK_SIZE // 2,
+                [("value_count", count, "int")],
+            )
+
+    def predicate_parser(self, predicate: str) -> ShaderParser:
+        if predicate not in self.predicate_parsers:
+            parser: ShaderParser = ShaderParser()
+            parser.set_static({"predicate": predicate})
+            self.predicate_parsers[predicate] = parser
+        return self.predicate_parsers[predicate]
+
+    def compact(
+        self,
+        input_buffer: BufferObject,
+        output_buffer: BufferObject,
+        count: int,
+        predicate: str,
+    ) -> int:
+        if count <= 0:
+            return 0
+        self.ensure_size(output_buffer, count * 4, np.float32)
+        flags: BufferObject = self.scratch("compact_flags", 0, count)
+        offsets: BufferObject = self.scratch("compact_offsets", 0, count)
+        compacted_count: BufferObject = self.scratch("compact_count", 0, 1)
+
+        input_buffer.bind(0)
+        flags.bind(1)
+        self.run(
+            self.shader("compact_flag", self.predicate_parser(predicate)), count, []
+        )
+        self.scan(flags, offsets, count)
+
+        input_buffer.bind(0)
+        flags.bind(1)
+        offsets.bind(2)
+        output_buffer.bind(3)
+        compacted_count.bind(4)
+        self.run(self.shader("compact_scatter"), count, [])
+
+        glBindBuffer(GL_SHADER_STORAGE_BUFFER, compacted_count.handle)
+        return int(
+            np.frombuffer(
+                glGetBufferSubData(GL_SHADER_STORAGE_BUFFER, 0, 4), dtype=np.uint32
+            )[0]
+        )
+
+    def sort(
+        self,
+        keys: BufferObject,
+        values: BufferObject | None,
+        count: int,
+        key_bits: int = 32,
+    ) -> None:
+        if count <= 1:
+            return
+        if values is None:
+            values = self.scratch("sort_values", 0, count)
+        block_count: int = math.ceil(count / SORT_BLOCK_SIZE)
+        local_keys: BufferObject = self.scratch("sort_local_keys", 0, count)
+        local_values: BufferObject = self.scratch("sort_local_values", 0, count)
+        histogram: BufferObject = self.scratch("sort_histogram", 0, 16 * block_count)
+        offsets: BufferObject = self.scratch("sort_offsets", 0, 16 * block_count)
+        buffers: List[Tuple[BufferObject, BufferObject]] = [
+            (keys, values),
+            (
+                self.scratch("sort_keys", 0, count),
+                self.scratch("sort_values_swap", 0, count),
+            ),
+        ]
+
+        passes: int = math.ceil(key_bits / RADIX_BITS)
+        for i in range(passes):
+            source_keys, source_values = buffers[i % 2]
+            target_keys, target_values = buffers[(i + 1) % 2]
+            uniforms: List[Tuple[str, int, str]] = [
+                ("value_count", count, "int"),
+                ("shift", i * RADIX_BITS, "int"),
+            ]
+
+            source_keys.bind(0)
+            source_values.bind(1)
+            local_keys.bind(2)
+            local_values.bind(3)
+            histogram.bind(4)
+            self.run(
+                self.shader("radix_sort_local"),
+                block_count * SORT_BLOCK_SIZE,
+                uniforms,
+            )
+            self.scan(histogram, offsets, 16 * block_count)
+
+            local_keys.bind(0)
+            local_values.bind(1)
+            offsets.bind(2)
+            target_keys.bind(3)
+            target_values.bind(4)
+            self.run(
+                self.shader("radix_scatter"),
+                block_count * SORT_BLOCK_SIZE,
+                uniforms,
+            )
+
+        if passes % 2 == 1:
+            for source, target in zip(buffers[1], buffers[0]):
+                glBindBuffer(GL_COPY_READ_BUFFER, source.handle)
+                glBindBuffer(GL_COPY_WRITE_BUFFER, target.handle)
+                glCopyBufferSubData(
+                    GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER, 0, 0, count * 4
+                )
+            glMemoryBarrier(GL_ALL_BARRIER_BITS)
+
+    def reduce(self, buffer: BufferObject, count: int | None = None) -> Reduction:
+        # vec4 elements; overflowing buffers reduce every part into one partial buffer
+        if isinstance(buffer, OverflowingBufferObject):
+            parts: List[Tuple[int, int]] = [
+                (handle, int(size / 16))
+                for handle, size in zip(
+                    buffer.overflowing_handles, buffer.overflowing_sizes
+                )
+            ]
+        else:
+            parts = [(buffer.handle, int(buffer.size / 16) if count is None else count)]
+        parts = [(handle, part_count) for handle, part_count in parts if part_count > 0]
+        total_count: int = sum(part_count for _, part_count in parts)
+        if total_count == 0:
+            return Reduction(
+                0,
+                np.zeros(4, dtype=np.float32),
+                np.full(4, np.inf, dtype=np.float32),
+                np.full(4, -np.inf, dtype=np.float32),
+            )
+
+        shader: ComputeShader = self.shader("reduce")
+        part_blocks: List[int] = [
+            math.ceil(part_count / REDUCE_BLOCK_SIZE) for _, part_count in parts
+        ]
+        partials: BufferObject = self.scratch(
+            "reduce_partials", 0, 12 * sum(part_blocks), np.float32
+        )
+        partials.bind(1)
+        output_offset: int = 0
+        for (handle, part_count), blocks in zip(parts, part_blocks):
+            glBindBufferBase(GL_SHADER_STORAGE_BUFFER, 0, handle)
+            self.run(
+                shader,
+                blocks * REDUCE_BLOCK_SIZE // 2,
+                [
+                    ("value_count", part_count, "int"),
+                    ("output_offset", output_offset, "int"),
+                    ("partial_input", 0, "int"),
+                ],
+            )
+            output_offset += blocks
+
+        level: int = 0
+        while output_offset > 1:
+            blocks: int = math.ceil(output_offset / REDUCE_BLOCK_SIZE)
+            target: BufferObject = self.scratch(
+                "reduce_partials", level % 2 + 1, 12 * blocks, np.float32
+            )
+            partials.bind(0)
+            target.bind(1)
+            self.run(
+                shader,
+                blocks * REDUCE_BLOCK_SIZE // 2,
+                [
+                    ("value_count", output_offset, "int"),
+                    ("output_offset", 0, "int"),
+                    ("partial_input", 1, "int"),
+                ],
+            )
+            partials = target
+            output_offset = blocks
+            level += 1
+
+        glBindBuffer(GL_SHADER_STORAGE_BUFFER, partials.handle)
+        result: np.ndarray = np.frombuffer(
+            glGetBufferSubData(GL_SHADER_STORAGE_BUFFER, 0, 48), dtype=np.float32
+        ).reshape(3, 4)
+        return Reduction(
+            total_count, result[0].copy(), result[1].copy(), result[2].copy()
+        )
+
+    def delete(self) -> None:
+        for buffer in self.scratch_buffers.values():
+            buffer.delete()
+        self.scratch_buffers = dict()
+        if self.owns_handler:
+            self.shader_handler.delete()
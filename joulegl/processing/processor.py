@@ -1,15 +1,304 @@
 import abc
+import ctypes
+from typing import Any, Dict, List, Set
+
+from OpenGL.GL import *
 
 from ..opengl_helper.base.config import ShaderConfig
 from ..opengl_helper.base.shader_parser import ShaderParser
+from ..opengl_helper.buffer import AppendBuffer, BufferObject, IndirectBufferObject
+from ..opengl_helper.checkpoint import Checkpoint, CheckpointWriter, save_checkpoint
 from ..opengl_helper.compute.shader_handler import ComputeShaderHandler
+from ..opengl_helper.transform_feedback.shader_handler import (
+    TransformFeedbackShaderHandler,
+)
+from ..opengl_helper.transform_feedback.utility import PrimitiveCountQuery
 from ..rendering.renderer import BaseProcessor
+from .cpu import CPUExecutor, CPUKernel, CPUSet
+
+
+class ComputePass:
+    def __init__(
+        self,
+        name: str,
+        inputs: List[str] | None = None,
+        outputs: List[str] | None = None,
+        swaps: List[str] | None = None,
+        set_name: str | None = None,
+    ) -> None:
+        self.name: str = name
+        self.set_name: str = name if set_name is None else set_name
+        self.inputs: List[str] = [] if inputs is None else inputs
+        self.outputs: List[str] = [] if outputs is None else outputs
+        self.swaps: List[str] = [] if swaps is None else swaps
+
+
+class PassStats:
+    def __init__(self) -> None:
+        self.query: int = int(glGenQueries(1)[0])
+        self.query_pending: bool = False
+        self.result: ctypes.c_uint64 = ctypes.c_uint64()
+        self.pending_elements: int = 0
+        self.elements: int = 0
+        self.gpu_time: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.elements / self.gpu_time if self.gpu_time > 0.0 else 0.0
+
+    def begin(self, elements: int) -> bool:
+        if self.query_pending:
+            if not glGetQueryObjectiv(self.query, GL_QUERY_RESULT_AVAILABLE):
+                return False
+            self.elements = self.pending_elements
+            # 64 bit result, 32 bit nanoseconds would wrap after about 4.3 seconds
+            glGetQueryObjectui64v(
+                self.query, GL_QUERY_RESULT, ctypes.byref(self.result)
+            )
+            self.gpu_time = self.result.value / 1e9
+        self.pending_elements = elements
+        glBeginQuery(GL_TIME_ELAPSED, self.query)
+        return True
+
+    def end(self) -> None:
+        glEndQuery(GL_TIME_ELAPSED)
+        self.query_pending = True
+
+    def delete(self) -> None:
+        glDeleteQueries(1, [self.query])
 
 
 class ComputeProcessor(BaseProcessor):
-    def __init__(self, shader_parser: ShaderParser | None = None) -> None:
-        super().__init__(ComputeShaderHandler(), shader_parser)
+    def __init__(
+        self,
+        shader_parser: ShaderParser | None = None,
+        shader_handler: ComputeShaderHandler | None = None,
+    ) -> None:
+        super().__init__(
+            ComputeShaderHandler() if shader_handler is None else shader_handler,
+            shader_parser,
+        )
+        __metaclass__ = abc.ABCMeta
+        self.pipeline_buffers: Dict[str, BufferObject] = dict()
+        self.passes: List[ComputePass] = []
+        self.pass_stats: Dict[str, PassStats] = dict()
+        self.pipeline: List[ComputePass] | None = None
+        self.barrier_count: int = 0
+        self.cpu_executor: CPUExecutor | None = None
+
+    def create_cpu_set(
+        self,
+        set_name: str,
+        kernel: CPUKernel,
+        inputs: List[BufferObject],
+        outputs: List[BufferObject],
+        count_func_name: str | None = None,
+        executor: CPUExecutor | None = None,
+    ) -> None:
+        if executor is None:
+            if self.cpu_executor is None:
+                self.cpu_executor = CPUExecutor()
+            executor = self.cpu_executor
+        self.sets[set_name] = CPUSet(
+            kernel,
+            executor,
+            inputs,
+            outputs,
+            self.element_count_funcs[
+                set_name if count_func_name is None else count_func_name
+            ],
+        )
+
+    def add_buffer(self, name: str, buffer: BufferObject) -> None:
+        self.pipeline_buffers[name] = buffer
+
+    def add_pass(self, compute_pass: ComputePass) -> None:
+        for buffer_name in (
+            compute_pass.inputs + compute_pass.outputs + compute_pass.swaps
+        ):
+            if buffer_name not in self.pipeline_buffers:
+                raise Exception(
+                    "Pipeline buffer '%s' of pass '%s' not defined."
+                    % (buffer_name, compute_pass.name)
+                )
+        self.passes.append(compute_pass)
+        self.pipeline = None
+
+    def pipeline_order(self) -> List[ComputePass]:
+        if self.pipeline is not None:
+            return self.pipeline
+        # read after write and write after write follow the declaration order
+        dependencies: Dict[int, Set[int]] = {i: set() for i in range(len(self.passes))}
+        for i, compute_pass in enumerate(self.passes):
+            for j, other_pass in enumerate(self.passes[:i]):
+                if set(other_pass.outputs) & set(
+                    compute_pass.inputs + compute_pass.outputs
+                ):
+                    dependencies[i].add(j)
+
+        def depends_on(i: int, j: int) -> bool:
+            pending: List[int] = [i]
+            visited: Set[int] = set()
+            while len(pending) > 0:
+                current: int = pending.pop()
+                if current == j:
+                    return True
+                if current not in visited:
+                    visited.add(current)
+                    pending.extend(dependencies[current])
+            return False
+
+        # an input no earlier pass writes is produced by its later declared writers,
+        # unless such a writer already consumes this pass, then the input is
+        # feedback from the previous run
+        for i, compute_pass in enumerate(self.passes):
+            for buffer_name in compute_pass.inputs:
+                if any(
+                    buffer_name in other_pass.outputs for other_pass in self.passes[:i]
+                ):
+                    continue
+                for j in range(i + 1, len(self.passes)):
+                    if buffer_name in self.passes[j].outputs and not depends_on(j, i):
+                        dependencies[i].add(j)
+        # a writer waits for the earlier declared readers it doesn't produce for
+        for i, compute_pass in enumerate(self.passes):
+            for j, other_pass in enumerate(self.passes[:i]):
+                if set(other_pass.inputs) & set(compute_pass.outputs):
+                    if not depends_on(j, i):
+                        dependencies[i].add(j)
+
+        order: List[ComputePass] = []
+        done: Set[int] = set()
+        while len(done) < len(self.passes):
+            ready: int = next(
+                i
+                for i in range(len(self.passes))
+                if i not in done and dependencies[i] <= done
+            )
+            done.add(ready)
+            order.append(self.passes[ready])
+        self.pipeline = order
+        return order
+
+    def barrier(self, buffer_names: Set[str], final: bool = False) -> None:
+        barrier_bits: int = GL_SHADER_STORAGE_BARRIER_BIT
+        if any(
+            isinstance(self.pipeline_buffers[buffer_name], IndirectBufferObject)
+            for buffer_name in buffer_names
+        ):
+            barrier_bits |= GL_COMMAND_BARRIER_BIT
+        if any(
+            isinstance(self.pipeline_buffers[buffer_name], AppendBuffer)
+            for buffer_name in buffer_names
+        ):
+            barrier_bits |= GL_ATOMIC_COUNTER_BARRIER_BIT | GL_COMMAND_BARRIER_BIT
+        if final:
+            barrier_bits |= (
+                GL_VERTEX_ATTRIB_ARRAY_BARRIER_BIT | GL_ELEMENT_ARRAY_BARRIER_BIT
+            )
+        glMemoryBarrier(barrier_bits)
+        self.barrier_count += 1
+
+    def run_pipeline(
+        self, config: ShaderConfig | None = None, profile: bool = False
+    ) -> None:
+        dirty: Set[str] = set()
+        for compute_pass in self.pipeline_order():
+            used: Set[str] = dirty.intersection(
+                compute_pass.inputs + compute_pass.outputs
+            )
+            if len(used) > 0:
+                self.barrier(used)
+                dirty = set()
+
+            measured: bool = False
+            if profile:
+                if compute_pass.name not in self.pass_stats:
+                    self.pass_stats[compute_pass.name] = PassStats()
+                measured = self.pass_stats[compute_pass.name].begin(
+                    self.sets[compute_pass.set_name].element_count_func()
+                )
+            self.process(compute_pass.set_name, config)
+            if measured:
+                self.pass_stats[compute_pass.name].end()
+
+            dirty.update(compute_pass.outputs)
+            for buffer_name in compute_pass.swaps:
+                self.pipeline_buffers[buffer_name].swap()
+        if len(dirty) > 0:
+            self.barrier(dirty, final=True)
+
+    def throughput(self) -> Dict[str, float]:
+        throughput: Dict[str, float] = {
+            name: stats.throughput for name, stats in self.pass_stats.items()
+        }
+        # cpu sets are timed on the host, gpu queries would only see the upload
+        for compute_pass in self.passes:
+            current_set = self.sets.get(compute_pass.set_name)
+            if isinstance(current_set, CPUSet):
+                throughput[compute_pass.name] = current_set.stats.throughput
+        return throughput
+
+    def save_checkpoint(
+        self, path: str, metadata: Dict[str, Any] | None = None, wait: bool = False
+    ) -> CheckpointWriter:
+        return save_checkpoint(
+            path, self.pipeline_buffers, metadata=metadata, wait=wait
+        )
+
+    def restore_checkpoint(self, path: str) -> Checkpoint:
+        checkpoint: Checkpoint = Checkpoint(path)
+        checkpoint.restore(
+            {
+                name: buffer
+                for name, buffer in self.pipeline_buffers.items()
+                if name in checkpoint.sections
+            }
+        )
+        return checkpoint
+
+    def delete_pipeline(self) -> None:
+        for stats in self.pass_stats.values():
+            stats.delete()
+        self.pass_stats = dict()
+        if self.cpu_executor is not None:
+            self.cpu_executor.delete()
+            self.cpu_executor = None
+
+    @abc.abstractmethod
+    def process(self, set_name: str, config: ShaderConfig | None = None) -> None:
+        raise NotImplementedError
+
+
+class TransformFeedbackProcessor(BaseProcessor):
+    def __init__(
+        self,
+        shader_parser: ShaderParser | None = None,
+        shader_handler: TransformFeedbackShaderHandler | None = None,
+    ) -> None:
+        super().__init__(
+            (
+                TransformFeedbackShaderHandler()
+                if shader_handler is None
+                else shader_handler
+            ),
+            shader_parser,
+        )
         __metaclass__ = abc.ABCMeta
+        self.queries: Dict[str, PrimitiveCountQuery] = dict()
+
+    def add_query(self, name: str) -> PrimitiveCountQuery:
+        if name not in self.queries:
+            self.queries[name] = PrimitiveCountQuery()
+        return self.queries[name]
+
+    def primitives_written(self, name: str, wait: bool = False) -> int:
+        return self.queries[name].update(wait)
+
+    def delete_queries(self) -> None:
+        for query in self.queries.values():
+            query.delete()
+        self.queries = dict()
 
     @abc.abstractmethod
     def process(self, set_name: str, config: ShaderConfig | None = None) -> None:
@@ -0,0 +1,127 @@
+import math
+from typing import Any, List, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+from ..opengl_helper.buffer import BufferObject
+from .primitives import ComputePrimitives
+
+SPATIAL_HASH_BINDING: int = 4
+
+
+def grid_for_bounds(
+    minimum: np.ndarray, maximum: np.ndarray, cell_size: float
+) -> Tuple[Tuple[float, float, float], Tuple[int, int, int]]:
+    size: List[int] = [
+        max(1, math.ceil((float(high) - float(low)) / cell_size))
+        for low, high in zip(minimum[:3], maximum[:3])
+    ]
+    return (
+        (float(minimum[0]), float(minimum[1]), float(minimum[2])),
+        (size[0], size[1], size[2]),
+    )
+
+
+class SpatialHash:
+    def __init__(
+        self,
+        cell_size: float,
+        grid_origin: Tuple[float, float, float],
+        grid_size: Tuple[int, int, int],
+        primitives: ComputePrimitives | None = None,
+    ) -> None:
+        self.owns_primitives: bool = primitives is None
+        self.primitives: ComputePrimitives = (
+            ComputePrimitives() if primitives is None else primitives
+        )
+        self.cell_size: float = cell_size
+        self.grid_origin: Tuple[float, float, float] = grid_origin
+        self.grid_size: Tuple[int, int, int] = grid_size
+        self.point_count: int = 0
+
+    @property
+    def cell_count(self) -> int:
+        return self.grid_size[0] * self.grid_size[1] * self.grid_size[2]
+
+    @property
+    def uniforms(self) -> List[Tuple[str, Any, str]]:
+        return [
+            ("grid_origin", list(self.grid_origin), "vec3"),
+            ("grid_cell_size", self.cell_size, "float"),
+            ("grid_size", list(self.grid_size), "ivec3"),
+        ]
+
+    @property
+    def cell_starts(self) -> BufferObject:
+        return self.primitives.scratch("grid_cell_starts", 0, self.cell_count)
+
+    @property
+    def cell_ends(self) -> BufferObject:
+        return self.primitives.scratch("grid_cell_ends", 0, self.cell_count)
+
+    @property
+    def sorted_indices(self) -> BufferObject:
+        return self.primitives.scratch("grid_sorted_indices", 0, self.point_count)
+
+    @property
+    def sorted_positions(self) -> BufferObject:
+        return self.primitives.scratch(
+            "grid_sorted_positions", 0, self.point_count * 4, np.float32
+        )
+
+    def fit(self, minimum: np.ndarray, maximum: np.ndarray) -> None:
+        self.grid_origin, self.grid_size = grid_for_bounds(
+            minimum, maximum, self.cell_size
+        )
+
+    def build(self, positions: BufferObject, count: int) -> None:
+        # counting sort: per cell counts with a rank per point, a scan over the
+        # counts gives the cell starts and every point scatters to start + rank
+        self.point_count = count
+        cell_counts: BufferObject = self.primitives.scratch(
+            "grid_cell_counts", 0, self.cell_count
+        )
+        point_keys: BufferObject = self.primitives.scratch("grid_point_keys", 0, count)
+        point_ranks: BufferObject = self.primitives.scratch(
+            "grid_point_ranks", 0, count
+        )
+        glBindBuffer(GL_SHADER_STORAGE_BUFFER, cell_counts.handle)
+        glClearBufferData(
+            GL_SHADER_STORAGE_BUFFER, GL_R32UI, GL_RED_INTEGER, GL_UNSIGNED_INT, None
+        )
+        glMemoryBarrier(GL_SHADER_STORAGE_BARRIER_BIT)
+
+        positions.bind(0)
+        point_keys.bind(1)
+        point_ranks.bind(2)
+        cell_counts.bind(3)
+        self.primitives.run(self.primitives.shader("grid_count"), count, self.uniforms)
+
+        self.primitives.scan(cell_counts, self.cell_starts, self.cell_count)
+
+        cell_counts.bind(0)
+        self.bind()
+        self.primitives.run(
+            self.primitives.shader("grid_cell_ends"), self.cell_count, []
+        )
+
+        positions.bind(0)
+        point_keys.bind(1)
+        point_ranks.bind(2)
+        self.primitives.run(self.primitives.shader("grid_scatter"), count, [])
+
+    def bind(self) -> None:
+        for offset, buffer in enumerate(
+            [
+                self.cell_starts,
+                self.cell_ends,
+                self.sorted_indices,
+                self.sorted_positions,
+            ]
+        ):
+            buffer.bind(SPATIAL_HASH_BINDING + offset)
+
+    def delete(self) -> None:
+        if self.owns_primitives:
+            self.primitives.delete()
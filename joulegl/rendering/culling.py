@@ -0,0 +1,183 @@
+from typing import Any, List, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+from ..opengl_helper.base.shader_parser import ShaderParser
+from ..opengl_helper.buffer import BufferObject, BufferType, IndirectBufferObject
+from ..processing.primitives import ComputePrimitives
+from ..utility.camera import Camera
+
+
+def frustum_planes(projection: np.ndarray, view: np.ndarray) -> np.ndarray:
+    # matrices are stored for row vectors, the clip coordinates are p @ view @ projection
+    view_projection: np.ndarray = view @ projection
+    planes: np.ndarray = np.array(
+        [
+            view_projection[:, 3] + side * view_projection[:, axis]
+            for axis in range(3)
+            for side in [-1.0, 1.0]
+        ],
+        dtype=np.float32,
+    )
+    return planes / np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+
+
+def spheres_in_frustum(
+    planes: np.ndarray, centers: np.ndarray, radii: np.ndarray | float
+) -> np.ndarray:
+    distances: np.ndarray = centers @ planes[:, :3].T + planes[:, 3]
+    return np.all(distances >= -np.reshape(radii, (-1, 1)), axis=1)
+
+
+def projected_sizes(
+    projection: np.ndarray,
+    view: np.ndarray,
+    centers: np.ndarray,
+    radii: np.ndarray | float,
+    screen_height: float,
+) -> np.ndarray:
+    # radius in pixels of spheres in front of the camera
+    depths: np.ndarray = -(
+        np.concatenate([centers, np.ones((len(centers), 1))], axis=1) @ view
+    )[:, 2]
+    return (
+        np.asarray(radii)
+        * projection[1, 1]
+        * screen_height
+        * 0.5
+        / np.maximum(depths, 0.0001)
+    )
+
+
+def tier_expression(tier_sizes: List[float]) -> str:
+    # tiers are ordered by decreasing projected size, the last tier takes the rest
+    expression: str = "%du" % len(tier_sizes)
+    for tier in reversed(range(len(tier_sizes))):
+        expression = "(size >= %r ? %du : %s)" % (
+            float(tier_sizes[tier]),
+            tier,
+            expression,
+        )
+    return expression
+
+
+class FrustumCuller:
+    def __init__(
+        self,
+        radius: str = "cull_radius",
+        instance_vertices: int | List[int] = 0,
+        tier_sizes: List[float] | None = None,
+        primitives: ComputePrimitives | None = None,
+    ) -> None:
+        # the radius expression can use the element (vec4) and the uniforms,
+        # tier sizes are the minimal projected radii in pixels of each lod tier,
+        # instance vertices can be given per tier to draw some tiers instanced
+        self.owns_primitives: bool = primitives is None
+        self.primitives: ComputePrimitives = (
+            ComputePrimitives() if primitives is None else primitives
+        )
+        self.tier_sizes: List[float] = [] if tier_sizes is None else tier_sizes
+        self.instance_vertices: List[int] = (
+            list(instance_vertices)
+            if isinstance(instance_vertices, list)
+            else [instance_vertices] * self.tier_count
+        )
+        if len(self.instance_vertices) != self.tier_count:
+            raise Exception(
+                "Culler with %d tiers needs instance vertices for every tier."
+                % self.tier_count
+            )
+        self.parser: ShaderParser = ShaderParser()
+        self.parser.set_static(
+            {
+                "radius": radius,
+                "counters": ", ".join(
+                    "1u" if vertices > 0 else "0u"
+                    for vertices in self.instance_vertices
+                ),
+                "tier": tier_expression(self.tier_sizes),
+            }
+        )
+        self.visible_elements: BufferObject = BufferObject(
+            BufferType.SHADER_STORAGE_BUFFER
+        )
+        self.visible_indices: BufferObject = BufferObject(
+            BufferType.SHADER_STORAGE_BUFFER
+        )
+        self.command: IndirectBufferObject = IndirectBufferObject()
+        self.command.set_commands(self.empty_commands(0))
+
+    @property
+    def tier_count(self) -> int:
+        return len(self.tier_sizes) + 1
+
+    def empty_commands(self, capacity: int) -> List[Tuple[int, int, int, int]]:
+        # every tier owns a region of capacity elements, its command starts there
+        return [
+            (
+                (vertices, 0, 0, tier * capacity)
+                if vertices > 0
+                else (0, 1, tier * capacity, 0)
+            )
+            for tier, vertices in enumerate(self.instance_vertices)
+        ]
+
+    def set_instance_vertices(self, instance_vertices: int, tier: int = 0) -> None:
+        # the counted command field is compiled in, only the vertex count can change
+        if (instance_vertices > 0) != (self.instance_vertices[tier] > 0):
+            raise Exception(
+                "Can't switch culler tier %d between vertex and instance counts." % tier
+            )
+        self.instance_vertices[tier] = instance_vertices
+
+    def cull(
+        self,
+        elements: BufferObject,
+        count: int,
+        cam: Camera,
+        uniforms: List[Tuple[str, Any, str]] | None = None,
+    ) -> None:
+        ComputePrimitives.ensure_size(
+            self.visible_elements, count * 4 * self.tier_count, np.float32
+        )
+        ComputePrimitives.ensure_size(
+            self.visible_indices, count * self.tier_count, np.uint32
+        )
+        self.command.set_commands(self.empty_commands(count))
+        if count <= 0:
+            return
+        elements.bind(0)
+        self.visible_elements.bind(1)
+        self.visible_indices.bind(2)
+        self.command.bind(3)
+        self.primitives.run(
+            self.primitives.shader("frustum_cull", self.parser),
+            count,
+            [
+                ("projection", cam.projection, "mat4"),
+                ("view", cam.view, "mat4"),
+                ("screen_height", cam.screen_height, "float"),
+            ]
+            + ([] if uniforms is None else uniforms),
+        )
+
+    def visible_count(self, tier: int = 0) -> int:
+        # reads the command back, only meant for statistics and tests
+        command: np.ndarray = self.command.read()[tier]
+        return int(
+            command["instance_count" if self.instance_vertices[tier] > 0 else "count"]
+        )
+
+    def tier_offset(self, tier: int) -> int:
+        command: np.ndarray = self.command.read()[tier]
+        return int(
+            command["base_instance" if self.instance_vertices[tier] > 0 else "first"]
+        )
+
+    def delete(self) -> None:
+        self.visible_elements.delete()
+        self.visible_indices.delete()
+        self.command.delete()
+        if self.owns_primitives:
+            self.primitives.delete()
@@ -0,0 +1,41 @@
+import numpy as np
+
+from ..opengl_helper.buffer import BufferObject, BufferType
+
+# unit cube as a single triangle strip, the same corners the impostor geometry
+# shaders emit per point
+CUBE_STRIP: np.ndarray = np.array(
+    [
+        [-1.0, 1.0, -1.0, 1.0],
+        [1.0, 1.0, -1.0, 1.0],
+        [-1.0, -1.0, -1.0, 1.0],
+        [1.0, -1.0, -1.0, 1.0],
+        [1.0, -1.0, 1.0, 1.0],
+        [1.0, 1.0, -1.0, 1.0],
+        [1.0, 1.0, 1.0, 1.0],
+        [-1.0, 1.0, -1.0, 1.0],
+        [-1.0, 1.0, 1.0, 1.0],
+        [-1.0, -1.0, -1.0, 1.0],
+        [-1.0, -1.0, 1.0, 1.0],
+        [1.0, -1.0, 1.0, 1.0],
+        [-1.0, 1.0, 1.0, 1.0],
+        [1.0, 1.0, 1.0, 1.0],
+    ],
+    dtype=np.float32,
+)
+QUAD_STRIP: np.ndarray = np.array(
+    [
+        [-1.0, 1.0, 0.0, 1.0],
+        [1.0, 1.0, 0.0, 1.0],
+        [-1.0, -1.0, 0.0, 1.0],
+        [1.0, -1.0, 0.0, 1.0],
+    ],
+    dtype=np.float32,
+)
+
+
+def create_impostor_mesh(vertices: np.ndarray = CUBE_STRIP) -> BufferObject:
+    # shared by all instances, the per instance data stays in the element buffers
+    mesh: BufferObject = BufferObject(BufferType.ARRAY_BUFFER)
+    mesh.load(vertices.astype(np.float32).flatten())
+    return mesh
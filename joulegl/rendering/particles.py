@@ -0,0 +1,88 @@
+from typing import Callable
+
+from ..opengl_helper.base.config import ShaderConfig
+from ..opengl_helper.base.data_set import BaseShaderSet
+from ..opengl_helper.render.shader import RenderShaderSetting
+from ..opengl_helper.render.shader_handler import RenderShaderHandler
+from ..opengl_helper.render.utility import (
+    OglBlendingEquations,
+    OglBlendingFactors,
+    OglPrimitives,
+    OGLRenderFunction,
+    generate_render_function,
+)
+from ..opengl_helper.vertex_data_handler import VertexDataHandler
+from ..processing.particles import ParticleSystem
+from ..utility.camera import Camera
+from ..utility.definitions import LIBRARY_SHADER_PATH
+from .renderer import Renderer
+
+
+class ParticleRenderer(Renderer):
+    def __init__(
+        self,
+        particles: ParticleSystem,
+        point_size: float = 2.0,
+        shader_handler: RenderShaderHandler | None = None,
+    ) -> None:
+        self.owns_handler: bool = shader_handler is None
+        super().__init__(
+            shader_handler=(
+                RenderShaderHandler(LIBRARY_SHADER_PATH)
+                if shader_handler is None
+                else shader_handler
+            )
+        )
+        self.particles: ParticleSystem = particles
+        self.set_shader(
+            [
+                RenderShaderSetting(
+                    "particles",
+                    ["particles/particle.vert", "particles/particle.frag"],
+                )
+            ]
+        )
+        self.data_handler: VertexDataHandler = VertexDataHandler(
+            [(particles.positions, 0), (particles.velocities, 1)]
+        )
+
+        def generate_element_count_func(particles: ParticleSystem) -> Callable:
+            def element_count_func() -> int:
+                # dead particles are culled in the vertex shader
+                return particles.capacity
+
+            return element_count_func
+
+        self.execute_funcs["particles"] = generate_render_function(
+            OGLRenderFunction.ARRAYS,
+            OglPrimitives.POINTS,
+            point_size=point_size,
+            add_blending=[
+                OglBlendingFactors.SRC_ALPHA,
+                OglBlendingFactors.ONE_MINUS_SRC_ALPHA,
+                OglBlendingEquations.FUNC_ADD,
+                OglBlendingEquations.FUNC_ADD,
+            ],
+        )
+        self.element_count_funcs["particles"] = generate_element_count_func(particles)
+        self.create_sets(self.data_handler, "particles")
+
+    def render(
+        self,
+        set_name: str = "particles",
+        cam: Camera | None = None,
+        config: ShaderConfig | None = None,
+    ) -> None:
+        current_set: BaseShaderSet = self.sets[set_name]
+        if cam is not None:
+            current_set.set_uniform_data(
+                [("projection", cam.projection, "mat4"), ("view", cam.view, "mat4")]
+            )
+        current_set.set_uniform_labeled_data(config)
+        current_set.use(True)
+
+    def delete(self) -> None:
+        self.data_handler.delete()
+        self.release_shaders()
+        if self.owns_handler:
+            self.shader_handler.delete()
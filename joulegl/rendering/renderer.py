@@ -1,13 +1,23 @@
 import abc
 from typing import Callable, Dict, List, Tuple
 
+from OpenGL.GL import *
+
 from ..opengl_helper.base.config import ShaderConfig
-from ..opengl_helper.base.data_set import DATA_TO_SET_MAP, BaseShaderSet
+from ..opengl_helper.base.data_set import (
+    DATA_TO_SET_MAP,
+    BaseShaderSet,
+    OverflowingSet,
+)
 from ..opengl_helper.base.shader import ShaderSetting
+from ..opengl_helper.base.shader_handler import VariantKey
 from ..opengl_helper.base.shader_parser import ShaderParser
 from ..opengl_helper.render.shader import RenderShader, RenderShaderSetting
 from ..opengl_helper.render.shader_handler import BaseShaderHandler, RenderShaderHandler
-from ..opengl_helper.vertex_data_handler import BaseDataHandler
+from ..opengl_helper.vertex_data_handler import (
+    BaseDataHandler,
+    OverflowingVertexDataHandler,
+)
 from ..utility.camera import Camera
 
 
@@ -21,24 +31,62 @@ class BaseProcessor:
         self.shader_handler: BaseShaderHandler = shader_handler
         self.shader_parser = shader_parser
         self.shaders: Dict[str, RenderShader] = dict()
+        self.shader_keys: Dict[str, VariantKey] = dict()
         self.sets: Dict[str, BaseShaderSet] = dict()
         self.execute_funcs: Dict[str, Callable] = dict()
         self.element_count_funcs: Dict[str, Callable] = dict()
 
     def set_shader(self, shader_settings: List[ShaderSetting]) -> None:
         for shader_setting in shader_settings:
-            self.shaders[shader_setting.id_name] = self.shader_handler.create(
+            # held programs are owned, so a shared handler never evicts them under us
+            previous_key: VariantKey | None = self.shader_keys.get(
+                shader_setting.id_name
+            )
+            self.shaders[shader_setting.id_name] = self.shader_handler.acquire(
+                shader_setting, self.shader_parser
+            )
+            self.shader_keys[shader_setting.id_name] = self.shader_handler.variant_key(
                 shader_setting, self.shader_parser
             )
+            if previous_key is not None:
+                self.shader_handler.release(previous_key)
+
+    def release_shaders(self) -> None:
+        for key in self.shader_keys.values():
+            self.shader_handler.release(key)
+        self.shader_keys = dict()
 
     def create_sets(
         self,
         data_handler: BaseDataHandler,
         set_info: Dict[str, Tuple[str, str, str]] | str,
+        chunk_batch: int = 1,
     ) -> None:
         if isinstance(set_info, str):
             set_info = {set_info: (set_info, set_info, set_info)}
+        if chunk_batch > 1 and not isinstance(
+            data_handler, OverflowingVertexDataHandler
+        ):
+            raise Exception("Chunk batches require an overflowing data handler.")
+        if chunk_batch > 1:
+            # every chunk of a batch takes its own storage binding
+            max_bindings: int = glGetIntegerv(GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS)
+            for _, location in data_handler.targeted_overflowing_buffer_objects:
+                if location + chunk_batch > max_bindings:
+                    raise Exception(
+                        "Chunk batch %d from binding %d exceeds the %d storage bindings."
+                        % (chunk_batch, location, max_bindings)
+                    )
         for set_name, (shader_name, func_name, count_func_name) in set_info.items():
+            if chunk_batch > 1:
+                self.sets[set_name] = OverflowingSet(
+                    self.shaders[shader_name],
+                    data_handler,
+                    self.execute_funcs[func_name],
+                    self.element_count_funcs[count_func_name],
+                    chunk_batch,
+                )
+                continue
             self.sets[set_name] = DATA_TO_SET_MAP[type(data_handler)](
                 self.shaders[shader_name],
                 data_handler,
@@ -52,15 +100,19 @@ class BaseProcessor:
 
 
 class Renderer(BaseProcessor):
-    def __init__(self, shader_parser: ShaderParser | None = None) -> None:
-        super().__init__(RenderShaderHandler(), shader_parser)
+    def __init__(
+        self,
+        shader_parser: ShaderParser | None = None,
+        shader_handler: RenderShaderHandler | None = None,
+    ) -> None:
+        super().__init__(
+            RenderShaderHandler() if shader_handler is None else shader_handler,
+            shader_parser,
+        )
         __metaclass__ = abc.ABCMeta
 
     def set_shader(self, shader_settings: List[RenderShaderSetting]) -> None:
-        for shader_setting in shader_settings:
-            self.shaders[shader_setting.id_name] = self.shader_handler.create(
-                shader_setting, self.shader_parser
-            )
+        super().set_shader(shader_settings)
 
     @abc.abstractmethod
     def render(
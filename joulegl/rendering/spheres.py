@@ -0,0 +1,101 @@
+from typing import Callable
+
+from ..opengl_helper.base.config import ShaderConfig
+from ..opengl_helper.base.data_set import BaseShaderSet
+from ..opengl_helper.buffer import BufferObject
+from ..opengl_helper.render.shader import RenderShaderSetting
+from ..opengl_helper.render.shader_handler import RenderShaderHandler
+from ..opengl_helper.render.utility import (
+    OglPrimitives,
+    OGLRenderFunction,
+    generate_render_function,
+)
+from ..opengl_helper.vertex_data_handler import VertexDataHandler
+from ..utility.camera import Camera
+from ..utility.definitions import LIBRARY_SHADER_PATH
+from .renderer import Renderer
+
+
+class SphereRenderer(Renderer):
+    def __init__(
+        self,
+        positions: BufferObject,
+        count: int,
+        shader_handler: RenderShaderHandler | None = None,
+    ) -> None:
+        # positions hold a vec4 per sphere, xyz center and w radius
+        self.owns_handler: bool = shader_handler is None
+        super().__init__(
+            shader_handler=(
+                RenderShaderHandler(LIBRARY_SHADER_PATH)
+                if shader_handler is None
+                else shader_handler
+            )
+        )
+        self.positions: BufferObject = positions
+        self.count: int = count
+        self.set_shader(
+            [
+                RenderShaderSetting(
+                    "sphere_sprite",
+                    ["spheres/sphere_sprite.vert", "spheres/sphere_sprite.frag"],
+                    ["sphere_color", "object_radius"],
+                ),
+                RenderShaderSetting(
+                    "sphere_quad",
+                    ["spheres/sphere_quad.vert", "spheres/sphere_quad.frag"],
+                    ["sphere_color", "object_radius"],
+                ),
+            ]
+        )
+        self.data_handler: VertexDataHandler = VertexDataHandler([(positions, 0)])
+
+        def generate_element_count_func(renderer: SphereRenderer) -> Callable:
+            def element_count_func() -> int:
+                return renderer.count
+
+            return element_count_func
+
+        # sprites are limited by the maximal point size, quads also fit close spheres
+        self.execute_funcs["sphere_sprite"] = generate_render_function(
+            OGLRenderFunction.ARRAYS,
+            OglPrimitives.POINTS,
+            depth_test=True,
+            program_point_size=True,
+        )
+        self.execute_funcs["sphere_quad"] = generate_render_function(
+            OGLRenderFunction.ARRAYS_INSTANCED,
+            OglPrimitives.TRIANGLE_STRIP,
+            depth_test=True,
+            instance_vertices=4,
+        )
+        for set_name in ["sphere_sprite", "sphere_quad"]:
+            self.element_count_funcs[set_name] = generate_element_count_func(self)
+            self.create_sets(self.data_handler, set_name)
+
+    def render(
+        self,
+        set_name: str = "sphere_quad",
+        cam: Camera | None = None,
+        config: ShaderConfig | None = None,
+    ) -> None:
+        current_set: BaseShaderSet = self.sets[set_name]
+        if cam is not None:
+            current_set.set_uniform_data(
+                [
+                    ("projection", cam.projection, "mat4"),
+                    ("view", cam.view, "mat4"),
+                    ("screen_width", cam.screen_width, "float"),
+                    ("screen_height", cam.screen_height, "float"),
+                ]
+            )
+        current_set.set_uniform_labeled_data(config)
+        # the quads pull their sphere from the storage buffer by instance
+        self.positions.bind(0)
+        current_set.use(True)
+
+    def delete(self) -> None:
+        self.data_handler.delete()
+        self.release_shaders()
+        if self.owns_handler:
+            self.shader_handler.delete()
@@ -0,0 +1,12 @@
+// claims a slot of an append buffer, writers past the capacity hand their slot back
+// so the counter settles at the number of stored elements
+
+bool append_slot(atomic_uint counter, uint capacity, out uint slot)
+{
+    slot = atomicCounterIncrement(counter);
+    if (slot < capacity) {
+        return true;
+    }
+    atomicCounterDecrement(counter);
+    return false;
+}
@@ -0,0 +1,18 @@
+// requires the layout(local_size_x = ...) in; declaration to precede the include
+
+uniform int element_count = 2147483647;
+
+highp uint group_index()
+{
+    return gl_WorkGroupID.x + gl_NumWorkGroups.x * (gl_WorkGroupID.y + gl_NumWorkGroups.y * gl_WorkGroupID.z);
+}
+
+highp uint global_index()
+{
+    return group_index() * (gl_WorkGroupSize.x * gl_WorkGroupSize.y * gl_WorkGroupSize.z) + gl_LocalInvocationIndex;
+}
+
+bool in_bounds(highp uint index)
+{
+    return index < uint(element_count);
+}
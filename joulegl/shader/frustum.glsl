@@ -0,0 +1,21 @@
+// frustum planes of a view projection matrix, normals point into the frustum
+
+vec4 frustum_plane(mat4 view_projection, int axis, float side)
+{
+    vec4 plane = vec4(view_projection[0][3], view_projection[1][3], view_projection[2][3], view_projection[3][3])
+        + side * vec4(view_projection[0][axis], view_projection[1][axis], view_projection[2][axis], view_projection[3][axis]);
+    return plane / length(plane.xyz);
+}
+
+bool sphere_in_frustum(mat4 view_projection, vec3 center, float radius)
+{
+    for (int axis = 0; axis < 3; axis++) {
+        for (int side = -1; side <= 1; side += 2) {
+            vec4 plane = frustum_plane(view_projection, axis, float(side));
+            if (dot(plane.xyz, center) + plane.w < -radius) {
+                return false;
+            }
+        }
+    }
+    return true;
+}
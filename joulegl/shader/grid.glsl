@@ -0,0 +1,27 @@
+// uniform grid addressing shared by the spatial hash kernels and its queries
+// positions outside of the grid are clamped into the border cells
+
+uniform vec3 grid_origin = vec3(0.0, 0.0, 0.0);
+uniform float grid_cell_size = 1.0;
+uniform ivec3 grid_size = ivec3(1, 1, 1);
+
+ivec3 grid_cell(vec3 position)
+{
+    return clamp(ivec3(floor((position - grid_origin) / grid_cell_size)), ivec3(0), grid_size - 1);
+}
+
+uint grid_key(ivec3 cell)
+{
+    return uint(cell.x + grid_size.x * (cell.y + grid_size.y * cell.z));
+}
+
+// neighbor runs over the 27 cells around and including cell, cells outside of the grid are skipped
+bool grid_neighbor(ivec3 cell, int neighbor, out uint key)
+{
+    ivec3 neighbor_cell = cell + ivec3(neighbor % 3, (neighbor / 3) % 3, neighbor / 9) - 1;
+    if (any(lessThan(neighbor_cell, ivec3(0))) || any(greaterThanEqual(neighbor_cell, grid_size))) {
+        return false;
+    }
+    key = grid_key(neighbor_cell);
+    return true;
+}
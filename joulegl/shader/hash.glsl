@@ -0,0 +1,44 @@
+// integer hashing for stateless per-element random numbers
+
+uint hash_uint(uint value)
+{
+    uint state = value * 747796405u + 2891336453u;
+    uint word = ((state >> ((state >> 28u) + 4u)) ^ state) * 277803737u;
+    return (word >> 22u) ^ word;
+}
+
+uint hash_cell(ivec3 cell, uint seed)
+{
+    return hash_uint(hash_uint(hash_uint(uint(cell.x) ^ seed) ^ uint(cell.y)) ^ uint(cell.z));
+}
+
+// the top 24 bits fit a float mantissa, so the result stays below 1.0
+float unit_float(uint bits)
+{
+    return float(bits >> 8u) / 16777216.0;
+}
+
+float hash_float(uint value)
+{
+    return unit_float(hash_uint(value));
+}
+
+float value_noise(vec3 position, uint seed)
+{
+    ivec3 cell = ivec3(floor(position));
+    vec3 weight = fract(position);
+    weight = weight * weight * (3.0 - 2.0 * weight);
+
+    float corners[8];
+    for (int i = 0; i < 8; i++) {
+        ivec3 corner = cell + ivec3(i & 1, (i >> 1) & 1, (i >> 2) & 1);
+        corners[i] = unit_float(hash_cell(corner, seed));
+    }
+    vec4 along_x = mix(
+        vec4(corners[0], corners[2], corners[4], corners[6]),
+        vec4(corners[1], corners[3], corners[5], corners[7]),
+        weight.x
+    );
+    vec2 along_y = mix(along_x.xz, along_x.yw, weight.y);
+    return mix(along_y.x, along_y.y, weight.z);
+}
@@ -0,0 +1,13 @@
+// requires the layout(local_size_x = ..., local_size_y = ...) in; declaration to precede the include
+
+uniform ivec3 image_size = ivec3(1, 1, 1);
+
+ivec3 image_coord()
+{
+    return ivec3(gl_GlobalInvocationID);
+}
+
+bool in_image(ivec3 coord)
+{
+    return all(lessThan(coord, image_size));
+}
@@ -0,0 +1,7 @@
+// multi draw submission of overflowing chunks, every chunk is one draw command
+// with the first element of the chunk as base instance
+
+#extension GL_ARB_shader_draw_parameters : require
+
+#define CHUNK_ID gl_DrawIDARB
+#define GLOBAL_VERTEX_ID (gl_BaseInstanceARB + gl_VertexID)
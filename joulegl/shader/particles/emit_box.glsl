@@ -0,0 +1,15 @@
+// emits uniformly inside an axis aligned box with a shared initial velocity
+
+uniform vec3 emitter_minimum = vec3(0.0, 0.0, 0.0);
+uniform vec3 emitter_maximum = vec3(1.0, 1.0, 1.0);
+uniform vec3 emitter_velocity = vec3(0.0, 0.0, 0.0);
+uniform float particle_life = 1.0;
+uniform float life_variance = 0.0;
+
+void emit(uint seed, out vec4 position, out vec4 velocity)
+{
+    vec3 weight = vec3(hash_float(seed), hash_float(seed + 1u), hash_float(seed + 2u));
+    float life = random_life(hash_uint(seed + 3u), particle_life, life_variance);
+    position = vec4(mix(emitter_minimum, emitter_maximum, weight), life);
+    velocity = vec4(emitter_velocity, life);
+}
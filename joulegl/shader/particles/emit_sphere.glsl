@@ -0,0 +1,16 @@
+// emits from a ball around emitter_position, moving outwards from its center
+
+uniform vec3 emitter_position = vec3(0.0, 0.0, 0.0);
+uniform float emitter_radius = 0.0;
+uniform float emitter_speed = 1.0;
+uniform float particle_life = 1.0;
+uniform float life_variance = 0.0;
+
+void emit(uint seed, out vec4 position, out vec4 velocity)
+{
+    vec3 direction = random_direction(seed);
+    float life = random_life(hash_uint(seed + 2u), particle_life, life_variance);
+    float distance = emitter_radius * pow(hash_float(seed + 3u), 1.0 / 3.0);
+    position = vec4(emitter_position + direction * distance, life);
+    velocity = vec4(direction * emitter_speed, life);
+}
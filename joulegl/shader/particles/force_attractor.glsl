@@ -0,0 +1,10 @@
+uniform vec3 attractor_position = vec3(0.0, 0.0, 0.0);
+uniform float attractor_strength = 1.0;
+uniform float attractor_softening = 0.1;
+
+vec3 force_attractor(vec3 position, vec3 velocity)
+{
+    vec3 offset = attractor_position - position;
+    float distance_squared = dot(offset, offset) + attractor_softening * attractor_softening;
+    return attractor_strength * offset * inversesqrt(distance_squared * distance_squared * distance_squared);
+}
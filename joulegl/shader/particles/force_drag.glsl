@@ -0,0 +1,6 @@
+uniform float drag = 0.1;
+
+vec3 force_drag(vec3 position, vec3 velocity)
+{
+    return -drag * velocity;
+}
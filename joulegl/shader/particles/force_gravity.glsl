@@ -0,0 +1,6 @@
+uniform vec3 gravity = vec3(0.0, -9.81, 0.0);
+
+vec3 force_gravity(vec3 position, vec3 velocity)
+{
+    return gravity;
+}
@@ -0,0 +1,7 @@
+// semi-implicit euler, the updated velocity moves the particle
+
+void integrate(inout vec3 position, inout vec3 velocity, float step)
+{
+    velocity += particle_acceleration(position, velocity) * step;
+    position += velocity * step;
+}
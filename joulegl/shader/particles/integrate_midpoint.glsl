@@ -0,0 +1,9 @@
+// second order midpoint method, evaluates the forces twice per step
+
+void integrate(inout vec3 position, inout vec3 velocity, float step)
+{
+    vec3 half_velocity = velocity + particle_acceleration(position, velocity) * 0.5 * step;
+    vec3 half_position = position + velocity * 0.5 * step;
+    velocity += particle_acceleration(half_position, half_velocity) * step;
+    position += half_velocity * step;
+}
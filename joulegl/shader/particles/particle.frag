@@ -0,0 +1,13 @@
+#version 430
+
+in float life_fraction;
+
+uniform vec3 start_color = vec3(1.0, 0.8, 0.3);
+uniform vec3 end_color = vec3(0.6, 0.1, 0.0);
+
+out vec4 frag_color;
+
+void main()
+{
+    frag_color = vec4(mix(end_color, start_color, life_fraction), life_fraction);
+}
@@ -0,0 +1,21 @@
+#version 430
+
+layout(location = 0) in vec4 position;
+layout(location = 1) in vec4 velocity;
+
+uniform mat4 view;
+uniform mat4 projection;
+
+out float life_fraction;
+
+void main()
+{
+    // dead particles are moved outside of the clip volume
+    if (position.w <= 0.0) {
+        gl_Position = vec4(2.0, 2.0, 2.0, 1.0);
+        life_fraction = 0.0;
+        return;
+    }
+    life_fraction = clamp(position.w / max(velocity.w, 1e-6), 0.0, 1.0);
+    gl_Position = projection * view * vec4(position.xyz, 1.0);
+}
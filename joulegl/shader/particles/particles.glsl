@@ -0,0 +1,34 @@
+// particle storage shared by the particle kernels, emitters, integrators and forces
+// positions hold the remaining life in w, a particle with w <= 0.0 is dead
+// velocities hold a free per-particle attribute in w, the built-in emitters store the initial life
+
+layout(std430, binding = 0) restrict buffer particle_position_buffer
+{
+    vec4 particle_positions[];
+};
+layout(std430, binding = 1) restrict buffer particle_velocity_buffer
+{
+    vec4 particle_velocities[];
+};
+// stack of dead particle indices, pushed by the update and popped by the emit kernel
+layout(std430, binding = 2) restrict buffer particle_free_list
+{
+    int free_count;
+    uint free_indices[];
+};
+
+uniform float dt = 0.016;
+uniform int frame = 0;
+
+vec3 random_direction(uint seed)
+{
+    float z = hash_float(seed) * 2.0 - 1.0;
+    float angle = hash_float(seed + 1u) * 6.28318530718;
+    float radius = sqrt(max(0.0, 1.0 - z * z));
+    return vec3(radius * cos(angle), radius * sin(angle), z);
+}
+
+float random_life(uint seed, float life, float variance)
+{
+    return life * (1.0 + variance * (hash_float(seed) * 2.0 - 1.0));
+}
@@ -0,0 +1,32 @@
+// neighbor queries against a spatial hash built by SpatialHash, bound to bindings 4 to 7
+//
+// ivec3 cell = grid_cell(position);
+// for (int neighbor = 0; neighbor < 27; neighbor++) {
+//     uint key;
+//     if (!grid_neighbor(cell, neighbor, key)) {
+//         continue;
+//     }
+//     for (uint i = cell_starts[key]; i < cell_ends[key]; i++) {
+//         vec4 other = sorted_positions[i];
+//         uint other_index = sorted_indices[i];
+//     }
+// }
+
+layout(std430, binding = 4) restrict readonly buffer spatial_hash_cell_starts
+{
+    uint cell_starts[];
+};
+layout(std430, binding = 5) restrict readonly buffer spatial_hash_cell_ends
+{
+    uint cell_ends[];
+};
+layout(std430, binding = 6) restrict readonly buffer spatial_hash_sorted_indices
+{
+    uint sorted_indices[];
+};
+layout(std430, binding = 7) restrict readonly buffer spatial_hash_sorted_positions
+{
+    vec4 sorted_positions[];
+};
+
+#include "grid.glsl"
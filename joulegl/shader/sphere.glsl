@@ -0,0 +1,12 @@
+bool sphereIntersection(vec3 ray_direction, vec3 sphere_position, float sphere_radius, out vec2 distances)
+{
+    float a = dot(ray_direction, -sphere_position);
+    float b = a * a - (dot(sphere_position, sphere_position) - sphere_radius * sphere_radius);
+
+    if (b < 0) return false; // no intersections
+
+    float d = -a;
+    float e = sqrt(b);
+    distances = vec2(d - e, d + e);
+    return true;
+}
@@ -0,0 +1,50 @@
+// ndc range of a sphere along one screen axis, from the two tangents through the
+// camera, offset and depth are the view space center, depth has to exceed the radius
+vec2 sphere_axis_bounds(float offset, float depth, float radius, float scale)
+{
+    float tangent = sqrt(offset * offset + depth * depth - radius * radius);
+    return scale * vec2(
+        (offset * tangent - radius * depth) / (depth * tangent + offset * radius),
+        (offset * tangent + radius * depth) / (depth * tangent - offset * radius));
+}
+
+// ndc range of the box around the part of a sphere between two depths
+vec2 box_axis_bounds(float offset, float radius, float near_depth, float far_depth, float scale)
+{
+    vec4 corners = vec4(offset - radius, offset + radius, offset - radius, offset + radius)
+        / vec4(near_depth, near_depth, far_depth, far_depth);
+    return scale * vec2(
+        min(min(corners.x, corners.y), min(corners.z, corners.w)),
+        max(max(corners.x, corners.y), max(corners.z, corners.w)));
+}
+
+// screen rectangle (min x, min y, max x, max y in ndc) covering a view space sphere,
+// front is the view z the rectangle is rasterized at, never behind the sphere surface
+bool sphere_screen_bounds(vec3 center, float radius, mat4 projection, out vec4 bounds, out float front)
+{
+    float near = projection[3][2] / (projection[2][2] - 1.0);
+    float depth = -center.z;
+    if (depth + radius <= near) {
+        return false;
+    }
+    front = min(center.z + radius, -near);
+    vec2 x_bounds;
+    vec2 y_bounds;
+    if (depth - radius < near) {
+        // spheres crossing the near plane are bound by their part in front of it
+        x_bounds = box_axis_bounds(center.x, radius, near, depth + radius, projection[0][0]);
+        y_bounds = box_axis_bounds(center.y, radius, near, depth + radius, projection[1][1]);
+    } else {
+        x_bounds = sphere_axis_bounds(center.x, depth, radius, projection[0][0]);
+        y_bounds = sphere_axis_bounds(center.y, depth, radius, projection[1][1]);
+    }
+    bounds = clamp(vec4(x_bounds.x, y_bounds.x, x_bounds.y, y_bounds.y), -1.0, 1.0);
+    return bounds.x < bounds.z && bounds.y < bounds.w;
+}
+
+// ndc depth of a view space z
+float view_depth(float z, mat4 projection)
+{
+    vec4 clip = projection * vec4(0.0, 0.0, z, 1.0);
+    return clip.z / clip.w;
+}
@@ -0,0 +1,18 @@
+#version 440
+
+flat in vec3 vs_center;
+flat in float vs_radius;
+in vec3 vs_ray;
+
+out vec4 frag_color;
+layout (depth_greater) out float gl_FragDepth;
+
+uniform mat4 projection;
+uniform vec3 sphere_color = vec3(0.8, 0.8, 0.8);
+
+#include "sphere_shading.glsl"
+
+void main()
+{
+    shade_sphere(vs_ray, vs_center, vs_radius, sphere_color);
+}
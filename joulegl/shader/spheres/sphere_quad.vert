@@ -0,0 +1,35 @@
+#version 440
+
+layout(std430, binding = 0) restrict readonly buffer sphere_positions
+{
+    vec4 positions[];
+};
+
+flat out vec3 vs_center;
+flat out float vs_radius;
+out vec3 vs_ray;
+
+uniform mat4 view;
+uniform mat4 projection;
+uniform float object_radius = 1.0;
+
+#include "sphere_bounds.glsl"
+
+void main()
+{
+    // vertex pulling, the instance picks the sphere and the vertex the quad corner
+    vec4 position = positions[gl_InstanceID];
+    vs_center = (view * vec4(position.xyz, 1.0)).xyz;
+    vs_radius = object_radius * position.w;
+    vec4 bounds;
+    float front;
+    if (!sphere_screen_bounds(vs_center, vs_radius, projection, bounds, front)) {
+        gl_Position = vec4(2.0, 2.0, 2.0, 1.0);
+        vs_ray = vec3(0.0, 0.0, -1.0);
+        return;
+    }
+    vec2 corner = vec2(gl_VertexID & 1, gl_VertexID >> 1);
+    vec2 ndc = mix(bounds.xy, bounds.zw, corner);
+    vs_ray = vec3(ndc.x / projection[0][0], ndc.y / projection[1][1], -1.0) * -front;
+    gl_Position = projection * vec4(vs_ray, 1.0);
+}
@@ -0,0 +1,20 @@
+#include "lighting.glsl"
+#include "sphere.glsl"
+
+// ray casts the sphere from the camera, the written depth is never in front of the
+// rasterized one, which keeps the depth_greater layout valid for early depth tests
+void shade_sphere(vec3 ray, vec3 center, float radius, vec3 color)
+{
+    vec3 ray_direction = normalize(ray);
+    vec2 distances;
+    if (!sphereIntersection(ray_direction, center, radius, distances)) discard;
+    vec3 hit_position = ray_direction * distances.x;
+    vec3 normal = normalize(hit_position - center);
+
+    frag_color = vec4(atom_color_ambient +
+    clamp(color * max(dot(normal, light_direction_cam), 0.0), 0.0, 1.0) +
+    clamp(atom_color_specular * pow(max(dot(reflect(light_direction_cam, normal), ray_direction), 0.0), 4.0), 0.0, 1.0), 1.0);
+
+    vec4 hit_screen = projection * vec4(hit_position, 1.0);
+    gl_FragDepth = 0.5 * (hit_screen.z / hit_screen.w) + 0.5;
+}
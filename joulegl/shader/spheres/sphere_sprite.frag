@@ -0,0 +1,21 @@
+#version 440
+
+flat in vec3 vs_center;
+flat in float vs_radius;
+
+out vec4 frag_color;
+layout (depth_greater) out float gl_FragDepth;
+
+uniform mat4 projection;
+uniform float screen_width;
+uniform float screen_height;
+uniform vec3 sphere_color = vec3(0.8, 0.8, 0.8);
+
+#include "sphere_shading.glsl"
+
+void main()
+{
+    // the view ray goes through the fragment center, independent of the sprite size
+    vec2 ndc = gl_FragCoord.xy / vec2(screen_width, screen_height) * 2.0 - 1.0;
+    shade_sphere(vec3(ndc.x / projection[0][0], ndc.y / projection[1][1], -1.0), vs_center, vs_radius, sphere_color);
+}
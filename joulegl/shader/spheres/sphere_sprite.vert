@@ -0,0 +1,32 @@
+#version 440
+
+layout(location = 0) in vec4 position;
+
+flat out vec3 vs_center;
+flat out float vs_radius;
+
+uniform mat4 view;
+uniform mat4 projection;
+uniform float screen_width;
+uniform float screen_height;
+uniform float object_radius = 1.0;
+
+#include "sphere_bounds.glsl"
+
+void main()
+{
+    vs_center = (view * vec4(position.xyz, 1.0)).xyz;
+    vs_radius = object_radius * position.w;
+    vec4 bounds;
+    float front;
+    if (!sphere_screen_bounds(vs_center, vs_radius, projection, bounds, front)) {
+        gl_Position = vec4(2.0, 2.0, 2.0, 1.0);
+        gl_PointSize = 1.0;
+        return;
+    }
+    // the bounds are clamped to the screen, so the sprite center is never clipped,
+    // a pixel of padding covers the snapping of the sprite square
+    vec2 size = 0.5 * (bounds.zw - bounds.xy) * vec2(screen_width, screen_height);
+    gl_Position = vec4(0.5 * (bounds.xy + bounds.zw), view_depth(front, projection), 1.0);
+    gl_PointSize = ceil(max(size.x, size.y)) + 1.0;
+}
@@ -8,7 +8,7 @@ from joulegl.utility.performance import Timed
 
 from ..opengl_helper.render.utility import clear_screen
 from ..opengl_helper.screenshot import create_screenshot
-from .camera import CameraPose
+from .camera import CameraPose, framing_distance
 from .file import StatsFileHandler
 from .log_handling import LOGGER
 from .window import Window, WindowHandler
@@ -63,6 +63,19 @@ class App(Timed):
         self.window.cam.offset_scale = offset_scale
         self.window.cam.set_position(pose)
 
+    def frame_bounds(
+        self,
+        minimum: np.ndarray,
+        maximum: np.ndarray,
+        pose: CameraPose = CameraPose.LEFT,
+        margin: float = 1.0,
+    ) -> None:
+        self.set_cam(
+            (minimum + maximum) * 0.5,
+            max(framing_distance(minimum, maximum) * margin, 1.0),
+            pose,
+        )
+
     def run(self) -> None:
         try:
             while self.window.is_active() and not self.closed:
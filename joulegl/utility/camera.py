@@ -22,6 +22,13 @@ def get_cam_offset(pose: CameraPose) -> np.ndarray:
     return normalize(cam_offset)
 
 
+def framing_distance(
+    minimum: np.ndarray, maximum: np.ndarray, fovy: float = 45.0
+) -> float:
+    radius: float = float(np.linalg.norm(maximum - minimum)) * 0.5
+    return radius / sin(radians(fovy * 0.5))
+
+
 def look_at(
     position: np.ndarray, target: np.ndarray, world_up: np.ndarray
 ) -> np.ndarray:
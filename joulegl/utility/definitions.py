@@ -10,6 +10,10 @@ SHADER_PATH = (
     else "tests/shader"
 )
 
+LIBRARY_SHADER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shader"
+)
+
 SCREENSHOT_PATH = (
     os.path.join(BASE_PATH, "screenshots")
     if os.environ.get("TESTING") is None
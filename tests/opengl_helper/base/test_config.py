@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from joulegl.opengl_helper.base.config import ShaderConfig, ShaderTableConfig
+
+
+def test_shader_config_set_items() -> None:
+    shader_config = ShaderConfig()
+    shader_config.set_items(
+        [
+            ("test_float", ["shader_a", "shader_b"], "float", 1.0),
+            ("test_int", ["shader_a"], "int", 1),
+        ]
+    )
+    assert shader_config["test_float"] == 1.0
+    assert shader_config.shader_uniform_name_map["shader_a"] == [
+        "test_float",
+        "test_int",
+    ]
+    assert shader_config.shader_uniform_name_map["shader_b"] == ["test_float"]
+    assert shader_config.uniform_type["test_int"] == "int"
+
+
+def test_shader_table_config_layout() -> None:
+    table = ShaderTableConfig()
+    table.set_columns(
+        [("weight", "float"), ("color", "vec3"), ("id", "int"), ("offset", "vec2")]
+    )
+    dtype = table.dtype
+    assert dtype.fields["weight"][1] == 0
+    assert dtype.fields["color"][1] == 16
+    assert dtype.fields["id"][1] == 28
+    assert dtype.fields["offset"][1] == 32
+    assert dtype.itemsize == 48
+
+
+def test_shader_table_config_rows() -> None:
+    table = ShaderTableConfig()
+    table.set_columns([("color", "vec3"), ("id", "int")])
+    version = table.version
+    table.set_rows(
+        [
+            ("first", 0, {"color": [1.0, 0.0, 0.0], "id": 3}),
+            ("third", 2, {"color": [0.0, 0.0, 1.0], "id": 5}),
+        ]
+    )
+    assert table.version > version
+    assert table.row_count == 3
+
+    data = table.to_array()
+    assert len(data) == 3
+    assert np.array_equal(data[0]["color"], [1.0, 0.0, 0.0])
+    assert data[1]["id"] == 0
+    assert data[2]["id"] == 5
+
+    table.set_row("third", {"id": 7})
+    assert table["third"]["id"] == 7
+    assert np.array_equal(table["third"]["color"], [0.0, 0.0, 1.0])
+
+
+def test_shader_table_config_wrong_type() -> None:
+    table = ShaderTableConfig()
+    with pytest.raises(Exception) as e:
+        table.set_columns([("color", "mat4")])
+    assert e.value.args[0] == "Table column type 'mat4' not supported."
+
+
+def test_shader_config_version() -> None:
+    shader_config = ShaderConfig()
+    version = shader_config.version
+    shader_config["test_float"] = 2.0
+    assert shader_config.version == version
+    shader_config.set_items([("test_float", ["shader_a"], "float", 1.0)])
+    assert shader_config.version == version + 1
@@ -121,6 +121,38 @@ def test_overflowing_set_use():
     assert use_func.call_count == 3
 
 
+def test_overflowing_set_use_batches():
+    shader = Mock(spec=BaseShader)
+    data_handler = Mock(spec=OverflowingVertexDataHandler)
+    data_handler.targeted_overflowing_buffer_objects = [
+        [Mock(overflowing_handles=[1, 2, 3, 4, 5])]
+    ]
+    use_func = Mock()
+    element_count_func = Mock(side_effect=[10, 10, 10, 10, 4])
+    overflowing_set = OverflowingSet(
+        shader, data_handler, use_func, element_count_func, chunk_batch=2
+    )
+
+    overflowing_set.use(render=True)
+    shader.use.assert_called_once()
+    assert [c.args for c in data_handler.set_buffer.call_args_list] == [
+        (0,),
+        (2,),
+        (4,),
+    ]
+    assert [c.args for c in data_handler.set_range.call_args_list] == [
+        (2, True),
+        (2, True),
+        (1, True),
+    ]
+    assert [c.args for c in use_func.call_args_list] == [
+        ([10, 10], [0, 10], 0),
+        ([10, 10], [20, 30], 2),
+        ([4], [40], 4),
+    ]
+    data_handler.set.assert_not_called()
+
+
 def test_data_to_set_map():
     assert DATA_TO_SET_MAP[VertexDataHandler] == DefaultSet
     assert DATA_TO_SET_MAP[OverflowingVertexDataHandler] == OverflowingSet
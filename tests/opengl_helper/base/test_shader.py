@@ -150,6 +150,53 @@ def test_set_uniform_labeled_data(
             assert "test_not_in_shader" in render_shader.uniform_ignore_labels
 
 
+def test_uniform_binding_plan(
+    gl_context: GLContext, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    shader_handler = RenderShaderHandler()
+    render_shader = shader_handler.create(
+        RenderShaderSetting(
+            "screen_quad",
+            ["uniform_test.vert", "screen_quad.frag"],
+            ["test_float", "test_int"],
+        )
+    )
+    shader_config = ShaderConfig()
+    shader_config.set_items([("test_float", ["screen_quad"], "float", 1.0)])
+
+    calls: List[List[Tuple[str, Any, str]]] = []
+    set_uniform_data = render_shader.set_uniform_data
+
+    def counting_set_uniform_data(data: List[Tuple[str, Any, str]]) -> None:
+        calls.append(data)
+        set_uniform_data(data)
+
+    monkeypatch.setattr(render_shader, "set_uniform_data", counting_set_uniform_data)
+
+    render_shader.set_uniform_labeled_data(shader_config)
+    assert len(calls) == 1
+    assert render_shader.uniform_cache["test_float"][1] == 1.0
+
+    shader_config["test_float"] = 2.0
+    render_shader.set_uniform_labeled_data(shader_config)
+    render_shader.set_uniform_labeled_data(shader_config)
+    assert len(calls) == 1
+    assert render_shader.uniform_cache["test_float"][1] == 2.0
+
+    shader_config.set_items([("test_int", ["screen_quad"], "int", 3)])
+    render_shader.set_uniform_labeled_data(shader_config)
+    assert len(calls) == 2
+    assert render_shader.uniform_cache["test_int"][1] == 3
+
+    other_config = ShaderConfig("other")
+    other_config.set_items([("test_float", ["screen_quad"], "float", 4.0)])
+    render_shader.set_uniform_labeled_data(other_config)
+    assert len(calls) == 3
+    assert render_shader.uniform_cache["test_float"][1] == 4.0
+
+    render_shader.use()
+
+
 def test_set_textures(gl_context: GLContext) -> None:
     shader_settings = [
         RenderShaderSetting(
@@ -1,6 +1,13 @@
+import os
+
 import pytest
 
-from joulegl.opengl_helper.base.shader_parser import ShaderParser, get_shader_src
+from joulegl.opengl_helper.base.shader_parser import (
+    ShaderParser,
+    clear_shader_cache,
+    get_dependents,
+    get_shader_src,
+)
 
 
 def test_get_shader_src() -> None:
@@ -101,3 +108,121 @@ def test_shader_parser_ill_file() -> None:
     assert "Can't replace multiple dynamic variables in danymic shader src" in str(
         e.value
     )
+
+
+def test_shader_parser_fingerprint() -> None:
+    parser = ShaderParser()
+    other_parser = ShaderParser()
+    assert parser.fingerprint == other_parser.fingerprint
+
+    parser.set_static({"block_type_count": 5})
+    assert parser.fingerprint != other_parser.fingerprint
+
+    other_parser.set_static({"block_type_count": 5})
+    assert parser.fingerprint == other_parser.fingerprint
+
+    other_parser.set_dynamic({"block_type": {"id": ["0", "1"]}})
+    assert parser.fingerprint != other_parser.fingerprint
+    # the key is the normalized variables themselves, not a hash that may collide
+    assert other_parser.fingerprint == (
+        (("$block_type_count$", "5"),),
+        (("$$block_type_id$$", "block_type", ("0", "1")),),
+    )
+
+
+def test_shader_parser_memoized() -> None:
+    clear_shader_cache()
+    path = os.path.join("tests", "tmp", "memoized.vert")
+    with open(path, "w") as shader_file:
+        shader_file.write("//$const int count = $count$;\n")
+
+    parser = ShaderParser()
+    parser.set_static({"count": 5})
+    parsed_shader = parser.parse(path)
+    assert parsed_shader == "const int count = 5;\n"
+
+    other_parser = ShaderParser()
+    other_parser.set_static({"count": 5})
+    assert other_parser.parse(path) is parsed_shader
+
+    other_parser.set_static({"count": 6})
+    assert other_parser.parse(path) == "const int count = 6;\n"
+
+    with open(path, "w") as shader_file:
+        shader_file.write("//$const int amount = $count$;\n")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1000))
+    assert parser.parse(path) == "const int amount = 5;\n"
+
+
+def test_shader_parser_longest_marker() -> None:
+    parser = ShaderParser()
+    parser.set_static({"size": 1, "size_x": 2})
+    assert parser.process_line("$size$ $size_x$") == "1 2"
+
+
+def write_shader(name: str, src: str) -> str:
+    path = os.path.join("tests", "tmp", name)
+    mtime = os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+    with open(path, "w") as shader_file:
+        shader_file.write(src)
+    if os.stat(path).st_mtime_ns <= mtime:
+        os.utime(path, ns=(mtime + 1000, mtime + 1000))
+    return path
+
+
+def test_shader_parser_include() -> None:
+    clear_shader_cache()
+    write_shader("common.glsl", '#include "random.glsl"\nconst int count = $count$;\n')
+    program_path = write_shader(
+        "include.vert",
+        '#version 440\n#include "common.glsl"\n#include "common.glsl"\nvoid main() {}\n',
+    )
+
+    parser = ShaderParser()
+    parser.set_static({"count": 5})
+    parsed_shader = parser.parse(program_path)
+    assert parsed_shader.startswith("#version 440\n")
+    assert parsed_shader.count("highp float rand(vec2 co)") == 1
+    assert parsed_shader.count("const int count = 5;") == 1
+    assert "#include" not in parsed_shader
+
+    assert "#include" not in get_shader_src(program_path)
+    assert "const int count = $count$;" in get_shader_src(program_path)
+
+
+def test_shader_parser_include_missing() -> None:
+    program_path = write_shader("missing.vert", '#include "not_existing.glsl"\n')
+    with pytest.raises(Exception) as e:
+        ShaderParser().parse(program_path)
+    assert "Shader include 'not_existing.glsl'" in str(e.value)
+
+
+def test_shader_parser_include_dependents() -> None:
+    clear_shader_cache()
+    module_path = write_shader("module.glsl", "const float value = 1.0;\n")
+    dependent_path = write_shader("dependent.vert", '#include "module.glsl"\n')
+    independent_path = write_shader("independent.vert", "const float value = 2.0;\n")
+
+    parser = ShaderParser()
+    processed_sources = []
+    process = parser.process
+
+    def counting_process(src: str) -> str:
+        processed_sources.append(src)
+        return process(src)
+
+    parser.process = counting_process
+    parser.parse(dependent_path)
+    parser.parse(independent_path)
+    assert len(processed_sources) == 3
+    assert get_dependents(module_path) == [os.path.abspath(dependent_path)]
+
+    processed_sources.clear()
+    parser.parse(dependent_path)
+    parser.parse(independent_path)
+    assert len(processed_sources) == 0
+
+    write_shader("module.glsl", "const float value = 3.0;\n")
+    assert "value = 3.0" in parser.parse(dependent_path)
+    parser.parse(independent_path)
+    assert processed_sources == ["const float value = 3.0;\n"]
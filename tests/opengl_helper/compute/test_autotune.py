@@ -0,0 +1,182 @@
+import os
+from typing import Generator
+
+import numpy as np
+import pytest
+from OpenGL.GL import glIsProgram
+
+from joulegl.opengl_helper.base.shader_parser import ShaderParser
+from joulegl.opengl_helper.buffer import BufferObject, BufferType
+from joulegl.opengl_helper.compute.autotune import (
+    DEFAULT_LOCAL_SIZE,
+    ComputeAutotuner,
+    LocalSizeCache,
+    autotune_key,
+    is_tunable,
+)
+from joulegl.opengl_helper.compute.shader import ComputeShader, ComputeShaderSetting
+from joulegl.opengl_helper.compute.shader_handler import ComputeShaderHandler
+from joulegl.utility.glcontext import GLContext
+
+SHADER_PATH: str = os.path.join("tests", "shader", "add_tuned.comp")
+
+
+@pytest.fixture(scope="module")
+def gl_context() -> Generator[GLContext, None, None]:
+    context = GLContext()
+    with context:
+        yield context
+
+
+@pytest.fixture
+def cache() -> Generator[LocalSizeCache, None, None]:
+    cache = LocalSizeCache("test")
+    cache.clear()
+    cache.store()
+    yield cache
+    cache.clear()
+    cache.store()
+
+
+def test_autotune_key(gl_context: GLContext) -> None:
+    assert is_tunable(SHADER_PATH)
+    assert not is_tunable(os.path.join("tests", "shader", "add.comp"))
+
+    parser = ShaderParser()
+    assert autotune_key(SHADER_PATH) == autotune_key(SHADER_PATH, parser)
+    parser.set_static({"local_size_x": 32})
+    assert autotune_key(SHADER_PATH) == autotune_key(SHADER_PATH, parser)
+    parser.set_static({"other": 1})
+    assert autotune_key(SHADER_PATH) != autotune_key(SHADER_PATH, parser)
+
+
+def test_autotune_default_local_size(
+    gl_context: GLContext, cache: LocalSizeCache
+) -> None:
+    shader_handler = ComputeShaderHandler(autotuner=ComputeAutotuner(cache))
+    shader = shader_handler.create(ComputeShaderSetting("add", ["add_tuned.comp"]))
+    assert shader.local_size == (DEFAULT_LOCAL_SIZE, 1, 1)
+
+    parser = ShaderParser()
+    parser.set_static({"local_size_x": 16})
+    shader = shader_handler.create(
+        ComputeShaderSetting("add", ["add_tuned.comp"]), parser
+    )
+    assert shader.local_size == (16, 1, 1)
+    shader_handler.delete()
+
+
+def test_autotune_memoized(
+    gl_context: GLContext, cache: LocalSizeCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    count = 1000
+    buffer = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(np.zeros(count * 4, dtype=np.float32))
+
+    def setup(shader: ComputeShader) -> None:
+        buffer.bind(0)
+        shader.set_uniform_data([("value", 1.0, "float")])
+
+    shader_handler = ComputeShaderHandler(autotuner=ComputeAutotuner(cache, [16]))
+    shader_setting = ComputeShaderSetting("add", ["add_tuned.comp"])
+    shader = shader_handler.create(shader_setting)
+    assert shader.local_size == (DEFAULT_LOCAL_SIZE, 1, 1)
+
+    def not_memoized(shader_path: str) -> bool:
+        raise Exception("Tuned parser not memoized.")
+
+    # repeated lookups skip the source scan and the autotune key
+    monkeypatch.setattr(
+        "joulegl.opengl_helper.compute.shader_handler.is_tunable", not_memoized
+    )
+    assert shader_handler.create(shader_setting) == shader
+    monkeypatch.undo()
+
+    # a new tuning result replaces the memoized local size
+    shader_handler.get_autotuner().tune(SHADER_PATH, setup, count)
+    assert shader_handler.create(shader_setting).local_size == (16, 1, 1)
+
+    shader_handler.delete()
+    buffer.delete()
+
+
+def test_autotune_owned_variant(gl_context: GLContext, cache: LocalSizeCache) -> None:
+    shader_handler = ComputeShaderHandler(
+        max_variants=1, autotuner=ComputeAutotuner(cache)
+    )
+    shader_setting = ComputeShaderSetting("add", ["add_tuned.comp"])
+    # the owner is recorded under the tuned key the program is registered with
+    owned_shader = shader_handler.acquire(shader_setting)
+    owned_handle = owned_shader.shader_handle
+    assert shader_handler.variant_key(shader_setting) in shader_handler.shader_variants
+
+    shader_handler.create(ComputeShaderSetting("other", ["add.comp"]))
+    assert owned_shader.shader_handle == owned_handle
+    assert glIsProgram(owned_handle)
+
+    shader_handler.release(shader_handler.variant_key(shader_setting))
+    assert owned_shader.shader_handle == 0
+    assert len(shader_handler.shader_variants) == 1
+    shader_handler.delete()
+
+
+def test_autotune_include_dirs(
+    gl_context: GLContext, cache: LocalSizeCache, tmp_path
+) -> None:
+    shader_dir = tmp_path / "shader"
+    include_dir = tmp_path / "include"
+    shader_dir.mkdir()
+    include_dir.mkdir()
+    with open(SHADER_PATH) as shader_file:
+        src = shader_file.read()
+    # the written value comes from an include only the parser can resolve
+    (shader_dir / "add_included.comp").write_text(
+        src.replace('#include "compute.glsl"', '#include "user_value.glsl"')
+    )
+    (include_dir / "user_value.glsl").write_text('#include "compute.glsl"\n')
+
+    parser = ShaderParser([str(include_dir)])
+    shader_path = str(shader_dir / "add_included.comp")
+    assert is_tunable(shader_path, parser)
+    assert autotune_key(shader_path, parser) == autotune_key(SHADER_PATH)
+
+    shader_handler = ComputeShaderHandler(
+        str(shader_dir), autotuner=ComputeAutotuner(cache)
+    )
+    shader = shader_handler.create(
+        ComputeShaderSetting("add", ["add_included.comp"]), parser
+    )
+    assert shader.local_size == (DEFAULT_LOCAL_SIZE, 1, 1)
+    shader_handler.delete()
+
+
+def test_autotune(gl_context: GLContext, cache: LocalSizeCache) -> None:
+    count = 1000
+    buffer = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(np.zeros(count * 4, dtype=np.float32))
+
+    def setup(shader: ComputeShader) -> None:
+        buffer.bind(0)
+        shader.set_uniform_data([("value", 1.0, "float")])
+
+    autotuner = ComputeAutotuner(cache, [16, 32, 48], repetitions=2)
+    local_size = autotuner.tune(SHADER_PATH, setup, count)
+    assert local_size in [16, 32, 48]
+    assert [timing[0] for timing in autotuner.timings] == [16, 32, 48]
+    assert np.all(buffer.read() == 1.0)
+
+    assert LocalSizeCache("test")[autotune_key(SHADER_PATH)] == local_size
+    assert autotuner.tune(SHADER_PATH, setup, count) == local_size
+
+    shader_handler = ComputeShaderHandler(
+        autotuner=ComputeAutotuner(LocalSizeCache("test"))
+    )
+    shader = shader_handler.create(ComputeShaderSetting("add", ["add_tuned.comp"]))
+    assert shader.local_size == (local_size, 1, 1)
+
+    with pytest.raises(Exception) as e:
+        ComputeAutotuner(cache, [1 << 20]).tune(SHADER_PATH, setup, count, force=True)
+    assert e.value.args[0] == "No local size candidate fits the device limits."
+
+    shader_handler.delete()
+    buffer.delete()
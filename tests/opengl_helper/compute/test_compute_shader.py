@@ -4,8 +4,10 @@ import numpy as np
 import pytest
 from OpenGL.GL import *
 
+from joulegl.opengl_helper.buffer import BufferObject, BufferType, IndirectBufferObject
 from joulegl.opengl_helper.compute.shader import ComputeShaderSetting
 from joulegl.opengl_helper.compute.shader_handler import ComputeShaderHandler
+from joulegl.opengl_helper.compute.utility import generate_compute_function
 from joulegl.opengl_helper.texture import Texture
 from joulegl.utility.glcontext import GLContext
 
@@ -69,3 +71,104 @@ def test_compute_workgroup_max(gl_context: GLContext) -> None:
     shader.compute(3)
 
     assert shader == shader_handler.get("add")
+
+
+def test_compute_dispatch_size(gl_context: GLContext) -> None:
+    shader_handler = ComputeShaderHandler()
+    shader = shader_handler.create(ComputeShaderSetting("add", ["add.comp"]))
+
+    assert shader.local_size == (64, 1, 1)
+    assert shader.offset_location == -1
+    assert shader.dispatch_size(1) == (1, 1, 1)
+    assert shader.dispatch_size(64) == (1, 1, 1)
+    assert shader.dispatch_size(65) == (2, 1, 1)
+
+    shader.max_workgroup_size = 4
+    shader.max_workgroup_count = (3, 2)
+    assert shader.dispatch_size(64 * 8) == (4, 2, 1)
+    assert shader.dispatch_size(64 * 13) == (4, 3, 2)
+    with pytest.raises(Exception) as e:
+        shader.dispatch_size(64 * 25)
+    assert e.value.args[0] == "Can't dispatch 1600 elements in a single compute call."
+
+
+@pytest.mark.parametrize("shader_name", ["add", "add_offset"])
+@pytest.mark.parametrize("element_count", [1, 5, 64, 100, 1000])
+def test_compute_covers_elements(
+    gl_context: GLContext, shader_name: str, element_count: int
+) -> None:
+    buffer = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(np.zeros((element_count + 8) * 4, dtype=np.float32))
+    buffer.bind(0)
+
+    shader_handler = ComputeShaderHandler()
+    shader = shader_handler.create(
+        ComputeShaderSetting(shader_name, [shader_name + ".comp"])
+    )
+    shader.max_workgroup_size = 4
+    shader.use()
+    shader.set_uniform_data([("value", 1.0, "float")])
+    shader.compute(element_count, barrier=True)
+
+    data = buffer.read().reshape(-1, 4)
+    assert np.all(data[:element_count] == 1.0)
+    if shader_name == "add":
+        assert np.all(data[element_count:] == 0.0)
+    buffer.delete()
+
+
+def test_compute_indirect(gl_context: GLContext) -> None:
+    buffer = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(np.zeros(256 * 4, dtype=np.float32))
+    buffer.bind(0)
+    command_buffer = IndirectBufferObject(BufferType.DISPATCH_INDIRECT_BUFFER)
+    command_buffer.load_commands([(0, 0, 0)])
+    command_buffer.bind(1)
+
+    shader_handler = ComputeShaderHandler()
+    command_shader = shader_handler.create(
+        ComputeShaderSetting("indirect_dispatch", ["indirect_dispatch.comp"])
+    )
+    command_shader.use()
+    command_shader.set_uniform_data([("group_count", 2, "int")])
+    command_shader.compute(1, barrier=True)
+    assert tuple(command_buffer.read()[0]) == (2, 1, 1)
+
+    shader = shader_handler.create(ComputeShaderSetting("add", ["add.comp"]))
+    shader.use()
+    shader.set_uniform_data([("value", 1.0, "float")])
+    shader.compute(16)
+    generate_compute_function(shader, indirect_buffer=command_buffer)(0)
+
+    data = buffer.read().reshape(-1, 4)
+    assert np.all(data[:128] == 1.0)
+    assert np.all(data[128:] == 0.0)
+
+    buffer.delete()
+    command_buffer.delete()
+
+
+def test_compute_texture(gl_context: GLContext) -> None:
+    texture = Texture(5, 6, 7)
+    texture.setup(np.zeros(5 * 6 * 7 * 4, dtype=np.float32), 0)
+    texture.bind_as_image("write", 0)
+
+    shader = ComputeShaderHandler().create(
+        ComputeShaderSetting("image_coords", ["image_coords.comp"])
+    )
+    assert shader.image_dispatch_size(5, 6, 7) == (2, 2, 2)
+    with pytest.raises(Exception) as e:
+        shader.image_dispatch_size(4, 4, 4 * 2**20)
+    assert e.value.args[0].startswith("Can't dispatch image of size")
+
+    shader.use()
+    shader.compute_texture(texture, barrier=True)
+
+    data = np.asarray(texture.read()).reshape(7, 6, 5, 4)
+    z, y, x = np.meshgrid(np.arange(7), np.arange(6), np.arange(5), indexing="ij")
+    assert np.array_equal(data[..., 0], x)
+    assert np.array_equal(data[..., 1], y)
+    assert np.array_equal(data[..., 2], z)
+    assert np.all(data[..., 3] == 1.0)
+
+    texture.delete()
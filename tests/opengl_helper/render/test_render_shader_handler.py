@@ -1,8 +1,10 @@
 from typing import Generator
 
 import pytest
+from OpenGL.GL import *
 
 from joulegl.opengl_helper.base.shader import ShaderSetting
+from joulegl.opengl_helper.base.shader_parser import ShaderParser
 from joulegl.opengl_helper.render.shader import RenderShader, RenderShaderSetting
 from joulegl.opengl_helper.render.shader_handler import RenderShaderHandler
 from joulegl.utility.glcontext import GLContext
@@ -50,3 +52,80 @@ def test_render_shader_handler_twice(gl_context: GLContext) -> None:
     new_shader = shader_handler.create(shader_setting, None)
     assert new_shader == shader
     assert shader_handler.shader_list["screen_quad"] == shader
+
+
+def test_render_shader_handler_variants(gl_context: GLContext) -> None:
+    shader_setting = RenderShaderSetting(
+        "screen_quad", ["screen_quad.vert", "screen_quad.frag"]
+    )
+    parser = ShaderParser()
+    parser.set_static({"variant": 1})
+    same_parser = ShaderParser()
+    same_parser.set_static({"variant": 1})
+    other_parser = ShaderParser()
+    other_parser.set_static({"variant": 2})
+
+    shader_handler = RenderShaderHandler()
+    shader = shader_handler.create(shader_setting, parser)
+    assert shader_handler.create(shader_setting, same_parser) == shader
+    other_shader = shader_handler.create(shader_setting, other_parser)
+    assert other_shader != shader
+    assert other_shader.shader_handle != shader.shader_handle
+    assert len(shader_handler.shader_variants) == 2
+
+    assert shader_handler.get("screen_quad", parser) == shader
+    assert shader_handler.get("screen_quad") == shader
+    with pytest.raises(KeyError):
+        shader_handler.get("screen_quad", ShaderParser())
+
+    shader_handler.delete()
+    assert len(shader_handler.shader_variants) == 0
+    assert shader.shader_handle == 0
+
+
+def test_render_shader_handler_eviction(gl_context: GLContext) -> None:
+    shader_setting = RenderShaderSetting(
+        "screen_quad", ["screen_quad.vert", "screen_quad.frag"]
+    )
+    parsers = []
+    for i in range(3):
+        parsers.append(ShaderParser())
+        parsers[i].set_static({"variant": i})
+
+    shader_handler = RenderShaderHandler(max_variants=2)
+    first_shader = shader_handler.create(shader_setting, parsers[0])
+    first_handle = first_shader.shader_handle
+    second_shader = shader_handler.create(shader_setting, parsers[1])
+    assert shader_handler.create(shader_setting, parsers[0]) == first_shader
+
+    shader_handler.create(shader_setting, parsers[2])
+    assert len(shader_handler.shader_variants) == 2
+    assert second_shader.shader_handle == 0
+    assert first_shader.shader_handle == first_handle
+    assert glIsProgram(first_handle)
+
+
+def test_render_shader_handler_owned_variants(gl_context: GLContext) -> None:
+    shader_setting = RenderShaderSetting(
+        "screen_quad", ["screen_quad.vert", "screen_quad.frag"]
+    )
+    parsers = []
+    for i in range(3):
+        parsers.append(ShaderParser())
+        parsers[i].set_static({"variant": i})
+
+    shader_handler = RenderShaderHandler(max_variants=1)
+    owned_shader = shader_handler.acquire(shader_setting, parsers[0])
+    owned_handle = owned_shader.shader_handle
+    # lookups of other variants never evict a program a processor still holds
+    shader_handler.create(shader_setting, parsers[1])
+    transient_shader = shader_handler.create(shader_setting, parsers[2])
+    assert owned_shader.shader_handle == owned_handle
+    assert glIsProgram(owned_handle)
+    assert transient_shader.shader_handle != 0
+    assert len(shader_handler.shader_variants) == 2
+
+    shader_handler.release(shader_handler.variant_key(shader_setting, parsers[0]))
+    assert owned_shader.shader_handle == 0
+    assert len(shader_handler.shader_variants) == 1
+    shader_handler.delete()
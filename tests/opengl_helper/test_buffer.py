@@ -4,13 +4,20 @@ import numpy as np
 import pytest
 from OpenGL.GL import *
 
+from joulegl.opengl_helper.base.config import ShaderTableConfig
 from joulegl.opengl_helper.buffer import (
+    AppendBuffer,
+    AtomicCounterBufferObject,
     BufferCopy,
     BufferObject,
     BufferType,
+    IndirectBufferObject,
     OverflowingBufferObject,
     SwappingBufferObject,
+    TableBufferObject,
 )
+from joulegl.opengl_helper.compute.shader import ComputeShaderSetting
+from joulegl.opengl_helper.compute.shader_handler import ComputeShaderHandler
 from joulegl.opengl_helper.frame_buffer import FrameBufferObject
 from joulegl.utility.glcontext import GLContext
 from tests.rendering.test_renderer import (
@@ -106,6 +113,24 @@ def test_swapping_buffer_object(gl_context: GLContext) -> None:
     buffer.delete()
 
 
+def test_buffer_copy_from(gl_context: GLContext) -> None:
+    source = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    source.load(np.arange(16, dtype=np.float32))
+    target = BufferObject()
+    target.copy_from(source, 8 * 4)
+    assert target.size == 8 * 4
+    assert np.array_equal(target.read(), np.arange(8, dtype=np.float32))
+
+    swapping = SwappingBufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    swapping.copy_from(source)
+    assert np.array_equal(swapping.read(), np.arange(16, dtype=np.float32))
+    swapping.swap()
+    assert np.array_equal(swapping.read(), np.arange(16, dtype=np.float32))
+
+    for buffer in [source, target, swapping]:
+        buffer.delete()
+
+
 @pytest.mark.parametrize("max_size", [250, 2000])
 def test_overflowing_buffer_object(gl_context: GLContext, max_size: int) -> None:
     def split_data(data: np.ndarray, index: int, max_size: int, object_size: int):
@@ -277,3 +302,130 @@ def test_ssbo_buffer_copy(gl_context: GLContext) -> None:
 
 
 # TODO: test element array buffer
+
+
+def test_table_buffer_object(gl_context: GLContext) -> None:
+    table = ShaderTableConfig()
+    table.set_columns([("color", "vec3"), ("id", "int")])
+    table.set_rows(
+        [
+            ("first", 0, {"color": [1.0, 0.0, 0.0], "id": 3}),
+            ("second", 1, {"color": [0.0, 1.0, 0.0], "id": 4}),
+        ]
+    )
+    buffer = TableBufferObject(table)
+    buffer.update()
+    assert buffer.loaded
+    assert buffer.size == 2 * table.dtype.itemsize
+    handle = buffer.handle
+
+    read_data = buffer.read()
+    assert np.array_equal(read_data[1]["color"], [0.0, 1.0, 0.0])
+    assert read_data[1]["id"] == 4
+
+    buffer.set_row("second", {"color": [0.0, 0.0, 1.0]})
+    read_data = buffer.read()
+    assert np.array_equal(read_data[1]["color"], [0.0, 0.0, 1.0])
+    assert np.array_equal(read_data[0]["color"], [1.0, 0.0, 0.0])
+    assert buffer.handle == handle
+
+    table.set_rows([("third", 2, {"color": [1.0, 1.0, 1.0], "id": 5})])
+    buffer.update()
+    read_data = buffer.read()
+    assert len(read_data) == 3
+    assert read_data[2]["id"] == 5
+
+    buffer.bind(3, rendering=True)
+    assert glGetIntegeri_v(GL_SHADER_STORAGE_BUFFER_BINDING, 3) == buffer.handle
+
+    buffer.delete()
+
+
+def test_buffer_object_write(gl_context: GLContext) -> None:
+    data = np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32)
+    buffer = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(data)
+    buffer.write(np.array([5.0], dtype=np.float32), 8)
+    assert np.array_equal(buffer.read(), [1.0, 2.0, 5.0, 4.0])
+
+    with pytest.raises(Exception) as e:
+        buffer.write(data, 4)
+    assert "Data to write exceeds buffer" in e.value.args[0]
+    buffer.delete()
+
+
+def test_indirect_buffer_object(gl_context: GLContext) -> None:
+    with pytest.raises(Exception) as e:
+        IndirectBufferObject(BufferType.ARRAY_BUFFER)
+    assert e.value.args[0] == "Indirect buffer can't be of type 'ARRAY_BUFFER'."
+
+    dispatch_buffer = IndirectBufferObject(BufferType.DISPATCH_INDIRECT_BUFFER)
+    assert dispatch_buffer.command_dtype.itemsize == 12
+    draw_buffer = IndirectBufferObject()
+    assert draw_buffer.command_dtype.itemsize == 16
+    elements_buffer = IndirectBufferObject(indexed=True)
+    assert elements_buffer.command_dtype.itemsize == 20
+    assert elements_buffer.command_offset(2) == 40
+
+    draw_buffer.load_commands([(6, 1, 0, 0), (3, 2, 6, 0)])
+    draw_buffer.set_command(1, (9, 4, 0, 1))
+    commands = draw_buffer.read()
+    assert tuple(commands[0]) == (6, 1, 0, 0)
+    assert tuple(commands[1]) == (9, 4, 0, 1)
+
+    draw_buffer.bind(2)
+    assert glGetIntegerv(GL_DRAW_INDIRECT_BUFFER_BINDING) == draw_buffer.handle
+    assert glGetIntegeri_v(GL_SHADER_STORAGE_BUFFER_BINDING, 2) == draw_buffer.handle
+
+    dispatch_buffer.delete()
+    draw_buffer.delete()
+    elements_buffer.delete()
+
+
+def test_atomic_counter_buffer_object(gl_context: GLContext) -> None:
+    counter_buffer = AtomicCounterBufferObject(2)
+    assert np.array_equal(counter_buffer.values(), [0, 0])
+    counter_buffer.reset(5)
+    assert np.array_equal(counter_buffer.values(), [5, 5])
+
+    counter_buffer.bind(3)
+    assert glGetIntegeri_v(GL_ATOMIC_COUNTER_BUFFER_BINDING, 3) == counter_buffer.handle
+    counter_buffer.delete()
+
+
+@pytest.mark.parametrize("capacity", [1000, 100])
+def test_append_buffer(gl_context: GLContext, capacity: int) -> None:
+    data = np.random.default_rng(0).random(1000, dtype=np.float32)
+    input_buffer = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    input_buffer.load(data)
+    append_buffer = AppendBuffer(capacity, object_size=1)
+
+    shader = ComputeShaderHandler().create(
+        ComputeShaderSetting("append_filter", ["append_filter.comp"])
+    )
+    input_buffer.bind(0)
+    append_buffer.bind(1)
+    shader.use()
+    shader.set_uniform_data(
+        [("capacity", capacity, "int"), ("threshold", 0.5, "float")]
+    )
+    for _ in range(2):
+        append_buffer.reset()
+        shader.compute(len(data), barrier=True)
+
+    expected = np.sort(data[data > 0.5])
+    assert append_buffer.count() == min(len(expected), capacity)
+    appended = np.sort(append_buffer.read())
+    if capacity >= len(expected):
+        assert np.array_equal(appended, expected)
+    else:
+        assert np.all(np.isin(appended, expected))
+
+    assert tuple(append_buffer.counter.read()[0])[1:] == (1, 0, 0)
+    append_buffer.request_count()
+    glFinish()
+    assert append_buffer.poll_count() == append_buffer.count()
+    assert append_buffer.poll_count() is None
+
+    input_buffer.delete()
+    append_buffer.delete()
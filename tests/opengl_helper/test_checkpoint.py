@@ -0,0 +1,138 @@
+import json
+
+import numpy as np
+import pytest
+
+from joulegl.opengl_helper.buffer import (
+    BufferObject,
+    BufferType,
+    OverflowingBufferObject,
+    SwappingBufferObject,
+)
+from joulegl.opengl_helper.checkpoint import (
+    CHECKPOINT_ALIGNMENT,
+    CHECKPOINT_MAGIC,
+    Checkpoint,
+    CheckpointWriter,
+    save_checkpoint,
+)
+from joulegl.opengl_helper.texture import Texture
+from joulegl.utility.glcontext import GLContext
+
+
+@pytest.fixture(scope="module")
+def gl_context():
+    context = GLContext()
+    with context:
+        yield context
+
+
+def test_checkpoint_round_trip(gl_context: GLContext, tmp_path) -> None:
+    path = str(tmp_path / "state.ckpt")
+    positions_data = np.arange(4000, dtype=np.float32)
+    indices_data = np.arange(1000, dtype=np.uint32)[::-1].copy()
+    texture_data = np.random.random((4, 8, 16, 4)).astype(np.float32)
+
+    positions = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+    positions.load(positions_data)
+    indices = SwappingBufferObject(BufferType.ARRAY_BUFFER)
+    indices.load(indices_data)
+    volume = Texture(16, 8, 4)
+    volume.setup(texture_data, 0)
+
+    writer = save_checkpoint(
+        path,
+        {"positions": positions, "indices": indices},
+        {"volume": volume},
+        metadata={"frame": 12},
+    )
+    # the checkpoint holds the state at start, later changes are not written
+    positions.write(np.zeros(10, dtype=np.float32))
+    while not writer.poll():
+        pass
+    assert writer.poll()
+
+    checkpoint = Checkpoint(path)
+    assert checkpoint.metadata == {"frame": 12}
+    assert checkpoint.names == ["positions", "indices", "volume"]
+    for section in checkpoint.sections.values():
+        assert section["offset"] % CHECKPOINT_ALIGNMENT == 0
+    assert checkpoint.sections["indices"]["dtype"] == np.dtype(np.uint32).str
+    assert np.array_equal(checkpoint.array("positions"), positions_data)
+
+    restored_positions = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+    restored_indices = SwappingBufferObject(BufferType.ARRAY_BUFFER)
+    checkpoint.restore({"positions": restored_positions, "indices": restored_indices})
+    restored_volume = checkpoint.restore_texture("volume")
+    assert np.array_equal(restored_positions.read(), positions_data)
+    assert np.array_equal(restored_indices.read(), indices_data)
+    restored_indices.swap()
+    assert np.array_equal(restored_indices.read(), indices_data)
+    assert np.array_equal(restored_volume.read().reshape(-1), texture_data.reshape(-1))
+    checkpoint.close()
+
+    for buffer in [positions, indices, restored_positions, restored_indices]:
+        buffer.delete()
+    volume.delete()
+    restored_volume.delete()
+
+
+def test_checkpoint_layout(gl_context: GLContext, tmp_path) -> None:
+    path = str(tmp_path / "many.ckpt")
+    buffers = dict()
+    for i in range(200):
+        buffer = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+        buffer.load(np.full(i, i, dtype=np.int32))
+        buffers["buffer_with_a_long_name_%d" % i] = buffer
+    save_checkpoint(path, buffers, wait=True)
+
+    with open(path, "rb") as checkpoint_file:
+        assert checkpoint_file.read(len(CHECKPOINT_MAGIC)) == CHECKPOINT_MAGIC
+        header_size = int(np.frombuffer(checkpoint_file.read(8), np.uint64)[0])
+        header = json.loads(checkpoint_file.read(header_size))
+    assert header_size > CHECKPOINT_ALIGNMENT
+    first_offset = min(section["offset"] for section in header["sections"])
+    assert first_offset >= len(CHECKPOINT_MAGIC) + 8 + header_size
+    assert first_offset % CHECKPOINT_ALIGNMENT == 0
+
+    checkpoint = Checkpoint(path)
+    for i, (name, buffer) in enumerate(buffers.items()):
+        assert np.array_equal(checkpoint.array(name), np.full(i, i, dtype=np.int32))
+        buffer.delete()
+    checkpoint.close()
+
+
+def test_checkpoint_errors(gl_context: GLContext, tmp_path) -> None:
+    writer = CheckpointWriter(str(tmp_path / "errors.ckpt"))
+    with pytest.raises(Exception) as e:
+        writer.add_buffer("empty", BufferObject(BufferType.SHADER_STORAGE_BUFFER))
+    assert e.value.args[0] == "Can't checkpoint buffer 'empty' without data."
+    overflowing = OverflowingBufferObject(lambda data, *_: data)
+    overflowing.load(np.zeros(4, dtype=np.float32))
+    with pytest.raises(Exception) as e:
+        writer.add_buffer("overflowing", overflowing)
+    assert e.value.args[0] == "Can't checkpoint overflowing buffer 'overflowing'."
+    with pytest.raises(Exception) as e:
+        writer.poll()
+    assert e.value.args[0] == "Checkpoint '%s' was not started." % writer.path
+
+    path = str(tmp_path / "buffer.ckpt")
+    buffer = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(np.zeros(4, dtype=np.float32))
+    save_checkpoint(path, {"data": buffer}, wait=True)
+    checkpoint = Checkpoint(path)
+    with pytest.raises(Exception) as e:
+        checkpoint.restore_texture("data")
+    assert e.value.args[0] == "Checkpoint section 'data' is a buffer, not a texture."
+    with pytest.raises(Exception) as e:
+        checkpoint.restore_buffer("missing", buffer)
+    assert e.value.args[0] == "Checkpoint '%s' has no section 'missing'." % path
+    checkpoint.close()
+
+    invalid_path = tmp_path / "invalid.ckpt"
+    invalid_path.write_bytes(b"not a checkpoint")
+    with pytest.raises(Exception) as e:
+        Checkpoint(str(invalid_path))
+    assert e.value.args[0] == "File '%s' is not a checkpoint." % invalid_path
+    buffer.delete()
+    overflowing.delete()
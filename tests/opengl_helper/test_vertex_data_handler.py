@@ -146,6 +146,18 @@ def test_overflowing_vertex_data_handler(
         assert handle == overflowing_buffer.overflowing_handles[i]
     assert glGetIntegeri_v(GL_SHADER_STORAGE_BUFFER_BINDING, 4) == buffer.handle
 
+    # batched rendering keeps the plain buffers as vertex attributes
+    data_handler.set_range(2, rendering=True)
+    assert glGetVertexAttribiv(4, GL_VERTEX_ATTRIB_ARRAY_ENABLED)[0]
+    assert (
+        glGetVertexAttribiv(4, GL_VERTEX_ATTRIB_ARRAY_BUFFER_BINDING)[0]
+        == buffer.handle
+    )
+    assert (
+        glGetIntegeri_v(GL_SHADER_STORAGE_BUFFER_BINDING, 1)
+        == overflowing_buffer.overflowing_handles[1]
+    )
+
     data_handler.delete()
 
 
@@ -0,0 +1,147 @@
+from typing import Generator
+
+import numpy as np
+import pytest
+from OpenGL.GL import GL_NO_ERROR, GL_TRIANGLES, glGetError
+
+from joulegl.opengl_helper.buffer import BufferObject
+from joulegl.opengl_helper.render.utility import OglPrimitives
+from joulegl.opengl_helper.transform_feedback.shader import (
+    TransformFeedbackShaderSetting,
+)
+from joulegl.opengl_helper.transform_feedback.shader_handler import (
+    TransformFeedbackShaderHandler,
+)
+from joulegl.opengl_helper.transform_feedback.utility import (
+    PrimitiveCountQuery,
+    generate_feedback_function,
+)
+from joulegl.opengl_helper.vertex_data_handler import VertexDataHandler
+from joulegl.utility.glcontext import GLContext
+
+
+@pytest.fixture(scope="module")
+def gl_context() -> Generator[GLContext, None, None]:
+    context = GLContext()
+    with context:
+        yield context
+
+
+def test_wrong_shader_setting() -> None:
+    with pytest.raises(Exception) as e:
+        TransformFeedbackShaderSetting("id", ["vert", "geom", "extra"], ["out"])
+    assert e.value.args[0] == (
+        "Can't handle number of shaders for a program (either 1 or 2 with geometry shader)."
+    )
+    with pytest.raises(Exception) as e:
+        TransformFeedbackShaderSetting("id", ["vert"], [])
+    assert e.value.args[0] == "Transform feedback program requires captured varyings."
+
+
+def test_wrong_primitive() -> None:
+    with pytest.raises(Exception) as e:
+        generate_feedback_function(OglPrimitives.LINES_ADJACENCY, [])
+    assert e.value.args[0] == (
+        "Transform feedback can't capture primitive 'LINES_ADJACENCY'."
+    )
+
+
+def test_transform_feedback(gl_context: GLContext) -> None:
+    data = np.random.default_rng(0).random((100, 4), dtype=np.float32)
+    buffer = BufferObject()
+    buffer.load(data.flatten())
+    capture_buffer = BufferObject()
+    capture_buffer.load_empty(np.float32, 100 * 5)
+    data_handler = VertexDataHandler([(buffer, 0)])
+
+    shader = TransformFeedbackShaderHandler().create(
+        TransformFeedbackShaderSetting(
+            "scale", ["scale_feedback.vert"], ["scaled_position", "position_length"]
+        )
+    )
+    query = PrimitiveCountQuery()
+    feedback_func = generate_feedback_function(
+        OglPrimitives.POINTS, [capture_buffer], query
+    )
+
+    shader.set_uniform_data([("scale", 3.0, "float")])
+    shader.use()
+    data_handler.set(True)
+    feedback_func(len(data))
+
+    assert query.update(wait=True) == len(data)
+    captured = capture_buffer.read().reshape(-1, 5)
+    assert np.allclose(captured[:, :3], data[:, :3] * 3.0)
+    assert np.allclose(captured[:, 3], data[:, 3])
+    assert np.allclose(captured[:, 4], np.linalg.norm(data[:, :3], axis=1))
+
+    query.delete()
+    data_handler.delete()
+    buffer.delete()
+    capture_buffer.delete()
+
+
+def test_transform_feedback_geometry(gl_context: GLContext) -> None:
+    count = 10
+    data = np.random.default_rng(0).random((count, 4), dtype=np.float32)
+    buffer = BufferObject()
+    buffer.load(data.flatten())
+    capture_buffer = BufferObject()
+    capture_buffer.load_empty(np.float32, count * 12 * 3 * 4)
+    data_handler = VertexDataHandler([(buffer, 0)])
+
+    shader = TransformFeedbackShaderHandler().create(
+        TransformFeedbackShaderSetting(
+            "cube", ["point_to_cube.vert", "point_to_cube.geom"], ["gl_Position"]
+        )
+    )
+    assert shader.feedback_mode == GL_TRIANGLES
+    query = PrimitiveCountQuery()
+    # points are drawn, but the geometry stage emits triangle strips
+    feedback_func = generate_feedback_function(
+        OglPrimitives.POINTS, [capture_buffer], query, shader
+    )
+
+    shader.use()
+    data_handler.set(True)
+    feedback_func(count)
+    assert glGetError() == GL_NO_ERROR
+    assert query.update(wait=True) == count * 12
+
+    query.delete()
+    data_handler.delete()
+    buffer.delete()
+    capture_buffer.delete()
+
+
+def test_primitive_count_query_ring(gl_context: GLContext) -> None:
+    data = np.random.default_rng(0).random((100, 4), dtype=np.float32)
+    buffer = BufferObject()
+    buffer.load(data.flatten())
+    capture_buffer = BufferObject()
+    capture_buffer.load_empty(np.float32, 100 * 5)
+    data_handler = VertexDataHandler([(buffer, 0)])
+    shader = TransformFeedbackShaderHandler().create(
+        TransformFeedbackShaderSetting(
+            "scale", ["scale_feedback.vert"], ["scaled_position", "position_length"]
+        )
+    )
+    query = PrimitiveCountQuery(ring_size=2)
+    feedback_func = generate_feedback_function(
+        OglPrimitives.POINTS, [capture_buffer], query
+    )
+
+    shader.use()
+    data_handler.set(True)
+    # a pending query object is never restarted, the ring waits for the oldest
+    for element_count in [10, 20, 30, 40]:
+        feedback_func(element_count)
+        assert len(query.pending) <= 2
+        assert len(set(query.pending)) == len(query.pending)
+    assert query.update(wait=True) == 40
+    assert len(query.pending) == 0
+
+    query.delete()
+    data_handler.delete()
+    buffer.delete()
+    capture_buffer.delete()
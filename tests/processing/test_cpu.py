@@ -0,0 +1,106 @@
+from typing import Any, Callable, Dict, Generator, List
+
+import numpy as np
+import pytest
+
+from joulegl.opengl_helper.base.config import ShaderConfig
+from joulegl.opengl_helper.base.data_set import BaseShaderSet
+from joulegl.opengl_helper.buffer import BufferObject, BufferType
+from joulegl.opengl_helper.compute.shader import ComputeShaderSetting
+from joulegl.opengl_helper.compute.utility import generate_compute_function
+from joulegl.opengl_helper.vertex_data_handler import VertexDataHandler
+from joulegl.processing.cpu import CPUExecutor, CPUSet
+from joulegl.processing.processor import ComputePass, ComputeProcessor
+from joulegl.utility.glcontext import GLContext
+
+
+@pytest.fixture(scope="module")
+def gl_context() -> Generator[GLContext, None, None]:
+    context = GLContext()
+    with context:
+        yield context
+
+
+def scale_kernel(
+    inputs: List[np.ndarray], outputs: List[np.ndarray], uniforms: Dict[str, Any]
+) -> None:
+    outputs[0][:] = inputs[0] * uniforms["factor"]
+
+
+def test_executor_chunks() -> None:
+    executor = CPUExecutor(workers=3, chunk_size=4)
+    assert executor.chunks(10) == [(0, 4), (4, 8), (8, 10)]
+    assert executor.chunks(6) == [(0, 2), (2, 4), (4, 6)]
+    assert executor.chunks(0) == []
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_executor(use_processes: bool) -> None:
+    data = np.random.default_rng(0).random((1000, 4), dtype=np.float32)
+    result = np.zeros_like(data)
+    executor = CPUExecutor(workers=2, use_processes=use_processes, chunk_size=128)
+
+    executor.run(scale_kernel, [data], [result], {"factor": 3.0})
+
+    assert np.allclose(result, data * 3.0)
+    assert executor.stats.elements == 1000
+    assert executor.stats.throughput > 0.0
+    executor.delete()
+
+
+class ScaleProcessor(ComputeProcessor):
+    def __init__(self, data: BufferObject, result: BufferObject, count: int) -> None:
+        super().__init__()
+        self.set_shader([ComputeShaderSetting("scale", ["scale.comp"])])
+        self.data_handler: VertexDataHandler = VertexDataHandler(
+            [(data, 0), (result, 1)]
+        )
+
+        def generate_element_count_func(count: int) -> Callable:
+            def element_count_func() -> int:
+                return count
+
+            return element_count_func
+
+        self.execute_funcs["scale"] = generate_compute_function(self.shaders["scale"])
+        self.element_count_funcs["scale"] = generate_element_count_func(count)
+        self.create_sets(self.data_handler, "scale")
+        self.create_cpu_set("scale_cpu", scale_kernel, [data], [result], "scale")
+
+        self.add_buffer("data", data)
+        self.add_buffer("result", result)
+        self.add_pass(ComputePass("scale", ["data"], ["result"], set_name="scale_cpu"))
+
+    def process(self, set_name: str, config: ShaderConfig | None = None) -> None:
+        current_set: BaseShaderSet = self.sets[set_name]
+        current_set.set_uniform_data([("factor", 2.0, "float")])
+        current_set.use()
+
+    def delete(self) -> None:
+        self.data_handler.delete()
+        self.delete_pipeline()
+
+
+def test_cpu_set(gl_context: GLContext) -> None:
+    count = 700
+    values = np.random.default_rng(1).random(count * 4, dtype=np.float32)
+    data = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    data.load(values)
+    result = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    result.load(np.zeros(count * 4, dtype=np.float32))
+    processor = ScaleProcessor(data, result, count)
+    assert isinstance(processor.sets["scale_cpu"], CPUSet)
+
+    processor.process("scale")
+    gpu_result = result.read().copy()
+    result.write(np.zeros(count * 4, dtype=np.float32))
+
+    processor.run_pipeline()
+    assert np.allclose(result.read(), gpu_result)
+    assert np.allclose(gpu_result, values * 2.0)
+    assert processor.throughput()["scale"] > 0.0
+
+    processor.delete()
+    assert processor.cpu_executor is None
+    data.delete()
+    result.delete()
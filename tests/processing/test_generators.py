@@ -0,0 +1,130 @@
+from typing import Generator
+
+import numpy as np
+import pytest
+
+from joulegl.opengl_helper.buffer import AppendBuffer
+from joulegl.processing.generators import ComputeGenerators, value_expression
+from joulegl.utility.glcontext import GLContext
+
+
+@pytest.fixture(scope="module")
+def gl_context() -> Generator[GLContext, None, None]:
+    context = GLContext()
+    with context:
+        yield context
+
+
+@pytest.fixture(scope="module")
+def generators(gl_context: GLContext) -> Generator[ComputeGenerators, None, None]:
+    generators = ComputeGenerators()
+    yield generators
+    generators.delete()
+
+
+def sorted_rows(data: np.ndarray) -> np.ndarray:
+    rows = data.reshape(-1, 4)
+    return rows[np.lexsort(rows.T[::-1])]
+
+
+def grid(size: tuple, spacing: float, origin: tuple) -> np.ndarray:
+    coords = np.stack(
+        np.meshgrid(*[np.arange(axis) for axis in size], indexing="ij"), axis=-1
+    ).reshape(-1, 3)
+    return np.array(origin, dtype=np.float32) + coords.astype(np.float32) * spacing
+
+
+def test_value_expression() -> None:
+    assert value_expression(1) == "1.0"
+    assert value_expression(0.1) == "0.1"
+    assert value_expression("position.y") == "position.y"
+
+
+def test_box_lattice(generators: ComputeGenerators) -> None:
+    size = (5, 3, 7)
+    output = AppendBuffer(200)
+    count = generators.box_lattice(output, size, 2.0, 0.5, (1.0, 0.0, -1.0))
+
+    expected = np.concatenate(
+        [grid(size, 0.5, (1.0, 0.0, -1.0)), np.full((105, 1), 2.0)], axis=1
+    )
+    assert count == 105
+    assert np.allclose(sorted_rows(output.read()), sorted_rows(expected))
+    output.delete()
+
+
+def test_sphere_lattice(generators: ComputeGenerators) -> None:
+    size = (9, 9, 9)
+    output = AppendBuffer(9 * 9 * 9)
+    count = generators.sphere_lattice(
+        output, size, (4.0, 4.0, 4.0), 3.3, "position.y > 5.0 ? 4.0 : 3.0"
+    )
+
+    positions = grid(size, 1.0, (0.0, 0.0, 0.0))
+    inside = positions[np.sum((positions - 4.0) ** 2, axis=1) <= 3.3**2]
+    expected = np.concatenate(
+        [inside, np.where(inside[:, 1:2] > 5.0, 4.0, 3.0)], axis=1
+    )
+    assert count == len(inside)
+    assert np.allclose(sorted_rows(output.read()), sorted_rows(expected))
+
+    count = generators.sphere_lattice(output, size, (4.0, 4.0, 4.0), 1.0, append=True)
+    assert count == len(inside) + 7
+    output.delete()
+
+
+def test_lattice_capacity(generators: ComputeGenerators) -> None:
+    output = AppendBuffer(50)
+    assert generators.box_lattice(output, (8, 8, 8)) == 50
+    assert len(output.read()) == 50 * 4
+    output.delete()
+
+
+def test_voxel_field(generators: ComputeGenerators) -> None:
+    size = (16, 16, 16)
+    output = AppendBuffer(16 * 16 * 16)
+    assert generators.voxel_field(output, size, threshold=-1.0) == 16 * 16 * 16
+    assert generators.voxel_field(output, size, threshold=1.0) == 0
+
+    count = generators.voxel_field(output, size, 0.5, 0.2, seed=3, value=1.0)
+    assert 0 < count < 16 * 16 * 16
+    data = output.read().reshape(-1, 4)
+    assert np.all(data[:, 3] == 1.0)
+    assert np.all(data[:, :3] >= 0.0) and np.all(data[:, :3] <= 15.0)
+    assert generators.voxel_field(output, size, 0.6, 0.2, seed=3) < count
+    assert generators.voxel_field(output, size, 0.5, 0.2, seed=3) == count
+    output.delete()
+
+
+def test_random_points(generators: ComputeGenerators) -> None:
+    output = AppendBuffer(5000)
+    count = generators.random_points(
+        output, 5000, (-1.0, 2.0, 0.0), (1.0, 4.0, 10.0), 0.25, seed=7
+    )
+    assert count == 5000
+    points = sorted_rows(output.read())
+    assert np.all(points[:, :3] >= [-1.0, 2.0, 0.0])
+    assert np.all(points[:, :3] < [1.0, 4.0, 10.0])
+    assert np.all(points[:, 3] == 0.25)
+    assert np.allclose(points[:, :3].mean(axis=0), [0.0, 3.0, 5.0], atol=0.2)
+    assert len(np.unique(points, axis=0)) == 5000
+
+    generators.random_points(
+        output, 5000, (-1.0, 2.0, 0.0), (1.0, 4.0, 10.0), 0.25, seed=7
+    )
+    assert np.array_equal(sorted_rows(output.read()), points)
+    generators.random_points(
+        output, 5000, (-1.0, 2.0, 0.0), (1.0, 4.0, 10.0), 0.25, seed=8
+    )
+    assert not np.array_equal(sorted_rows(output.read()), points)
+    output.delete()
+
+
+def test_generate_without_count(generators: ComputeGenerators) -> None:
+    output = AppendBuffer(1000)
+    # indirect consumers skip the blocking readback and draw from the counter
+    assert generators.box_lattice(output, (4, 4, 4), read_count=False) is None
+    assert output.count() == 64
+    assert generators.random_points(output, 100, append=True, read_count=False) is None
+    assert output.count() == 164
+    output.delete()
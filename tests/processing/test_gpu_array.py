@@ -0,0 +1,151 @@
+from typing import Generator, List
+
+import numpy as np
+import pytest
+from OpenGL.GL import glIsBuffer
+
+from joulegl.opengl_helper.buffer import BufferObject, BufferType
+from joulegl.processing import gpu_array
+from joulegl.processing.gpu_array import GPUArray, GPUArrayEvaluator
+from joulegl.utility.glcontext import GLContext
+
+
+@pytest.fixture(scope="module")
+def gl_context() -> Generator[GLContext, None, None]:
+    context = GLContext()
+    with context:
+        yield context
+
+
+@pytest.fixture(scope="module")
+def evaluator(gl_context: GLContext) -> Generator[GPUArrayEvaluator, None, None]:
+    evaluator = GPUArrayEvaluator()
+    yield evaluator
+    evaluator.delete()
+
+
+def test_fused_expression(evaluator: GPUArrayEvaluator) -> None:
+    rng = np.random.default_rng(0)
+    a_data = rng.random(1000, dtype=np.float32)
+    b_data = rng.random(1000, dtype=np.float32) + 1.0
+    a = GPUArray.from_numpy(a_data, evaluator)
+    b = GPUArray.from_numpy(b_data, evaluator)
+
+    result = gpu_array.sqrt(a * 2.0 + b) / b - 1.0 + abs(-a)
+    assert not result.evaluated
+
+    expected = np.sqrt(a_data * 2.0 + b_data) / b_data - 1.0 + a_data
+    assert np.allclose(result.numpy(), expected, atol=1e-5)
+    assert result.evaluated
+
+    result.delete()
+    a.delete()
+    b.delete()
+
+
+def test_shader_reuse(evaluator: GPUArrayEvaluator) -> None:
+    data = np.arange(64, dtype=np.float32)
+    a = GPUArray.from_numpy(data, evaluator)
+
+    first = (a * 2.0 + 1.0).evaluate()
+    variants = len(evaluator.shader_handler.shader_variants)
+    second = (a * 3.0 + 5.0).evaluate()
+
+    assert len(evaluator.shader_handler.shader_variants) == variants
+    assert np.allclose(first.numpy(), data * 2.0 + 1.0)
+    assert np.allclose(second.numpy(), data * 3.0 + 5.0)
+
+    first.delete()
+    second.delete()
+    a.delete()
+
+
+def test_comparison_and_where(evaluator: GPUArrayEvaluator) -> None:
+    data = np.linspace(-1.0, 1.0, 101, dtype=np.float32)
+    a = GPUArray.from_numpy(data, evaluator)
+
+    clamped = gpu_array.where(a > 0.0, a, 0.0)
+    assert np.allclose(clamped.numpy(), np.where(data > 0.0, data, 0.0))
+    assert np.allclose((2.0 - a).numpy(), 2.0 - data)
+    assert np.allclose(gpu_array.maximum(a, 0.5).numpy(), np.maximum(data, 0.5))
+
+    clamped.delete()
+    a.delete()
+
+
+def test_wide_expression(evaluator: GPUArrayEvaluator) -> None:
+    data = [np.full(16, i, dtype=np.float32) for i in range(12)]
+    arrays = [GPUArray.from_numpy(values, evaluator) for values in data]
+
+    result = arrays[0]
+    for array in arrays[1:]:
+        result = result + array
+    assert np.allclose(result.numpy(), np.sum(data, axis=0))
+
+    for array in arrays:
+        array.delete()
+
+
+def test_wrap_buffer(evaluator: GPUArrayEvaluator) -> None:
+    buffer = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(np.ones(32, dtype=np.float32))
+    wrapped = GPUArray(buffer, evaluator=evaluator)
+
+    assert wrapped.size == 32
+    assert np.allclose((wrapped * 4.0).numpy(), 4.0)
+    wrapped.delete()
+    assert buffer.handle is not None
+    buffer.delete()
+
+
+def test_size_mismatch(evaluator: GPUArrayEvaluator) -> None:
+    a = GPUArray.from_numpy(np.zeros(8, dtype=np.float32), evaluator)
+    b = GPUArray.from_numpy(np.zeros(9, dtype=np.float32), evaluator)
+    with pytest.raises(Exception, match="Mismatching GPUArray sizes"):
+        a + b
+    a.delete()
+    b.delete()
+
+
+def test_temporaries_released(
+    evaluator: GPUArrayEvaluator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    created: List[BufferObject] = []
+
+    class TrackedBuffer(BufferObject):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    monkeypatch.setattr(gpu_array, "BufferObject", TrackedBuffer)
+    data = [np.full(16, i, dtype=np.float32) for i in range(12)]
+    a = GPUArray.from_numpy(data[0], evaluator)
+    # numpy operands and the split off sub expressions of a too wide expression
+    partial = a + data[1]
+    result = partial
+    for values in data[2:]:
+        result = result + values
+    assert len(created) == 1
+    assert np.allclose(result.numpy(), np.sum(data, axis=0))
+    assert not partial.evaluated
+
+    temporaries = [
+        buffer
+        for buffer in created
+        if buffer is not a.buffer and buffer is not result.buffer
+    ]
+    assert len(temporaries) > 0
+    assert not any(glIsBuffer(buffer.handle) for buffer in temporaries)
+    assert np.allclose(partial.numpy(), data[0] + data[1])
+
+    result.delete()
+    partial.delete()
+    a.delete()
+
+
+def test_missing_evaluator(evaluator: GPUArrayEvaluator) -> None:
+    buffer = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(np.ones(8, dtype=np.float32))
+    with pytest.raises(Exception, match="GPUArray expression has no evaluator."):
+        (GPUArray(buffer) + 1.0).evaluate()
+    buffer.delete()
@@ -0,0 +1,109 @@
+from typing import Callable, Generator
+
+import numpy as np
+import pytest
+
+from joulegl.opengl_helper.texture import Texture
+from joulegl.processing.image import ImageProcessor, pyramid_sizes
+from joulegl.utility.glcontext import GLContext
+
+
+@pytest.fixture(scope="module")
+def gl_context() -> Generator[GLContext, None, None]:
+    context = GLContext()
+    with context:
+        yield context
+
+
+def create_texture(data: np.ndarray) -> Texture:
+    texture = Texture(data.shape[1], data.shape[0])
+    texture.setup(data.astype(np.float32).flatten(), 0)
+    return texture
+
+
+def read_texture(texture: Texture) -> np.ndarray:
+    return np.asarray(texture.read()).reshape(texture.height, texture.width, 4)
+
+
+def blur_reference(data: np.ndarray, radius: int, sigma: float) -> np.ndarray:
+    offsets = np.arange(-radius, radius + 1)
+    weights = np.exp(-0.5 * offsets**2 / sigma**2)
+    weights /= weights.sum()
+    for axis in [1, 0]:
+        length = data.shape[axis]
+        data = sum(
+            weight
+            * np.take(data, np.clip(np.arange(length) + offset, 0, length - 1), axis)
+            for offset, weight in zip(offsets, weights)
+        )
+    return data
+
+
+def pyramid_reference(
+    data: np.ndarray, combine: Callable[[np.ndarray], np.ndarray]
+) -> np.ndarray:
+    height, width = (data.shape[0] + 1) // 2, (data.shape[1] + 1) // 2
+    rows = np.clip(np.arange(height * 2), 0, data.shape[0] - 1)
+    columns = np.clip(np.arange(width * 2), 0, data.shape[1] - 1)
+    blocks = data[rows][:, columns].reshape(height, 2, width, 2, -1)
+    return combine(blocks)
+
+
+def test_pyramid_sizes() -> None:
+    assert pyramid_sizes(5, 3) == [(3, 2), (2, 1), (1, 1)]
+    assert pyramid_sizes(64, 64, 2) == [(32, 32), (16, 16)]
+    assert pyramid_sizes(1, 1) == []
+
+
+@pytest.mark.parametrize("size", [(64, 32), (37, 51)])
+def test_blur(gl_context: GLContext, size: tuple) -> None:
+    data = np.random.default_rng(0).random((size[1], size[0], 4), dtype=np.float32)
+    source = create_texture(data)
+
+    processor = ImageProcessor()
+    target = processor.blur(source, radius=3, sigma=1.5)
+
+    assert np.allclose(read_texture(target), blur_reference(data, 3, 1.5), atol=1e-5)
+
+    processor.delete()
+    source.delete()
+
+
+@pytest.mark.parametrize("size", [(64, 64), (45, 23)])
+def test_pyramid(gl_context: GLContext, size: tuple) -> None:
+    data = np.random.default_rng(1).random((size[1], size[0], 4), dtype=np.float32)
+    source = create_texture(data)
+
+    processor = ImageProcessor()
+    levels = processor.pyramid(source)
+    assert [(level.width, level.height) for level in levels] == pyramid_sizes(*size)
+
+    expected = data
+    for level in levels:
+        expected = pyramid_reference(expected, lambda blocks: blocks.mean(axis=(1, 3)))
+        assert np.allclose(read_texture(level), expected, atol=1e-5)
+
+    processor.delete()
+    source.delete()
+
+
+def test_depth_pyramid(gl_context: GLContext) -> None:
+    depth = np.random.default_rng(2).random((30, 50), dtype=np.float32)
+    data = np.zeros((30, 50, 4), dtype=np.float32)
+    data[..., 0] = depth
+    source = create_texture(data)
+
+    processor = ImageProcessor()
+    levels = processor.depth_pyramid(source, levels=3)
+    assert len(levels) == 3
+
+    minimum, maximum = depth[..., None], depth[..., None]
+    for level in levels:
+        minimum = pyramid_reference(minimum, lambda blocks: blocks.min(axis=(1, 3)))
+        maximum = pyramid_reference(maximum, lambda blocks: blocks.max(axis=(1, 3)))
+        values = read_texture(level)
+        assert np.array_equal(values[..., 0], minimum[..., 0])
+        assert np.array_equal(values[..., 1], maximum[..., 0])
+
+    processor.delete()
+    source.delete()
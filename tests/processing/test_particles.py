@@ -0,0 +1,115 @@
+from typing import Generator
+
+import numpy as np
+import pytest
+
+from joulegl.processing.particles import ParticleSystem, particle_parser
+from joulegl.utility.definitions import SHADER_PATH
+from joulegl.utility.glcontext import GLContext
+
+
+@pytest.fixture(scope="module")
+def gl_context() -> Generator[GLContext, None, None]:
+    context = GLContext()
+    with context:
+        yield context
+
+
+def particle_data(particles: ParticleSystem) -> np.ndarray:
+    return np.concatenate(
+        [
+            particles.positions.read().reshape(-1, 4),
+            particles.velocities.read().reshape(-1, 4),
+        ],
+        axis=1,
+    )
+
+
+def test_particle_parser() -> None:
+    parser = particle_parser("emit_box", "integrate_euler", ["a", "b"])
+    assert parser.static_var_map["$emitter_include$"] == '#include "emit_box.glsl"'
+    assert parser.static_var_map["$force_includes$"] == (
+        '#include "a.glsl"\n#include "b.glsl"'
+    )
+    assert parser.static_var_map["$force_sum$"] == (
+        "vec3(0.0) + a(position, velocity) + b(position, velocity)"
+    )
+
+
+def test_particle_emission(gl_context: GLContext) -> None:
+    particles = ParticleSystem(1000)
+    particles.set_uniform("emitter_position", [1.0, 2.0, 3.0], "vec3")
+    particles.set_uniform("emitter_radius", 0.5, "float")
+    particles.set_uniform("particle_life", 2.0, "float")
+    assert particles.alive_count() == 0
+
+    particles.emit(100)
+    particles.step(0.01)
+    assert particles.alive_count() == 100
+    data = particle_data(particles)
+    alive = data[data[:, 3] > 0.0]
+    assert len(alive) == 100
+    assert np.all(np.linalg.norm(alive[:, :3] - [1.0, 2.0, 3.0], axis=1) <= 0.5001)
+    assert np.allclose(np.linalg.norm(alive[:, 4:7], axis=1), 1.0, atol=1e-4)
+    assert np.allclose(alive[:, 3], 2.0)
+
+    particles.step(0.1)
+    moved = particle_data(particles)[data[:, 3] > 0.0]
+    assert np.allclose(moved[:, 5], alive[:, 5] - 0.981, atol=1e-4)
+    assert np.allclose(moved[:, 3], 1.9)
+
+    particles.emission_rate = 250.0
+    particles.step(0.1)
+    particles.step(0.1)
+    assert particles.alive_count() == 150
+    particles.delete()
+
+
+def test_particle_recycling(gl_context: GLContext) -> None:
+    particles = ParticleSystem(500, emitter="emit_box")
+    particles.set_uniform("particle_life", 0.05, "float")
+
+    particles.emit(800)
+    particles.step(0.01)
+    assert particles.alive_count() == 500
+    free_count = particles.free_list.read().view(np.int32)[0]
+    assert free_count == 0
+
+    for _ in range(3):
+        particles.step(0.1)
+        assert particles.alive_count() == 0
+        particles.emit(300)
+        particles.step(0.0)
+        assert particles.alive_count() == 300
+
+    particles.step(0.1)
+    free_list = particles.free_list.read()
+    assert free_list.view(np.int32)[0] == 500
+    assert np.array_equal(np.sort(free_list[1:]), np.arange(500))
+    assert np.all(particle_data(particles)[:, 3] <= 0.0)
+    particles.delete()
+
+
+@pytest.mark.parametrize(
+    "integrator,expected_position",
+    [("integrate_euler", 0.25), ("integrate_midpoint", 0.125)],
+)
+def test_particle_plugins(
+    gl_context: GLContext, integrator: str, expected_position: float
+) -> None:
+    particles = ParticleSystem(
+        10,
+        integrator=integrator,
+        forces=["force_constant", "force_drag"],
+        include_dirs=[SHADER_PATH],
+    )
+    particles.set_uniform("emitter_speed", 0.0, "float")
+    particles.set_uniform("drag", 0.0, "float")
+    particles.emit(10)
+    particles.step(0.0)
+    particles.step(0.5)
+
+    data = particle_data(particles)
+    assert np.allclose(data[:, 0], expected_position)
+    assert np.allclose(data[:, 4], 0.5)
+    particles.delete()
@@ -0,0 +1,133 @@
+from typing import Generator
+
+import numpy as np
+import pytest
+
+from joulegl.opengl_helper.buffer import (
+    BufferObject,
+    BufferType,
+    OverflowingBufferObject,
+)
+from joulegl.processing.primitives import ComputePrimitives
+from joulegl.utility.glcontext import GLContext
+
+
+@pytest.fixture(scope="module")
+def gl_context() -> Generator[GLContext, None, None]:
+    context = GLContext()
+    with context:
+        yield context
+
+
+def create_buffer(data: np.ndarray) -> BufferObject:
+    buffer = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(data)
+    return buffer
+
+
+@pytest.mark.parametrize("count", [1, 7, 512, 1000, 300000])
+def test_scan(gl_context: GLContext, count: int) -> None:
+    data = np.random.default_rng(0).integers(0, 16, count, dtype=np.uint32)
+    input_buffer = create_buffer(data)
+    output_buffer = create_buffer(np.zeros(count, dtype=np.uint32))
+
+    primitives = ComputePrimitives()
+    primitives.scan(input_buffer, output_buffer, count)
+
+    expected = np.concatenate([[0], np.cumsum(data)[:-1]]).astype(np.uint32)
+    assert np.array_equal(output_buffer.read()[:count], expected)
+
+    primitives.delete()
+    input_buffer.delete()
+    output_buffer.delete()
+
+
+@pytest.mark.parametrize("count", [1, 100, 5000])
+def test_compact(gl_context: GLContext, count: int) -> None:
+    data = np.random.default_rng(1).random((count, 4), dtype=np.float32)
+    input_buffer = create_buffer(data.flatten())
+    output_buffer = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+
+    primitives = ComputePrimitives()
+    compacted = primitives.compact(input_buffer, output_buffer, count, "value.w > 0.5")
+
+    expected = data[data[:, 3] > 0.5]
+    assert compacted == len(expected)
+    assert np.array_equal(output_buffer.read().reshape(-1, 4)[:compacted], expected)
+
+    primitives.delete()
+    input_buffer.delete()
+    output_buffer.delete()
+
+
+@pytest.mark.parametrize(
+    "count,key_bits", [(2, 32), (255, 32), (1000, 12), (70000, 32)]
+)
+def test_sort(gl_context: GLContext, count: int, key_bits: int) -> None:
+    rng = np.random.default_rng(2)
+    keys = rng.integers(0, 2**key_bits, count, dtype=np.uint64).astype(np.uint32)
+    values = np.arange(count, dtype=np.uint32)
+    key_buffer = create_buffer(keys)
+    value_buffer = create_buffer(values)
+
+    primitives = ComputePrimitives()
+    primitives.sort(key_buffer, value_buffer, count, key_bits)
+
+    order = np.argsort(keys, kind="stable")
+    assert np.array_equal(key_buffer.read(), keys[order])
+    assert np.array_equal(value_buffer.read(), values[order])
+
+    primitives.delete()
+    key_buffer.delete()
+    value_buffer.delete()
+
+
+@pytest.mark.parametrize("count", [1, 300, 513, 300000])
+def test_reduce(gl_context: GLContext, count: int) -> None:
+    data = np.random.default_rng(3).normal(size=(count, 4)).astype(np.float32)
+    buffer = create_buffer(data.flatten())
+
+    primitives = ComputePrimitives()
+    reduction = primitives.reduce(buffer)
+
+    assert reduction.count == count
+    assert np.allclose(reduction.sum, data.sum(axis=0, dtype=np.float64), atol=1e-1)
+    assert np.array_equal(reduction.minimum, data.min(axis=0))
+    assert np.array_equal(reduction.maximum, data.max(axis=0))
+    minimum, maximum = reduction.bounds
+    assert np.array_equal(minimum, data.min(axis=0)[:3])
+    assert np.array_equal(maximum, data.max(axis=0)[:3])
+    assert np.allclose(reduction.center, (minimum + maximum) * 0.5)
+
+    partial = primitives.reduce(buffer, count // 2)
+    if count // 2 > 0:
+        assert np.array_equal(partial.maximum, data[: count // 2].max(axis=0))
+    else:
+        assert partial.count == 0
+
+    primitives.delete()
+    buffer.delete()
+
+
+def test_reduce_overflowing(gl_context: GLContext) -> None:
+    def split_data(data: np.ndarray, index: int, max_size: int, object_size: int):
+        start = int(index * max_size / 4)
+        end = int((index + 1) * max_size / 4)
+        return data[start:end]
+
+    data = np.random.default_rng(4).random((2000, 4), dtype=np.float32)
+    buffer = OverflowingBufferObject(split_data)
+    buffer.max_ssbo_size = 700 * 16
+    buffer.load(data.flatten())
+    assert len(buffer.overflowing_handles) == 3
+
+    primitives = ComputePrimitives()
+    reduction = primitives.reduce(buffer)
+
+    assert reduction.count == 2000
+    assert np.allclose(reduction.mean, data.mean(axis=0), atol=1e-4)
+    assert np.array_equal(reduction.minimum, data.min(axis=0))
+    assert np.array_equal(reduction.maximum, data.max(axis=0))
+
+    primitives.delete()
+    buffer.delete()
@@ -6,10 +6,22 @@ import pytest
 
 from joulegl.opengl_helper.base.config import ShaderConfig
 from joulegl.opengl_helper.base.data_set import BaseShaderSet
-from joulegl.opengl_helper.buffer import BufferObject, BufferType
+from joulegl.opengl_helper.buffer import BufferObject, BufferType, SwappingBufferObject
 from joulegl.opengl_helper.compute.shader import ComputeShader, ComputeShaderSetting
+from joulegl.opengl_helper.compute.utility import generate_compute_function
+from joulegl.opengl_helper.render.utility import OglPrimitives
+from joulegl.opengl_helper.transform_feedback.shader import (
+    TransformFeedbackShaderSetting,
+)
+from joulegl.opengl_helper.transform_feedback.utility import (
+    generate_feedback_function,
+)
 from joulegl.opengl_helper.vertex_data_handler import VertexDataHandler
-from joulegl.processing.processor import ComputeProcessor
+from joulegl.processing.processor import (
+    ComputePass,
+    ComputeProcessor,
+    TransformFeedbackProcessor,
+)
 from joulegl.utility.glcontext import GLContext
 from joulegl.utility.window import BaseWindow
 from joulegl.utility.window_config import WindowConfig
@@ -103,3 +115,184 @@ def test_compute_processor(gl_context: GLContext) -> None:
 
     sp.delete()
     sdh.buffer.delete()
+
+
+class PipelineProcessor(ComputeProcessor):
+    def __init__(self, data: BufferObject, result: BufferObject, count: int) -> None:
+        super().__init__()
+        self.set_shader(
+            [
+                ComputeShaderSetting("add", ["add.comp"]),
+                ComputeShaderSetting("scale", ["scale.comp"]),
+            ]
+        )
+        self.data_handlers: List[VertexDataHandler] = [
+            VertexDataHandler([(data, 0)]),
+            VertexDataHandler([(data, 0), (result, 1)]),
+        ]
+
+        def element_count_func() -> int:
+            return count
+
+        for name in ["add", "scale"]:
+            self.execute_funcs[name] = generate_compute_function(
+                self.shaders[name], barrier=False
+            )
+            self.element_count_funcs[name] = element_count_func
+        self.create_sets(self.data_handlers[0], "add")
+        self.create_sets(self.data_handlers[1], "scale")
+
+        self.add_buffer("data", data)
+        self.add_buffer("result", result)
+        # declared out of order, the graph has to run add first
+        self.add_pass(ComputePass("scale", ["data"], ["result"]))
+        self.add_pass(ComputePass("add", [], ["data"]))
+
+    def process(self, set_name: str, config: ShaderConfig | None = None) -> None:
+        current_set: BaseShaderSet = self.sets[set_name]
+        current_set.set_uniform_data(
+            [("value", 0.25, "float"), ("factor", 4.0, "float")]
+        )
+        current_set.use()
+
+    def delete(self) -> None:
+        for data_handler in self.data_handlers:
+            data_handler.delete()
+        self.delete_pipeline()
+
+
+def test_compute_pipeline(gl_context: GLContext) -> None:
+    count = 1000
+    data = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    data.load(np.zeros(count * 4, dtype=np.float32))
+    result = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    result.load(np.zeros(count * 4, dtype=np.float32))
+    processor = PipelineProcessor(data, result, count)
+
+    assert [compute_pass.name for compute_pass in processor.pipeline_order()] == [
+        "add",
+        "scale",
+    ]
+    processor.run_pipeline(profile=True)
+    assert processor.barrier_count == 2
+    assert np.all(data.read() == 0.25)
+    assert np.all(result.read() == 1.0)
+
+    processor.run_pipeline(profile=True)
+    processor.run_pipeline(profile=True)
+    throughput = processor.throughput()
+    assert set(throughput.keys()) == {"add", "scale"}
+    assert processor.pass_stats["add"].elements == count
+    assert all(value >= 0.0 for value in throughput.values())
+
+    with pytest.raises(Exception) as e:
+        processor.add_pass(ComputePass("missing", ["unknown"]))
+    assert e.value.args[0] == "Pipeline buffer 'unknown' of pass 'missing' not defined."
+
+    processor.delete()
+    data.delete()
+    result.delete()
+
+
+def test_compute_pipeline_feedback(gl_context: GLContext) -> None:
+    data = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    data.load(np.zeros(4, dtype=np.float32))
+    result = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    result.load(np.zeros(4, dtype=np.float32))
+    processor = PipelineProcessor(data, result, 1)
+    # feeds back into data after scale read it, the chain keeps its declared order
+    processor.add_pass(ComputePass("feedback", ["result"], ["data"], set_name="add"))
+    assert [compute_pass.name for compute_pass in processor.pipeline_order()] == [
+        "add",
+        "scale",
+        "feedback",
+    ]
+
+    processor.passes = []
+    processor.add_pass(ComputePass("scale", ["data"], ["result"]))
+    processor.add_pass(ComputePass("feedback", ["result"], ["data"], set_name="add"))
+    assert [compute_pass.name for compute_pass in processor.pipeline_order()] == [
+        "scale",
+        "feedback",
+    ]
+
+    processor.delete()
+    data.delete()
+    result.delete()
+
+
+def test_compute_pipeline_checkpoint(gl_context: GLContext, tmp_path) -> None:
+    path = str(tmp_path / "pipeline.ckpt")
+    data = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    data.load(np.zeros(16, dtype=np.float32))
+    result = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    result.load(np.zeros(16, dtype=np.float32))
+    processor = PipelineProcessor(data, result, 4)
+    processor.run_pipeline()
+    processor.save_checkpoint(path, metadata={"step": 1}, wait=True)
+
+    data.write(np.zeros(16, dtype=np.float32))
+    result.write(np.zeros(16, dtype=np.float32))
+    checkpoint = processor.restore_checkpoint(path)
+    assert checkpoint.metadata == {"step": 1}
+    assert np.all(data.read() == 0.25)
+    assert np.all(result.read() == 1.0)
+    checkpoint.close()
+
+    processor.delete()
+    data.delete()
+    result.delete()
+
+
+class FeedbackProcessor(TransformFeedbackProcessor):
+    def __init__(self, data: SwappingBufferObject, count: int) -> None:
+        super().__init__()
+        self.data: SwappingBufferObject = data
+        self.set_shader(
+            [
+                TransformFeedbackShaderSetting(
+                    "scale",
+                    ["scale_feedback.vert"],
+                    ["scaled_position"],
+                )
+            ]
+        )
+        self.data_handler: VertexDataHandler = VertexDataHandler([(data, 0)])
+
+        def element_count_func() -> int:
+            return count
+
+        self.execute_funcs["scale"] = generate_feedback_function(
+            OglPrimitives.POINTS, [data], self.add_query("scale")
+        )
+        self.element_count_funcs["scale"] = element_count_func
+        self.create_sets(self.data_handler, "scale")
+
+    def process(self, set_name: str, config: ShaderConfig | None = None) -> None:
+        current_set: BaseShaderSet = self.sets[set_name]
+        current_set.set_uniform_data([("scale", 2.0, "float")])
+        current_set.use(True)
+        self.data.swap()
+
+    def delete(self) -> None:
+        self.data_handler.delete()
+        self.delete_queries()
+
+
+def test_transform_feedback_processor(gl_context: GLContext) -> None:
+    count = 500
+    values = np.random.default_rng(0).random((count, 4), dtype=np.float32)
+    data = SwappingBufferObject()
+    data.load(values.flatten())
+    processor = FeedbackProcessor(data, count)
+
+    processor.process("scale")
+    processor.process("scale")
+
+    expected = values.copy()
+    expected[:, :3] *= 4.0
+    assert np.allclose(data.read().reshape(-1, 4), expected)
+    assert processor.primitives_written("scale", wait=True) == count
+
+    processor.delete()
+    data.delete()
@@ -0,0 +1,88 @@
+from typing import Generator
+
+import numpy as np
+import pytest
+
+from joulegl.opengl_helper.buffer import BufferObject, BufferType
+from joulegl.opengl_helper.compute.shader import ComputeShaderSetting
+from joulegl.opengl_helper.compute.shader_handler import ComputeShaderHandler
+from joulegl.processing.spatial_hash import SpatialHash, grid_for_bounds
+from joulegl.utility.glcontext import GLContext
+
+
+@pytest.fixture(scope="module")
+def gl_context() -> Generator[GLContext, None, None]:
+    context = GLContext()
+    with context:
+        yield context
+
+
+def create_buffer(data: np.ndarray) -> BufferObject:
+    buffer = BufferObject(buffer_type=BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(data)
+    return buffer
+
+
+def test_grid_for_bounds() -> None:
+    origin, size = grid_for_bounds(
+        np.array([-1.0, 0.0, 2.0]), np.array([1.0, 0.1, 2.0]), 0.5
+    )
+    assert origin == (-1.0, 0.0, 2.0)
+    assert size == (4, 1, 1)
+
+
+@pytest.mark.parametrize("count", [0, 1, 3000])
+def test_spatial_hash_tables(gl_context: GLContext, count: int) -> None:
+    points = np.random.default_rng(0).random((count, 4), dtype=np.float32) * 4.0
+    positions = create_buffer(points.flatten())
+    spatial_hash = SpatialHash(0.5, (0.0, 0.0, 0.0), (8, 8, 8))
+    spatial_hash.build(positions, count)
+
+    cells = np.minimum(np.floor(points[:, :3] / 0.5).astype(np.int64), 7)
+    keys = cells[:, 0] + 8 * (cells[:, 1] + 8 * cells[:, 2])
+    counts = np.bincount(keys, minlength=512)
+    starts = spatial_hash.cell_starts.read()[:512]
+    ends = spatial_hash.cell_ends.read()[:512]
+    assert np.array_equal(starts, np.concatenate([[0], np.cumsum(counts)[:-1]]))
+    assert np.array_equal(ends - starts, counts)
+
+    indices = spatial_hash.sorted_indices.read()[:count]
+    assert np.array_equal(np.sort(indices), np.arange(count))
+    assert np.all(np.diff(keys[indices]) >= 0)
+    sorted_positions = spatial_hash.sorted_positions.read()[: count * 4]
+    assert np.array_equal(sorted_positions.reshape(-1, 4), points[indices])
+
+    spatial_hash.delete()
+    positions.delete()
+
+
+def test_spatial_hash_neighbors(gl_context: GLContext) -> None:
+    count = 2000
+    radius = 0.3
+    points = np.random.default_rng(1).random((count, 4), dtype=np.float32) * 4.0
+    # points outside of the grid end up in the border cells
+    points[:10, :3] += 0.2
+    positions = create_buffer(points.flatten())
+    neighbor_counts = create_buffer(np.zeros(count, dtype=np.uint32))
+    spatial_hash = SpatialHash(radius, (0.0, 0.0, 0.0), (13, 13, 13))
+    spatial_hash.build(positions, count)
+
+    handler = ComputeShaderHandler()
+    shader = handler.create(
+        ComputeShaderSetting("neighbor_count", ["neighbor_count.comp"])
+    )
+    positions.bind(0)
+    neighbor_counts.bind(1)
+    spatial_hash.bind()
+    shader.use()
+    shader.set_uniform_data(spatial_hash.uniforms + [("radius", radius, "float")])
+    shader.compute(count, barrier=True)
+
+    distances = np.linalg.norm(points[:, None, :3] - points[None, :, :3], axis=2)
+    expected = np.sum(distances <= radius, axis=1) - 1
+    assert np.array_equal(neighbor_counts.read(), expected)
+
+    handler.delete()
+    spatial_hash.delete()
+    positions.delete()
+    neighbor_counts.delete()
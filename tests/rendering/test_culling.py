@@ -0,0 +1,173 @@
+from typing import Generator
+
+import numpy as np
+import pytest
+
+from joulegl.opengl_helper.buffer import BufferObject, BufferType
+from joulegl.rendering.culling import (
+    FrustumCuller,
+    frustum_planes,
+    projected_sizes,
+    spheres_in_frustum,
+    tier_expression,
+)
+from joulegl.utility.camera import Camera
+from joulegl.utility.glcontext import GLContext
+
+
+@pytest.fixture(scope="module")
+def gl_context() -> Generator[GLContext, None, None]:
+    context = GLContext()
+    with context:
+        yield context
+
+
+def test_frustum_planes() -> None:
+    camera = Camera(800, 600, base=np.array([0.0, 0.0, 0.0], dtype=np.float32))
+    planes = frustum_planes(camera.projection, camera.view)
+    assert planes.shape == (6, 4)
+    # the camera sits at x = -3 and looks along x
+    centers = np.array(
+        [[0.0, 0.0, 0.0], [-3.5, 0.0, 0.0], [0.0, 10.0, 0.0], [0.0, 2.0, 0.0]],
+        dtype=np.float32,
+    )
+    assert np.array_equal(
+        spheres_in_frustum(planes, centers, 0.0), [True, False, False, False]
+    )
+    assert np.array_equal(
+        spheres_in_frustum(planes, centers, 1.0), [True, True, False, True]
+    )
+
+
+@pytest.mark.parametrize("instance_vertices", [0, 4])
+def test_frustum_culler(gl_context: GLContext, instance_vertices: int) -> None:
+    camera = Camera(800, 600, base=np.array([0.0, 0.0, 0.0], dtype=np.float32))
+    rng = np.random.default_rng(3)
+    count = 5000
+    elements = np.concatenate(
+        [
+            rng.uniform(-10.0, 10.0, (count, 3)),
+            rng.uniform(0.0, 0.5, (count, 1)),
+        ],
+        axis=1,
+    ).astype(np.float32)
+    buffer = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(elements.flatten())
+    culler = FrustumCuller("cull_radius * element.w", instance_vertices)
+
+    culler.cull(buffer, count, camera, [("cull_radius", 2.0, "float")])
+    expected = spheres_in_frustum(
+        frustum_planes(camera.projection, camera.view),
+        elements[:, :3],
+        elements[:, 3] * 2.0,
+    )
+    visible_count = culler.visible_count()
+    assert visible_count == np.count_nonzero(expected)
+    assert 0 < visible_count < count
+
+    indices = culler.visible_indices.read()[:visible_count]
+    assert np.array_equal(np.sort(indices), np.nonzero(expected)[0])
+    visible = culler.visible_elements.read().reshape(-1, 4)[:visible_count]
+    assert np.array_equal(visible, elements[indices])
+    command = culler.command.read()[0]
+    if instance_vertices > 0:
+        assert tuple(command) == (4, visible_count, 0, 0)
+    else:
+        assert tuple(command) == (visible_count, 1, 0, 0)
+
+    camera.camera_front = np.array([-1.0, 0.0, 0.0], dtype=np.float32)
+    camera.camera_pos = np.array([-12.0, 0.0, 0.0], dtype=np.float32)
+    camera.generate_view_matrix()
+    culler.cull(buffer, count, camera)
+    assert culler.visible_count() == 0
+    culler.cull(buffer, 0, camera)
+    assert culler.visible_count() == 0
+
+    culler.delete()
+    buffer.delete()
+
+
+def test_tier_expression() -> None:
+    assert tier_expression([]) == "0u"
+    assert tier_expression([8.0, 1.5]) == "(size >= 8.0 ? 0u : (size >= 1.5 ? 1u : 2u))"
+
+
+@pytest.mark.parametrize("instance_vertices", [0, 4])
+def test_frustum_culler_tiers(gl_context: GLContext, instance_vertices: int) -> None:
+    camera = Camera(800, 600, base=np.array([0.0, 0.0, 0.0], dtype=np.float32))
+    rng = np.random.default_rng(5)
+    count = 4000
+    elements = np.concatenate(
+        [
+            rng.uniform([-2.0, -20.0, -20.0], [60.0, 20.0, 20.0], (count, 3)),
+            np.full((count, 1), 0.25),
+        ],
+        axis=1,
+    ).astype(np.float32)
+    buffer = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(elements.flatten())
+    culler = FrustumCuller("element.w", instance_vertices, tier_sizes=[20.0, 8.0, 4.0])
+    assert culler.tier_count == 4
+
+    culler.cull(buffer, count, camera)
+    visible = spheres_in_frustum(
+        frustum_planes(camera.projection, camera.view), elements[:, :3], 0.25
+    )
+    sizes = projected_sizes(
+        camera.projection, camera.view, elements[:, :3], 0.25, camera.screen_height
+    )
+    tiers = np.where(
+        sizes >= 20.0, 0, np.where(sizes >= 8.0, 1, np.where(sizes >= 4.0, 2, 3))
+    )
+    indices = culler.visible_indices.read()
+    for tier in range(culler.tier_count):
+        expected = np.nonzero(visible & (tiers == tier))[0]
+        assert culler.visible_count(tier) == len(expected)
+        assert len(expected) > 0
+        assert culler.tier_offset(tier) == tier * count
+        tier_indices = indices[tier * count : tier * count + len(expected)]
+        assert np.array_equal(np.sort(tier_indices), expected)
+
+    culler.delete()
+    buffer.delete()
+
+
+def test_frustum_culler_tier_instances(gl_context: GLContext) -> None:
+    camera = Camera(800, 600, base=np.array([0.0, 0.0, 0.0], dtype=np.float32))
+    rng = np.random.default_rng(9)
+    count = 2000
+    elements = np.concatenate(
+        [
+            rng.uniform([-2.0, -20.0, -20.0], [60.0, 20.0, 20.0], (count, 3)),
+            np.full((count, 1), 0.25),
+        ],
+        axis=1,
+    ).astype(np.float32)
+    buffer = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+    buffer.load(elements.flatten())
+    culler = FrustumCuller("element.w", [1, 0], tier_sizes=[8.0])
+    reference = FrustumCuller("element.w", tier_sizes=[8.0])
+
+    culler.set_instance_vertices(14)
+    culler.cull(buffer, count, camera)
+    reference.cull(buffer, count, camera)
+    commands = culler.command.read()
+    assert tuple(commands[0]) == (14, reference.visible_count(0), 0, 0)
+    assert tuple(commands[1]) == (reference.visible_count(1), 1, count, 0)
+    assert culler.tier_offset(1) == count
+
+    with pytest.raises(Exception) as e:
+        culler.set_instance_vertices(0)
+    assert (
+        e.value.args[0]
+        == "Can't switch culler tier 0 between vertex and instance counts."
+    )
+    with pytest.raises(Exception) as e:
+        FrustumCuller(instance_vertices=[1, 0])
+    assert (
+        e.value.args[0] == "Culler with 1 tiers needs instance vertices for every tier."
+    )
+
+    culler.delete()
+    reference.delete()
+    buffer.delete()
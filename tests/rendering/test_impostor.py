@@ -0,0 +1,158 @@
+from typing import Callable, Generator
+
+import numpy as np
+import pytest
+
+from joulegl.opengl_helper.buffer import (
+    BufferObject,
+    BufferType,
+    IndirectBufferObject,
+)
+from joulegl.opengl_helper.frame_buffer import FrameBufferObject
+from joulegl.opengl_helper.render.shader import RenderShaderSetting
+from joulegl.opengl_helper.render.utility import (
+    OglPrimitives,
+    OGLRenderFunction,
+    clear_screen,
+    generate_render_function,
+)
+from joulegl.opengl_helper.vertex_data_handler import VertexDataHandler
+from joulegl.rendering.impostor import CUBE_STRIP, QUAD_STRIP, create_impostor_mesh
+from joulegl.rendering.renderer import Renderer
+from joulegl.utility.glcontext import GLContext
+
+
+@pytest.fixture(scope="module")
+def gl_context() -> Generator[GLContext, None, None]:
+    context = GLContext()
+    with context:
+        yield context
+
+
+def test_impostor_meshes() -> None:
+    assert CUBE_STRIP.shape == (14, 4)
+    corners = {tuple(vertex) for vertex in CUBE_STRIP[:, :3]}
+    assert len(corners) == 8
+    # every triangle of the strip is a half of one of the six cube faces
+    faces = set()
+    for i in range(len(CUBE_STRIP) - 2):
+        triangle = CUBE_STRIP[i : i + 3, :3]
+        shared_axes = np.nonzero(np.all(triangle == triangle[0], axis=0))[0]
+        assert len(shared_axes) == 1
+        faces.add((shared_axes[0], triangle[0, shared_axes[0]]))
+    assert len(faces) == 6
+    assert QUAD_STRIP.shape == (4, 4)
+    assert np.all(QUAD_STRIP[:, 2] == 0.0)
+
+
+class CubeRenderer(Renderer):
+    def __init__(
+        self,
+        cubes: BufferObject,
+        count: int,
+        indirect_buffer: IndirectBufferObject | None = None,
+    ) -> None:
+        super().__init__()
+        self.set_shader(
+            [
+                RenderShaderSetting(
+                    "geometry",
+                    ["point_to_cube.vert", "screen_quad.frag", "point_to_cube.geom"],
+                ),
+                RenderShaderSetting(
+                    "instanced", ["instanced_cube.vert", "screen_quad.frag"]
+                ),
+            ]
+        )
+        self.mesh: BufferObject = create_impostor_mesh()
+        self.instanced_data_handler: VertexDataHandler = VertexDataHandler(
+            [(self.mesh, 0), (cubes, 1)], [(0, 0), (1, 1)]
+        )
+
+        def generate_element_count_func(element_count: int) -> Callable:
+            def element_count_func() -> int:
+                return element_count
+
+            return element_count_func
+
+        if indirect_buffer is None:
+            self.geometry_data_handler: VertexDataHandler = VertexDataHandler(
+                [(cubes, 0)]
+            )
+            self.execute_funcs["geometry"] = generate_render_function(
+                OGLRenderFunction.ARRAYS, OglPrimitives.POINTS
+            )
+            self.execute_funcs["instanced"] = generate_render_function(
+                OGLRenderFunction.ARRAYS_INSTANCED,
+                OglPrimitives.TRIANGLE_STRIP,
+                instance_vertices=len(CUBE_STRIP),
+            )
+        else:
+            # the geometry path draws one point per instance from the same commands
+            self.geometry_data_handler = VertexDataHandler([(cubes, 0)], [(0, 1)])
+            self.execute_funcs["geometry"] = generate_render_function(
+                OGLRenderFunction.ARRAYS_INDIRECT,
+                OglPrimitives.POINTS,
+                indirect_buffer=indirect_buffer,
+            )
+            self.execute_funcs["instanced"] = generate_render_function(
+                OGLRenderFunction.ARRAYS_INDIRECT,
+                OglPrimitives.TRIANGLE_STRIP,
+                indirect_buffer=indirect_buffer,
+                command_index=1,
+            )
+        for set_name in ["geometry", "instanced"]:
+            self.element_count_funcs[set_name] = generate_element_count_func(count)
+        self.create_sets(self.geometry_data_handler, "geometry")
+        self.create_sets(self.instanced_data_handler, "instanced")
+
+    def render(self, set_name: str) -> None:
+        self.sets[set_name].set_uniform_data([("color", [1.0, 0.0, 0.0], "vec3")])
+        self.sets[set_name].use(True)
+
+    def delete(self) -> None:
+        self.geometry_data_handler.delete()
+        self.instanced_data_handler.delete()
+        self.mesh.delete()
+
+
+@pytest.mark.parametrize("indirect", [False, True])
+def test_instanced_impostors(gl_context: GLContext, indirect: bool) -> None:
+    rng = np.random.default_rng(7)
+    count = 200
+    cubes = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+    cubes.load(
+        np.concatenate(
+            [rng.uniform(-0.8, 0.8, (count, 3)), rng.uniform(0.01, 0.05, (count, 1))],
+            axis=1,
+        )
+        .astype(np.float32)
+        .flatten()
+    )
+    indirect_buffer: IndirectBufferObject | None = None
+    if indirect:
+        # the base instance skips the first cubes in both paths
+        indirect_buffer = IndirectBufferObject()
+        indirect_buffer.load_commands(
+            [(1, count - 50, 0, 50), (len(CUBE_STRIP), count - 50, 0, 50)]
+        )
+    renderer = CubeRenderer(cubes, count, indirect_buffer)
+    frame_buffer = FrameBufferObject(
+        gl_context.window.config["width"], gl_context.window.config["height"]
+    )
+
+    frame_buffer.bind()
+    images = []
+    for set_name in ["geometry", "instanced"]:
+        clear_screen([0.0, 0.0, 0.0, 1.0])
+        renderer.render(set_name)
+        images.append(frame_buffer.read().copy())
+    red_pixels = np.count_nonzero(images[0].reshape(-1, 4)[:, 0] == 255)
+    assert red_pixels > 0
+    assert np.array_equal(images[0], images[1])
+
+    renderer.delete()
+    cubes.delete()
+    if indirect_buffer is not None:
+        indirect_buffer.delete()
+    frame_buffer.delete()
@@ -0,0 +1,51 @@
+from typing import Generator
+
+import numpy as np
+import pytest
+from OpenGL.GL import *
+
+from joulegl.opengl_helper.frame_buffer import FrameBufferObject
+from joulegl.processing.particles import ParticleSystem
+from joulegl.rendering.particles import ParticleRenderer
+from joulegl.utility.glcontext import GLContext
+
+
+@pytest.fixture(scope="module")
+def gl_context() -> Generator[GLContext, None, None]:
+    context = GLContext()
+    with context:
+        yield context
+
+
+def test_particle_renderer(gl_context: GLContext) -> None:
+    particles = ParticleSystem(64, forces=[])
+    particles.set_uniform("emitter_speed", 0.0, "float")
+    renderer = ParticleRenderer(particles, point_size=4.0)
+    renderer.sets["particles"].set_uniform_data(
+        [
+            ("projection", np.identity(4, dtype=np.float32), "mat4"),
+            ("view", np.identity(4, dtype=np.float32), "mat4"),
+        ]
+    )
+    frame_buffer = FrameBufferObject(
+        gl_context.window.config["width"], gl_context.window.config["height"]
+    )
+    frame_buffer.bind()
+
+    def drawn_pixels() -> int:
+        glClearColor(0.0, 0.0, 0.0, 0.0)
+        glClear(GL_COLOR_BUFFER_BIT)
+        renderer.render()
+        glFinish()
+        return int(np.count_nonzero(frame_buffer.read().reshape(-1, 4)[:, 3]))
+
+    assert drawn_pixels() == 0
+    particles.emit(64)
+    particles.step(0.0)
+    assert drawn_pixels() > 0
+    particles.step(2.0)
+    assert drawn_pixels() == 0
+
+    renderer.delete()
+    particles.delete()
+    frame_buffer.delete()
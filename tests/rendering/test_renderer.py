@@ -2,9 +2,15 @@ from typing import Callable, Generator, List
 
 import numpy as np
 import pytest
+from OpenGL.GL import *
 
 from joulegl.opengl_helper.base.data_set import BaseShaderSet
-from joulegl.opengl_helper.buffer import BufferObject, BufferType
+from joulegl.opengl_helper.buffer import (
+    BufferObject,
+    BufferType,
+    IndirectBufferObject,
+    OverflowingBufferObject,
+)
 from joulegl.opengl_helper.frame_buffer import FrameBufferObject
 from joulegl.opengl_helper.render.shader import RenderShaderSetting
 from joulegl.opengl_helper.render.utility import (
@@ -12,7 +18,10 @@ from joulegl.opengl_helper.render.utility import (
     OGLRenderFunction,
     generate_render_function,
 )
-from joulegl.opengl_helper.vertex_data_handler import VertexDataHandler
+from joulegl.opengl_helper.vertex_data_handler import (
+    OverflowingVertexDataHandler,
+    VertexDataHandler,
+)
 from joulegl.rendering.renderer import Renderer
 from joulegl.utility.glcontext import GLContext
 
@@ -204,3 +213,134 @@ def test_renderer(gl_context: GLContext, use_implicit_set_name: bool) -> None:
     renderer.delete()
     data_handler.buffer.delete()
     frame_buffer.delete()
+
+
+def test_renderer_indirect(gl_context: GLContext) -> None:
+    data_handler: ScreenQuadDataHandler = ScreenQuadDataHandler()
+    renderer: SampleRenderer = SampleRenderer(data_handler)
+    indirect_buffer = IndirectBufferObject()
+    indirect_buffer.load_commands([(3, 1, 0, 0)])
+    renderer.execute_funcs["screen_quad"] = generate_render_function(
+        OGLRenderFunction.ARRAYS_INDIRECT,
+        OglPrimitives.TRIANGLES,
+        indirect_buffer=indirect_buffer,
+    )
+    renderer.create_sets(renderer.data_handler, "screen_quad")
+    frame_buffer = FrameBufferObject(
+        gl_context.window.config["width"], gl_context.window.config["height"]
+    )
+    pixel_count: int = (
+        gl_context.window.config["width"] * gl_context.window.config["height"]
+    )
+
+    frame_buffer.bind()
+    renderer.render(np.array([1.0, 0.0, 0.0], dtype=np.float32))
+    red_pixels = np.count_nonzero(frame_buffer.read().reshape(-1, 4)[:, 0] == 255)
+    assert 0 < red_pixels < pixel_count
+
+    indirect_buffer.set_command(0, (6, 1, 0, 0))
+    renderer.render(np.array([1.0, 0.0, 0.0], dtype=np.float32))
+    red_pixels = np.count_nonzero(frame_buffer.read().reshape(-1, 4)[:, 0] == 255)
+    assert red_pixels == pixel_count
+
+    with pytest.raises(Exception) as e:
+        generate_render_function(
+            OGLRenderFunction.ELEMENTS_INDIRECT, OglPrimitives.TRIANGLES
+        )
+    assert e.value.args[0] == "Indirect render function requires an indirect buffer."
+
+    renderer.delete()
+    indirect_buffer.delete()
+    data_handler.buffer.delete()
+    frame_buffer.delete()
+
+
+class MultiDrawRenderer(Renderer):
+    def __init__(
+        self,
+        data_handler: OverflowingVertexDataHandler,
+        indirect_buffer: IndirectBufferObject,
+        chunk_batch: int,
+    ) -> None:
+        super().__init__()
+        self.data_handler: OverflowingVertexDataHandler = data_handler
+        self.set_shader(
+            [RenderShaderSetting("multi_draw", ["multi_draw.vert", "screen_quad.frag"])]
+        )
+        overflowing_buffer = data_handler.targeted_overflowing_buffer_objects[0][0]
+        self.draw_calls: int = 0
+        render_func = generate_render_function(
+            OGLRenderFunction.MULTI_ARRAYS_INDIRECT,
+            OglPrimitives.POINTS,
+            indirect_buffer=indirect_buffer,
+        )
+
+        def counted_render_func(
+            element_counts: List[int], firsts: List[int], chunk_start: int
+        ) -> None:
+            self.draw_calls += 1
+            render_func(element_counts, firsts, chunk_start)
+
+        self.execute_funcs["multi_draw"] = counted_render_func
+        self.element_count_funcs["multi_draw"] = overflowing_buffer.get_objects
+        self.create_sets(self.data_handler, "multi_draw", chunk_batch=chunk_batch)
+
+    def render(self) -> None:
+        self.sets["multi_draw"].use()
+
+    def delete(self) -> None:
+        self.data_handler.delete()
+
+
+@pytest.mark.parametrize("chunk_batch,draw_calls", [(4, 1), (3, 2), (2, 2)])
+def test_renderer_multi_draw(
+    gl_context: GLContext, chunk_batch: int, draw_calls: int
+) -> None:
+    def split_data(data: np.ndarray, index: int, max_size: int, object_size: int):
+        objects = max_size // (object_size * 4)
+        return data[index * objects : (index + 1) * objects]
+
+    data = np.arange(1000, dtype=np.float32)
+    overflowing_buffer = OverflowingBufferObject(split_data, object_size=1)
+    overflowing_buffer.max_ssbo_size = 300 * 4
+    overflowing_buffer.load(data)
+    assert len(overflowing_buffer.overflowing_handles) == 4
+    output = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+    output.load(np.zeros(1000, dtype=np.float32))
+    indirect_buffer = IndirectBufferObject()
+    renderer = MultiDrawRenderer(
+        OverflowingVertexDataHandler([(output, 8)], [(overflowing_buffer, 0)]),
+        indirect_buffer,
+        chunk_batch,
+    )
+
+    renderer.render()
+    assert renderer.draw_calls == draw_calls
+    chunk_ids = np.arange(1000) // 300
+    assert np.array_equal(output.read(), data + 1000.0 * (chunk_ids % chunk_batch))
+
+    # every chunk keeps its own command slot across the batches
+    commands = indirect_buffer.read().view(indirect_buffer.command_dtype)
+    assert np.array_equal(commands["count"], [300, 300, 300, 100])
+    assert np.array_equal(commands["base_instance"], [0, 300, 600, 900])
+
+    output.load(np.zeros(1000, dtype=np.float32))
+    renderer.render()
+    assert renderer.draw_calls == 2 * draw_calls
+    assert np.array_equal(output.read(), data + 1000.0 * (chunk_ids % chunk_batch))
+
+    with pytest.raises(Exception) as e:
+        renderer.create_sets(VertexDataHandler([(output, 8)]), "multi_draw", 2)
+    assert e.value.args[0] == "Chunk batches require an overflowing data handler."
+    max_bindings = glGetIntegerv(GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS)
+    with pytest.raises(Exception) as e:
+        renderer.create_sets(renderer.data_handler, "multi_draw", max_bindings + 1)
+    assert e.value.args[0] == (
+        "Chunk batch %d from binding 0 exceeds the %d storage bindings."
+        % (max_bindings + 1, max_bindings)
+    )
+
+    renderer.delete()
+    overflowing_buffer.delete()
+    output.delete()
+    indirect_buffer.delete()
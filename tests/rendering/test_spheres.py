@@ -0,0 +1,79 @@
+from typing import Generator
+
+import numpy as np
+import pytest
+from OpenGL.GL import *
+
+from joulegl.opengl_helper.buffer import BufferObject, BufferType
+from joulegl.opengl_helper.frame_buffer import FrameBufferObject
+from joulegl.opengl_helper.render.utility import clear_screen
+from joulegl.rendering.spheres import SphereRenderer
+from joulegl.utility.camera import Camera
+from joulegl.utility.glcontext import GLContext
+
+
+@pytest.fixture(scope="module")
+def gl_context() -> Generator[GLContext, None, None]:
+    context = GLContext()
+    with context:
+        yield context
+
+
+def read_depth(width: int, height: int) -> np.ndarray:
+    return np.frombuffer(
+        glReadPixels(0, 0, width, height, GL_DEPTH_COMPONENT, GL_FLOAT), np.float32
+    ).reshape(height, width)
+
+
+def test_sphere_renderer(gl_context: GLContext) -> None:
+    width: int = gl_context.window.config["width"]
+    height: int = gl_context.window.config["height"]
+    camera = Camera(width, height, base=np.array([0.0, 0.0, 0.0], dtype=np.float32))
+    camera.camera_pos = np.array([0.0, 0.0, -9.0], dtype=np.float32)
+    camera.camera_front = np.array([0.0, 0.0, 1.0], dtype=np.float32)
+    camera.generate_view_matrix()
+    # one sphere in the center, one off center and one behind the camera
+    spheres = np.array(
+        [[0.0, 0.0, 0.0, 1.0], [2.0, 1.5, 1.0, 0.5], [0.0, 0.0, -12.0, 1.0]],
+        dtype=np.float32,
+    )
+    positions = BufferObject(BufferType.SHADER_STORAGE_BUFFER)
+    positions.load(spheres.flatten())
+    renderer = SphereRenderer(positions, len(spheres))
+    frame_buffer = FrameBufferObject(width, height)
+    frame_buffer.bind()
+    glViewport(0, 0, width, height)
+
+    depths = []
+    for set_name in ["sphere_sprite", "sphere_quad"]:
+        clear_screen([0.0, 0.0, 0.0, 1.0])
+        renderer.render(set_name, camera)
+        glFinish()
+        depths.append(read_depth(width, height))
+    covered = depths[1] < 1.0
+    assert np.array_equal(depths[0] < 1.0, covered)
+    assert np.allclose(depths[0], depths[1], atol=1e-5)
+
+    # the closest point of the center sphere is at distance 8
+    front = np.array([0.0, 0.0, -8.0, 1.0]) @ camera.projection
+    assert depths[1][height // 2, width // 2] == pytest.approx(
+        0.5 * front[2] / front[3] + 0.5, abs=1e-4
+    )
+    assert np.count_nonzero(covered) > 0
+
+    renderer.count = 1
+    clear_screen([0.0, 0.0, 0.0, 1.0])
+    renderer.render("sphere_quad", camera)
+    radius_pixels = camera.projection[1, 1] * height * 0.5 / np.sqrt(80.0)
+    assert np.count_nonzero(read_depth(width, height) < 1.0) == pytest.approx(
+        np.pi * radius_pixels**2, rel=0.05
+    )
+
+    renderer.count = 0
+    clear_screen([0.0, 0.0, 0.0, 1.0])
+    renderer.render("sphere_quad", camera)
+    assert np.all(read_depth(width, height) == 1.0)
+
+    renderer.delete()
+    positions.delete()
+    frame_buffer.delete()
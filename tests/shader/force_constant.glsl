@@ -0,0 +1,6 @@
+uniform vec3 constant_force = vec3(1.0, 0.0, 0.0);
+
+vec3 force_constant(vec3 position, vec3 velocity)
+{
+    return constant_force;
+}
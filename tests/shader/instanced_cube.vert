@@ -0,0 +1,10 @@
+#version 440
+
+layout(location = 0) in vec4 corner;
+layout(location = 1) in vec4 position;
+
+
+void main()
+{
+    gl_Position = vec4(position.xyz + position.w * corner.xyz, 1.0);
+}
@@ -0,0 +1,18 @@
+#version 430
+#include "multi_draw.glsl"
+
+layout(std430, binding = 0) buffer chunk_data
+{
+    float values[];
+} chunks[4];
+
+layout(std430, binding = 8) buffer output_data
+{
+    float outputs[];
+};
+
+void main()
+{
+    outputs[GLOBAL_VERTEX_ID] = chunks[CHUNK_ID].values[gl_VertexID] + 1000.0 * float(CHUNK_ID);
+    gl_Position = vec4(2.0, 2.0, 2.0, 1.0);
+}
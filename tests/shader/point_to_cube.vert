@@ -0,0 +1,12 @@
+#version 440
+
+layout(location = 0) in vec4 position;
+
+out float vs_size;
+
+
+void main()
+{
+    vs_size = position.w;
+    gl_Position = vec4(position.xyz, 1.0);
+}
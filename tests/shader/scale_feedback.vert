@@ -0,0 +1,13 @@
+#version 330
+
+layout(location = 0) in vec4 position;
+
+out vec4 scaled_position;
+out float position_length;
+
+uniform float scale = 2.0;
+
+void main() {
+    scaled_position = vec4(position.xyz * scale, position.w);
+    position_length = length(position.xyz);
+}
@@ -3,9 +3,10 @@ import threading
 import time
 
 import numpy as np
+import pytest
 
 from joulegl.utility.app import App
-from joulegl.utility.camera import CameraPose
+from joulegl.utility.camera import CameraPose, framing_distance
 from joulegl.utility.definitions import SCREENSHOT_PATH
 from tests.conftest import delete_all_files_in_folder
 
@@ -75,6 +76,19 @@ def test_app_cam_changes():
     wrapped_app.close()
 
 
+def test_app_frame_bounds():
+    wrapped_app = WrappedApp("Test")
+    app = wrapped_app.app
+
+    app.frame_bounds(np.array([0.0, 0.0, 0.0]), np.array([2.0, 4.0, 6.0]))
+    assert np.array_equal(app.window.cam.base, [1.0, 2.0, 3.0])
+    assert app.window.cam.offset_scale == pytest.approx(
+        framing_distance(np.array([0.0, 0.0, 0.0]), np.array([2.0, 4.0, 6.0]))
+    )
+
+    wrapped_app.close()
+
+
 def test_app_screenshot():
     wrapped_app = WrappedApp("Test")
     app = wrapped_app.app
@@ -1,9 +1,9 @@
-from math import isclose
+from math import isclose, radians, sin
 
 import numpy as np
 import pytest
 
-from joulegl.utility.camera import Camera
+from joulegl.utility.camera import Camera, framing_distance
 
 
 def test_camera_basic() -> None:
@@ -139,3 +139,9 @@ def test_camera_movement(x: float, y: float, z: float) -> None:
         camera.camera_pos[2],
         abs_tol=0.0001,
     )
+
+
+def test_framing_distance() -> None:
+    distance = framing_distance(np.array([0.0, 0.0, 0.0]), np.array([2.0, 0.0, 0.0]))
+    assert isclose(distance, 1.0 / sin(radians(22.5)))
+    assert framing_distance(np.array([1.0, 1.0, 1.0]), np.array([1.0, 1.0, 1.0])) == 0